@@ -0,0 +1,62 @@
+"""Micro-benchmark of the attribute and variable access of components.
+
+The timings are compared to a plain Python object:
+
+.. code-block:: bash
+
+    $ python benchmarks/component.py
+"""
+import timeit
+
+import numpy as np
+
+from konrad.component import Component
+
+
+class Plain:
+    pass
+
+
+def _time(stmt, number, **namespace):
+    """Return the best time per call in microseconds."""
+    timer = timeit.Timer(stmt, globals=namespace)
+    return min(timer.repeat(repeat=5, number=number)) / number * 1e6
+
+
+def main(number=200_000):
+    plain = Plain()
+    plain.depth = 1.
+    plain.data = np.zeros(50)
+
+    component = Component()
+    component.depth = 1.
+    component['T'] = (('plev',), np.zeros(50))
+
+    bound = Component()
+    bound.bind_variable('T', np.zeros((2, 50))[0], dims=('plev',))
+
+    array = np.ones(50)
+    benchmarks = {
+        'attribute read (plain object)': _time(
+            'c.depth', number, c=plain),
+        'attribute read (Component)': _time(
+            'c.depth', number, c=component),
+        'attribute write (plain object)': _time(
+            'c.depth = 2.', number, c=plain),
+        'attribute write (Component)': _time(
+            'c.depth = 2.', number, c=component),
+        'item assignment (plain object)': _time(
+            'c.data = a', number, c=plain, a=array),
+        'item assignment (Component)': _time(
+            'c["T"] = a', number, c=component, a=array),
+        'item assignment (bound Component)': _time(
+            'c["T"] = a', number, c=bound, a=array),
+    }
+
+    width = max(map(len, benchmarks))
+    for name, microseconds in benchmarks.items():
+        print(f'{name:{width}}  {microseconds:.3f} us')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+"""Benchmark the time needed to import konrad.
+
+The import is profiled in a fresh interpreter using ``python -X importtime``.
+The script reports the time of the bare package import and of the first
+access to :class:`konrad.RCE`, which imports the model components:
+
+.. code-block:: bash
+
+    $ python benchmarks/import_time.py
+"""
+import subprocess
+import sys
+
+
+def import_times(code):
+    """Return the cumulative import times of all top-level imports.
+
+    Parameters:
+        code (str): Python code that is run in a fresh interpreter.
+
+    Returns:
+        dict: Module names and their cumulative import time [us].
+    """
+    stderr = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        check=True,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+    ).stderr
+
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        # Nested imports are indented.
+        if not name[1:].startswith(' '):
+            times[name.strip()] = int(cumulative)
+
+    return times
+
+
+def main(top=5):
+    startup = import_times('pass')
+
+    for code in ('import konrad', 'import konrad; konrad.RCE'):
+        times = {
+            name: t for name, t in import_times(code).items()
+            if name not in startup
+        }
+
+        print(f'{code}: {sum(times.values()) / 1e3:.1f} ms')
+        for name, t in sorted(times.items(), key=lambda i: -i[1])[:top]:
+            print(f'    {t / 1e3:8.1f} ms  {name}')
+
+
+if __name__ == '__main__':
+    main()
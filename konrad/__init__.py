@@ -9,27 +9,63 @@ of the model setup separately to investigate certain effects. The different
 submodels need to fulfill requirements to make interaction possible. These
 requirements are enforced by the use of abstract base classes.
 """
+import importlib
 import logging
 from os.path import (join, dirname)
 
 __version__ = open(join(dirname(__file__), 'VERSION')).read().strip()
 
-from . import atmosphere
-from . import cloud
-from . import component
-from . import constants
-from . import convection
-from . import humidity
-from . import lapserate
-from . import netcdf
-from . import ozone
-from . import physics
-from . import plots
-from . import radiation
-from . import surface
-from . import upwelling
-from . import utils
-from .core import RCE
+# Submodules are imported on first access (PEP 562). This keeps
+# `import konrad` fast, which matters for worker processes and command-line
+# tools that only need parts of the package.
+_submodules = [
+    'atmosphere',
+    'cli',
+    'cloud',
+    'component',
+    'config',
+    'constants',
+    'convection',
+    'convergence',
+    'core',
+    'experiments',
+    'humidity',
+    'lapserate',
+    'netcdf',
+    'ozone',
+    'physics',
+    'plots',
+    'radiation',
+    'recorder',
+    'state',
+    'surface',
+    'sweep',
+    'upwelling',
+    'utils',
+]
+
+# Attributes that are re-exported from submodules.
+_attributes = {
+    'RCE': 'core',
+    'open_output': 'netcdf',
+}
+
+
+def __getattr__(name):
+    if name in _submodules:
+        return importlib.import_module(f'.{name}', __name__)
+
+    if name in _attributes:
+        module = importlib.import_module(f'.{_attributes[name]}', __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+def __dir__():
+    return sorted([*globals(), *_submodules, *_attributes])
 
 
 def enable_logging():
@@ -1,14 +1,13 @@
 import logging
 
 import typhon
-import netCDF4
 import numpy as np
 from scipy.interpolate import interp1d
-from copy import copy
 
 from konrad import constants
 from konrad import utils
 from konrad.component import Component
+from konrad.netcdf import read_timestep
 
 __all__ = [
     'Atmosphere',
@@ -27,6 +26,10 @@ class Atmosphere(Component):
             lower atmosphere [Pa]. Methods like ``get_cold_point_index`` or
             ``get_triple_point_index`` are looking for levels with higher
             pressure (closer to the surface) only.
+
+    All ``atmosphere_variables`` are stored in one contiguous array of shape
+    ``(len(atmosphere_variables), 1, plev.size)``. Each variable is a view
+    on one row of this buffer.
     """
     atmosphere_variables = [
         'T',
@@ -66,8 +69,9 @@ class Atmosphere(Component):
             'phlev': phlev,  # pressure at half-levels
         }
 
-        for varname in self.atmosphere_variables:
-            self.create_variable(varname, np.zeros_like(plev))
+        self.bind_buffer(
+            np.zeros((len(self.atmosphere_variables), 1, plev.size))
+        )
 
         # TODO: Combine with ``tracegases_rcemip``?
         self.create_variable(
@@ -78,6 +82,26 @@ class Atmosphere(Component):
 
         self.tracegases_rcemip()
 
+    def __setstate__(self, state):
+        super().__setstate__(state)
+        # Pickling stores the buffer and all views as independent arrays.
+        # Re-establish the shared memory after unpickling.
+        self.bind_buffer(self._buffer)
+
+    def bind_buffer(self, buffer):
+        """Store all atmospheric variables in a contiguous array.
+
+        Current values are copied into the buffer.
+
+        Parameters:
+            buffer (``np.ndarray``): Array of shape
+                ``(len(atmosphere_variables), 1, plev.size)``.
+        """
+        for index, varname in enumerate(self.atmosphere_variables):
+            self.bind_variable(varname, buffer[index], dims=('time', 'plev'))
+
+        self._buffer = buffer
+
     @classmethod
     def from_atm_fields_compact(cls, atm_fields_compact):
         """Convert an ARTS atm_fields_compact [0] into an atmosphere.
@@ -153,25 +177,12 @@ class Atmosphere(Component):
         """Create an atmosphere model from a netCDF file.
 
         Parameters:
-            ncfile (str): Path to netCDF file.
+            ncfile (str): Path to netCDF file or Zarr store.
             timestep (int): Timestep to read (default is last timestep).
         """
-
-        def _return_profile(ds, var, ts):
-            return (ds[var][ts, :] if 'time' in ds[var].dimensions
-                    else ds[var][:])
-
-        with netCDF4.Dataset(ncfile) as root:
-            if 'atmosphere' in root.groups:
-                dataset = root['atmosphere']
-            else:
-                dataset = root
-
-            datadict = {var: np.array(_return_profile(dataset, var, timestep))
-                        for var in cls.atmosphere_variables
-                        if var in dataset.variables
-                        }
-            datadict['phlev'] = np.array(root['phlev'][:])
+        datadict = read_timestep(ncfile, 'atmosphere',
+                                 cls.atmosphere_variables, timestep)
+        datadict['phlev'] = read_timestep(ncfile, variables=['phlev'])['phlev']
 
         return cls.from_dict(datadict)
 
@@ -256,7 +267,8 @@ class Atmosphere(Component):
         # Keep attributes of original atmosphere object.
         # This is **extremely** important because references to e.g. the
         # convection scheme or the humidity handling are stored as attributes!
-        new_atmosphere.attrs.update({**self.attrs})
+        for name, value in self.attrs.items():
+            setattr(new_atmosphere, name, value)
 
         # Calculate the geopotential height.
         new_atmosphere.update_height()
@@ -266,21 +278,54 @@ class Atmosphere(Component):
     def copy(self):
         """Create a copy of the atmosphere.
 
+        The copy is created from a snapshot of the raw data buffer and does
+        not re-run the initialisation of the atmosphere.
+
         Returns:
             konrad.atmosphere: copy of the atmosphere
         """
-        datadict = dict()
-        datadict['phlev'] = copy(self['phlev'])  # Copy pressure grid.
-
-        # Create copies (and not references) of all atmospheric variables.
-        for variable in self.atmosphere_variables:
-            datadict[variable] = copy(self[variable]).ravel()
+        new_atmosphere = type(self).__new__(type(self))
+        new_atmosphere.coords = {
+            name: np.copy(coord) for name, coord in self.coords.items()
+        }
+        new_atmosphere.bind_buffer(self.snapshot())
+        new_atmosphere['z'] = (self.data_vars['z'][0], self['z'].copy())
 
-        # Create a new atmosphere object from the filled data directory.
-        new_atmosphere = type(self).from_dict(datadict)
+        # Keep attributes of original atmosphere object.
+        for name, value in self.attrs.items():
+            setattr(new_atmosphere, name, value)
 
         return new_atmosphere
 
+    def snapshot(self):
+        """Return a copy of all atmospheric variables.
+
+        The snapshot is a plain copy of the contiguous data buffer and can
+        be used to reset the atmosphere using :meth:`restore`.
+
+        Returns:
+            ndarray: Array of shape ``(len(atmosphere_variables), 1, plev)``.
+
+        Example:
+            >>> snapshot = atmosphere.snapshot()
+            >>> atmosphere['T'] += 1
+            >>> atmosphere.restore(snapshot)
+        """
+        return self._buffer.copy()
+
+    def restore(self, snapshot):
+        """Restore all atmospheric variables from a snapshot.
+
+        Parameters:
+            snapshot (ndarray): Return value of :meth:`snapshot`.
+        """
+        self._buffer[...] = snapshot
+
+        for varname in self.atmosphere_variables:
+            self.touch(varname)
+
+        self.update_height()
+
     def calculate_height(self):
         """Calculate the geopotential height."""
         g = constants.earth_standard_gravity
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+"""Command-line interface to run RCE simulations from configuration files.
+
+The ``konrad`` command runs all experiments in the given configuration files
+(see :mod:`konrad.config`):
+
+.. code-block:: bash
+
+    $ konrad experiments.yaml --parallel 8
+
+"""
+import argparse
+import logging
+import sys
+from concurrent.futures import (ProcessPoolExecutor, as_completed)
+
+from konrad import (__version__, config, enable_logging)
+
+
+__all__ = [
+    'main',
+]
+
+logger = logging.getLogger(__name__)
+
+
+def _parse_args(args=None):
+    parser = argparse.ArgumentParser(
+        prog='konrad',
+        description='Run radiative-convective equilibrium simulations.',
+    )
+    parser.add_argument(
+        'configs', nargs='+', metavar='CONFIG',
+        help='YAML or JSON file containing one or more experiments.',
+    )
+    parser.add_argument(
+        '-p', '--parallel', type=int, default=1, metavar='N',
+        help='Number of experiments that are run in parallel.',
+    )
+    parser.add_argument(
+        '-v', '--verbose', action='store_true',
+        help='Enable logging.',
+    )
+    parser.add_argument(
+        '--version', action='version', version=f'konrad {__version__}',
+    )
+
+    return parser.parse_args(args)
+
+
+def main(args=None):
+    """Run all experiments given on the command line.
+
+    Parameters:
+        args (list[str]): Command-line arguments.
+            Defaults to ``sys.argv[1:]``.
+
+    Returns:
+        int: Exit status (``1`` if any experiment failed).
+    """
+    args = _parse_args(args)
+
+    if args.verbose:
+        enable_logging()
+
+    experiments = [
+        experiment
+        for filename in args.configs
+        for experiment in config.load(filename)
+    ]
+
+    failed = 0
+    if args.parallel < 2:
+        for experiment in experiments:
+            try:
+                config.run(experiment)
+            except Exception:
+                logger.exception('Experiment failed.')
+                failed += 1
+    else:
+        with ProcessPoolExecutor(args.parallel) as executor:
+            futures = [executor.submit(config.run, e) for e in experiments]
+            for future in as_completed(futures):
+                if future.exception() is not None:
+                    logger.error(f'Experiment failed: {future.exception()!r}')
+                    failed += 1
+
+    if failed:
+        logger.error(f'{failed} of {len(experiments)} experiments failed.')
+
+    return int(failed > 0)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -38,6 +38,8 @@ from scipy.interpolate import interp1d
 from sympl import DataArray
 
 from konrad.component import Component
+from konrad.netcdf import read_timestep
+from konrad.utils import get_init_parameters
 
 logger = logging.getLogger(__name__)
 
@@ -54,6 +56,20 @@ __all__ = [
     'CloudEnsemble',
 ]
 
+# Keyword arguments of the cloud classes and the corresponding variables.
+_kwarg_variables = {
+    'cloud_fraction': 'cloud_area_fraction_in_atmosphere_layer',
+    'mass_ice': 'mass_content_of_cloud_ice_in_atmosphere_layer',
+    'mass_water': 'mass_content_of_cloud_liquid_water_in_atmosphere_layer',
+    'ice_particle_size': 'cloud_ice_particle_size',
+    'droplet_radius': 'cloud_water_droplet_radius',
+    'lw_optical_thickness': 'longwave_optical_thickness_due_to_cloud',
+    'sw_optical_thickness': 'shortwave_optical_thickness_due_to_cloud',
+    'forward_scattering_fraction': 'cloud_forward_scattering_fraction',
+    'asymmetry_parameter': 'cloud_asymmetry_parameter',
+    'single_scattering_albedo': 'single_scattering_albedo_due_to_cloud',
+}
+
 
 def get_rectangular_profile(z, value, ztop, depth):
     """Produce a rectangular profile, an array containing zeros and the value
@@ -272,6 +288,30 @@ class Cloud(Component, metaclass=abc.ABCMeta):
         """
         return cls(numlevels=atmosphere['plev'].size, **kwargs)
 
+    @classmethod
+    def from_netcdf(cls, ncfile, timestep=-1, **kwargs):
+        """Create a cloud component from a netCDF file.
+
+        All cloud parameters that are accepted by the class are read.
+
+        Parameters:
+            ncfile (str): Path to netCDF file or Zarr store.
+            timestep (int): Timestep to read (default is last timestep).
+            **kwargs: Additional keyword arguments (e.g. ``numlevels``).
+        """
+        parameters, _ = get_init_parameters(cls)
+        names = {
+            kwarg: variable for kwarg, variable in _kwarg_variables.items()
+            if kwarg in parameters and kwarg not in kwargs
+        }
+        data = read_timestep(ncfile, 'cloud', list(names.values()), timestep)
+
+        for kwarg, variable in names.items():
+            if variable in data:
+                kwargs[kwarg] = data[variable]
+
+        return cls(**kwargs)
+
     @abc.abstractmethod
     def update_cloud_profile(self, atmosphere, convection, radiation,
                              **kwargs):
@@ -481,6 +521,7 @@ class DirectInputCloud(Cloud):
                 interpolation_f=self._interp_cache[varname],
                 norm_new=norm_new,
             )
+            self.touch(varname)
 
     def update_cloud_profile(self, atmosphere, convection, radiation,
                              **kwargs):
@@ -523,8 +564,8 @@ class MidLevelCloud(DirectInputCloud):
 
     Mid-level clouds are coupled to the freezing level.
     """
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, coupling='freezing_level', **kwargs)
+    def __init__(self, *args, coupling='freezing_level', **kwargs):
+        super().__init__(*args, coupling=coupling, **kwargs)
 
 
 class LowCloud(DirectInputCloud):
@@ -532,8 +573,8 @@ class LowCloud(DirectInputCloud):
 
     Low-level clouds are fixed in pressure coordinates.
     """
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, coupling='pressure', **kwargs)
+    def __init__(self, *args, coupling='pressure', **kwargs):
+        super().__init__(*args, coupling=coupling, **kwargs)
 
 
 class CloudEnsemble(DirectInputCloud):
@@ -578,7 +619,7 @@ class CloudEnsemble(DirectInputCloud):
     @property
     def attrs(self):
         """Dictionary containing all attributes."""
-        return self._superposition._attrs
+        return self._superposition.attrs
 
     @property
     def data_vars(self):
@@ -1,5 +1,6 @@
 import operator
 from collections.abc import Hashable
+from contextlib import contextmanager
 
 import numpy as np
 import xarray as xr
@@ -30,11 +31,43 @@ class Component:
     >>> component.data_vars
     {'variable': (('dimension',), [42])}
 
+    Every data variable carries a version counter that is increased whenever
+    the variable is changed. Other components can use these counters to skip
+    computations if their input has not changed since they last ran:
+
+    >>> component.get_version('variable')
+    1
+    >>> with component.modify('variable') as variable:
+    ...     variable[0] = 23
+    >>> component.get_version('variable')
+    2
+
+    Data variables can be bound to externally allocated arrays (see
+    :meth:`bind_variable`). This allows to store several variables, possibly
+    of different components, in one contiguous block of memory.
     """
+    # The book-keeping is stored in slots. Attribute values are stored in
+    # the instance `__dict__` so that reading them takes the fast path of
+    # the normal attribute lookup. `_attrs` only keeps the (ordered) names
+    # of the public attributes.
+    __slots__ = (
+        '_attrs',
+        '_data_vars',
+        '_versions',
+        '_observers',
+        '_views',
+        'coords',
+        '__dict__',
+        '__weakref__',
+    )
+
     def __new__(cls, *args, **kwargs):
         instance = super().__new__(cls)
         instance._attrs = {}
         instance._data_vars = {}
+        instance._versions = {}
+        instance._observers = []
+        instance._views = {}
         instance.coords = {}
 
         return instance
@@ -42,33 +75,60 @@ class Component:
     def __setattr__(self, name, value):
         object.__setattr__(self, name, value)
 
-        if not name.startswith('_') and name != 'coords':
-            self._attrs[name] = value
+        if name[0] != '_' and name != 'coords':
+            self._attrs[name] = None
 
-    def __getattr__(self, name):
-        if name.startswith('__'):
-            raise AttributeError
+    def __delattr__(self, name):
+        object.__delattr__(self, name)
+        self._attrs.pop(name, None)
 
-        try:
-            return self._attrs[name]
-        except KeyError as exc:
-            raise AttributeError(exc)
+    def __getstate__(self):
+        state = {name: getattr(self, name)
+                 for name in Component.__slots__[:-2]}
+        state.update(self.__dict__)
+        # Observers are often closures or bound methods of other objects
+        # and are therefore not copied.
+        state['_observers'] = []
+
+        return state
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
 
     @property
     def attrs(self):
-        """Dictionary containing all attributes."""
-        return self._attrs
+        """Dictionary containing all attributes.
+
+        The dictionary is created on access. Use :func:`setattr` to change
+        attributes.
+        """
+        return {name: getattr(self, name) for name in self._attrs}
 
     def __setitem__(self, key, value):
         if type(value) is tuple:
             dims, data = value
-            self._data_vars[key] = value
         else:
+            dims = self._data_vars[key][0]
             data = value
 
-        dims = self._data_vars[key][0]
+        # Write into bound arrays instead of replacing them.
+        if self._views:
+            view = self._views.get(key)
+            if view is not None and data is not view:
+                try:
+                    view[...] = data
+                except ValueError:
+                    raise ValueError(
+                        f'Cannot assign array of shape {np.shape(data)} to '
+                        f'variable "{key}" bound to an array of shape '
+                        f'{view.shape}.') from None
+                data = view
+
         self._data_vars[key] = (dims, data)
 
+        self.touch(key)
+
     def __getitem__(self, key):
         if key in self._data_vars:
             return self._data_vars[key][1]
@@ -80,6 +140,107 @@ class Component:
         """Dictionary containing all data variables and their dimensions."""
         return self._data_vars
 
+    def touch(self, variable):
+        """Mark a variable as changed.
+
+        This increases the version counter of the variable and notifies all
+        registered observers. It is called automatically when a variable is
+        assigned, but has to be called explicitly after in-place
+        modifications (see also :meth:`modify`).
+
+        Parameters:
+            variable (str): Variable key.
+        """
+        self._versions[variable] = self._versions.get(variable, 0) + 1
+
+        if not self._observers:
+            return
+
+        for callback in self._observers:
+            callback(self, variable)
+
+    def get_version(self, variable):
+        """Return the version counter of a variable.
+
+        The counter is increased every time the variable is changed. It can
+        be stored and compared later to check if a variable has changed.
+
+        Parameters:
+            variable (str): Variable key.
+
+        Returns:
+            int: Version counter (0 if the variable has never been set).
+        """
+        return self._versions.get(variable, 0)
+
+    @contextmanager
+    def modify(self, variable):
+        """Context manager for in-place modifications of a variable.
+
+        The variable is marked as changed when the context is left.
+
+        Parameters:
+            variable (str): Variable key.
+
+        Example:
+            >>> with atmosphere.modify('T') as T:
+            ...     T[0, :] += 1
+        """
+        try:
+            yield self[variable]
+        finally:
+            self.touch(variable)
+
+    def bind_variable(self, name, view, dims=None):
+        """Store a variable in an externally allocated array.
+
+        The current values of the variable (if any) are copied into ``view``.
+        Afterwards, all assignments to the variable write into ``view``
+        instead of replacing the stored array. Assigned values are broadcast
+        to the shape of ``view``; a ``ValueError`` is raised if this is not
+        possible.
+
+        Parameters:
+            name (str): Variable key.
+            view (``np.ndarray``): Array to store the variable in, e.g. a
+                view on a larger buffer.
+            dims (tuple[str]): Tuple of strings specifying the dimension names.
+                Only required if the variable does not exist yet.
+
+        Example:
+            >>> buffer = np.zeros((2, 5))
+            >>> c = Component()
+            >>> c.bind_variable('foo', buffer[0], dims=('index',))
+            >>> c['foo'] = np.arange(5)
+            >>> buffer[0]
+            array([0., 1., 2., 3., 4.])
+        """
+        if name in self._data_vars:
+            old_dims, data = self._data_vars[name]
+            dims = old_dims if dims is None else dims
+            if data is not None:
+                view[...] = data
+
+        self._views[name] = view
+        self[name] = (dims, view)
+
+    def add_observer(self, callback):
+        """Register a callback that is called whenever a variable changes.
+
+        Parameters:
+            callback (callable): Function with signature
+                ``callback(component, variable)``.
+        """
+        self._observers.append(callback)
+
+    def remove_observer(self, callback):
+        """Remove a previously registered callback.
+
+        Parameters:
+            callback (callable): Registered callback.
+        """
+        self._observers.remove(callback)
+
     def __repr__(self):
         dims = ', '.join(f'{d}: {np.size(v)}' for d, v in self.coords.items())
         return f'<{self}({dims}) object at {id(self)}>'
@@ -163,6 +324,7 @@ class Component:
                 If a float is given, all values are filled with it.
         """
         self[variable][:] = value
+        self.touch(variable)
 
     def get(self, variable, default=None, keepdims=True):
         """Get values of a given variable.
@@ -0,0 +1,296 @@
+# -*- coding: utf-8 -*-
+"""Declarative configuration of RCE simulations.
+
+An experiment is described by a mapping that contains the keyword arguments
+of :class:`konrad.RCE` and one entry per model component. Components are
+given by their ``class`` name (as stored in the output files) and their
+keyword arguments. Nested mappings with a ``class`` key (e.g. the ``rh_func``
+of :class:`konrad.humidity.FixedRH`) are created recursively. Positional
+arguments can be passed as list ``args``.
+
+Class names are looked up in the module of the component (e.g.
+``konrad.radiation`` for ``radiation``). Other classes can be given by their
+full import path, e.g. ``mypackage.MyRadiation``.
+
+The atmosphere is either read from a file (``netcdf``) or created on a
+pressure grid (see :func:`konrad.utils.get_quadratic_pgrid`).
+
+**Example**
+
+A configuration in YAML format (requires ``pyyaml``):
+
+.. code-block:: yaml
+
+    experiment: rce-2xCO2
+    timestep: 12h
+    max_duration: 300d
+    outfile: rce-2xCO2.nc
+    atmosphere:
+      num: 128
+      top_pressure: 1
+      CO2: 5.6e-4
+    surface:
+      class: SlabOcean
+      depth: 1
+    humidity:
+      class: FixedRH
+      rh_func:
+        class: VerticallyUniform
+        rh_surface: 0.8
+
+The equivalent JSON file can be used without additional dependencies:
+
+    >>> import konrad
+    >>> config = konrad.config.load('rce-2xCO2.json')
+    >>> rce = konrad.config.create_rce(config[0])
+    >>> rce.run()
+"""
+import importlib
+import json
+import logging
+import os
+
+import numpy as np
+
+from konrad import utils
+
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+
+__all__ = [
+    'load',
+    'create_component',
+    'create_atmosphere',
+    'create_rce',
+    'run',
+    'get_class',
+    'from_attributes',
+]
+
+logger = logging.getLogger(__name__)
+
+#: Module in which the classes of every model component are looked up.
+component_modules = {
+    'cloud': 'konrad.cloud',
+    'convection': 'konrad.convection',
+    'convergence': 'konrad.convergence',
+    'humidity': 'konrad.humidity',
+    'lapserate': 'konrad.lapserate',
+    'ozone': 'konrad.ozone',
+    'radiation': 'konrad.radiation',
+    'surface': 'konrad.surface',
+    'upwelling': 'konrad.upwelling',
+}
+
+# Keys of the atmosphere configuration that define the pressure grid.
+_grid_keys = ('surface_pressure', 'top_pressure', 'num')
+
+
+def load(filename):
+    """Load experiment configurations from a YAML or JSON file.
+
+    Parameters:
+        filename (str): Path to configuration file. Files ending with
+            ``.yaml`` or ``.yml`` are read as YAML, all others as JSON.
+
+    Returns:
+        list[dict]: Experiment configurations. A file may contain either a
+        single configuration or a list of configurations.
+    """
+    with open(filename) as f:
+        if os.path.splitext(filename)[1] in ('.yaml', '.yml'):
+            if yaml is None:
+                raise ImportError('Reading YAML configs requires `pyyaml`.')
+            config = yaml.safe_load(f)
+        else:
+            config = json.load(f)
+
+    if isinstance(config, dict):
+        config = [config]
+
+    return config
+
+
+def get_class(name, module):
+    """Return a class by its name or full import path.
+
+    Parameters:
+        name (str): Class name or full import path.
+        module (str): Module in which a class name is looked up.
+
+    Returns:
+        type: Class.
+    """
+    if '.' in name:
+        module, name = name.rsplit('.', 1)
+
+    try:
+        return getattr(importlib.import_module(module), name)
+    except AttributeError:
+        raise ValueError(f'Unknown class "{name}" in module "{module}".')
+
+
+def _create(value, module):
+    """Recursively create objects from mappings with a ``class`` key."""
+    if isinstance(value, dict) and 'class' in value:
+        return create_component(value, module)
+    elif isinstance(value, list):
+        return [_create(v, module) for v in value]
+
+    return value
+
+
+def _unflatten(attrs):
+    """Convert keys like ``'rh_func/class'`` into nested mappings."""
+    tree = {}
+    for key, value in attrs.items():
+        *prefixes, name = key.split('/')
+        node = tree
+        for prefix in prefixes:
+            node = node.setdefault(prefix, {})
+        node[name] = value
+
+    return tree
+
+
+def _from_tree(tree, module):
+    cls = get_class(tree['class'], module)
+    parameters, var_positional = utils.get_init_parameters(cls)
+
+    config = {'class': tree['class']}
+    args = []
+    for key, value in tree.items():
+        if isinstance(value, dict):
+            if key in parameters and 'class' in value:
+                config[key] = _from_tree(value, module)
+            elif var_positional and key not in parameters:
+                # Composite components (e.g. ``konrad.convergence.Combined``)
+                # prefix the attributes of their children with the class name.
+                args.append(_from_tree({'class': key, **value}, module))
+        elif key in parameters:
+            if isinstance(value, float) and np.isnan(value):
+                # ``None`` is stored as NaN.
+                value = None
+            config[key] = value
+
+    if args:
+        config['args'] = args
+
+    return config
+
+
+def from_attributes(attrs, module):
+    """Return the configuration of a component from its stored attributes.
+
+    Only attributes that are accepted as keyword argument by the class are
+    used. NaN values are converted to ``None``.
+
+    Parameters:
+        attrs (dict): Attributes as returned by
+            :func:`konrad.netcdf.read_attributes`.
+        module (str): Module in which the class is looked up.
+
+    Returns:
+        dict: Component configuration (see :func:`create_component`).
+    """
+    return _from_tree(_unflatten(attrs), module)
+
+
+def create_component(config, module, netcdf=None, timestep=-1):
+    """Create a model component from its configuration.
+
+    Parameters:
+        config (dict): Mapping with the ``class`` name and keyword arguments.
+            Positional arguments can be given as list ``args``.
+        module (str): Module in which the class is looked up.
+        netcdf (str): Path to netCDF file or Zarr store. If given, classes
+            that provide a ``from_netcdf`` constructor (e.g.
+            :class:`konrad.surface.Surface`) read their state from it.
+        timestep (int): Timestep to read from ``netcdf``.
+
+    Returns:
+        Instance of the configured class.
+    """
+    config = dict(config)
+    cls = get_class(config.pop('class'), module)
+    args = [_create(arg, module) for arg in config.pop('args', [])]
+    kwargs = {key: _create(value, module) for key, value in config.items()}
+
+    if netcdf is not None and hasattr(cls, 'from_netcdf'):
+        return cls.from_netcdf(netcdf, *args, timestep=timestep, **kwargs)
+
+    return cls(*args, **kwargs)
+
+
+def create_atmosphere(config):
+    """Create an atmosphere from its configuration.
+
+    Parameters:
+        config (dict): Either ``netcdf`` (and optionally ``timestep``) to
+            read the atmosphere from a file, or the keyword arguments of
+            :func:`konrad.utils.get_quadratic_pgrid`. All other keys set
+            the values of atmospheric variables (e.g. ``CO2``).
+
+    Returns:
+        konrad.atmosphere.Atmosphere: Atmosphere component.
+    """
+    config = dict(config)
+    cls = get_class(config.pop('class', 'Atmosphere'), 'konrad.atmosphere')
+
+    if 'netcdf' in config:
+        atmosphere = cls.from_netcdf(
+            config.pop('netcdf'), timestep=config.pop('timestep', -1))
+    else:
+        grid = {key: config.pop(key) for key in _grid_keys if key in config}
+        atmosphere = cls(utils.get_quadratic_pgrid(**grid))
+
+    for variable, value in config.items():
+        with atmosphere.modify(variable) as data:
+            data[:] = np.asarray(value, dtype=float)
+
+    return atmosphere
+
+
+def create_rce(config):
+    """Create an RCE simulation from its configuration.
+
+    Parameters:
+        config (dict): Experiment configuration.
+
+    Returns:
+        konrad.RCE: RCE simulation.
+    """
+    from konrad.core import RCE
+    from konrad.netcdf import OutputSpecification
+
+    config = dict(config)
+    kwargs = {'atmosphere': create_atmosphere(config.pop('atmosphere', {}))}
+
+    for name, module in component_modules.items():
+        if name in config:
+            kwargs[name] = create_component(config.pop(name), module)
+
+    if 'output_spec' in config:
+        kwargs['output_spec'] = OutputSpecification(
+            **config.pop('output_spec'))
+
+    return RCE(**kwargs, **config)
+
+
+def run(config):
+    """Create and run an RCE simulation.
+
+    Parameters:
+        config (dict): Experiment configuration.
+
+    Returns:
+        str: Output file of the simulation (if any).
+    """
+    rce = create_rce(config)
+    logger.info(f'Run experiment "{rce.experiment}".')
+    rce.run()
+
+    return rce.outfile
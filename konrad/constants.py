@@ -2,7 +2,6 @@
 """Physical constants.
 """
 import scipy.constants as spc
-import typhon.constants as tyc
 
 
 # Physical constants
@@ -11,13 +10,17 @@ c_pv = isobaric_mass_heat_capacity_water_vapor = 1860.46  # J kg^-1 K^-1
 g = earth_standard_gravity = spc.g  # m s^-2
 stefan_boltzmann = 5.67e-8  # W m^-2 K^-4
 heat_of_vaporization = Lv = 2501000  # J kg^-1
-specific_gas_constant_dry_air = Rd = tyc.gas_constant_dry_air  # J kg^-1 K^-1
-specific_gas_constant_water_vapor = Rv = tyc.gas_constant_water_vapor  # J kg^-1 K^-1
+molar_mass_dry_air = 28.9645e-3  # kg mol^-1
+molar_mass_water = 18.01528e-3  # kg mol^-1
+specific_gas_constant_dry_air = Rd = (
+    spc.gas_constant / molar_mass_dry_air)  # J kg^-1 K^-1
+specific_gas_constant_water_vapor = Rv = (
+    spc.gas_constant / molar_mass_water)  # J kg^-1 K^-1
 gas_constant_ratio = epsilon = Rd / Rv  # 1
 density_sea_water = 1025  # kg m^-3
 specific_heat_capacity_sea_water = 4185.5  # J kg^-1 K^-1
 molar_gas_constant_dry_air = molar_Rd = spc.gas_constant  # J mol^-1 K^-1
-avogadro = tyc.avogadro  # molecules per mole
+avogadro = spc.Avogadro  # molecules per mole
 triple_point_water = 273.16  # K
 seconds_in_a_day = 24 * 60 * 60  # s
 meters_per_day = seconds_in_a_day * 0.001  # to convert from mm s^-1 to m/day
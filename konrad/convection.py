@@ -170,8 +170,10 @@ class HardAdjustment(Convection):
         # get convective top temperature and pressure
         self.update_convective_top(T_rad, T_new, p, timestep=timestep)
         # Update atmospheric temperatures as well as surface temperature.
-        atmosphere['T'][0, :] = T_new
-        surface['temperature'][0] = T_s_new
+        with atmosphere.modify('T') as T:
+            T[0, :] = T_new
+        with surface.modify('temperature') as T_s:
+            T_s[0] = T_s_new
 
     def convective_adjustment(self, p, phlev, T_rad, lapse, surface,
                               timestep=0.1):
@@ -0,0 +1,368 @@
+# -*- coding: utf-8 -*-
+"""This module contains criteria to decide whether an RCE simulation has
+reached an equilibrium state.
+
+Each criterion records a diagnostic quantity after every iteration (e.g. the
+imbalance at the top of the atmosphere). The diagnostics are stored as model
+variables and are therefore included in the netCDF output.
+
+**Example**
+
+Stop the simulation only if both the temperature tendency and the TOA
+imbalance are small:
+
+    >>> import konrad
+    >>> convergence = konrad.convergence.Combined(
+    ...     konrad.convergence.TemperatureTendency(delta=1e-4),
+    ...     konrad.convergence.TOAImbalance(threshold=0.1),
+    ... )
+    >>> rce = konrad.RCE(atmosphere=..., convergence=convergence)
+    >>> rce.run()
+"""
+import abc
+import logging
+
+import numpy as np
+
+from konrad import utils
+from konrad.component import Component
+
+
+__all__ = [
+    'Convergence',
+    'TemperatureTendency',
+    'TOAImbalance',
+    'SurfaceEnergyBudget',
+    'SurfaceTemperatureTrend',
+    'GregoryRegression',
+    'Combined',
+]
+
+logger = logging.getLogger(__name__)
+
+
+class Convergence(Component, metaclass=abc.ABCMeta):
+    """Base class to define requirements for convergence criteria."""
+    def __new__(cls, *args, **kwargs):
+        instance = super().__new__(cls)
+        instance.coords = {
+            'time': np.array([]),
+        }
+
+        return instance
+
+    @abc.abstractmethod
+    def update(self, rce):
+        """Update the diagnostics with the current model state.
+
+        Parameters:
+            rce (konrad.RCE): RCE simulation.
+        """
+
+    @abc.abstractmethod
+    def is_converged(self):
+        """Check if the criterion is fulfilled.
+
+        Returns:
+            bool: ``True`` if converged, else ``False``.
+        """
+
+    def reset(self):
+        """Discard the history of the diagnostics, e.g. after a perturbation.
+        """
+
+
+class TemperatureTendency(Convergence):
+    """Check the atmospheric temperature tendency on all levels.
+
+    Stochastic radiation schemes (e.g. RRTMG with MCICA) add noise to the
+    temperature tendency. Optionally, the tendency is averaged over a sliding
+    window before it is compared to the threshold.
+    """
+    def __init__(self, delta=1e-4, window=None):
+        """
+        Parameters:
+            delta (float): Maximum absolute temperature tendency [K/day].
+            window (float or str): Length of the sliding window over which
+                the temperature tendency is averaged.
+
+                * If float, length in days.
+                * If str, a timedelta string (see
+                  :func:`konrad.utils.parse_fraction_of_day`).
+
+                By default, the current tendency is used.
+        """
+        self.delta = delta
+        self.window = (None if window is None
+                       else utils.parse_fraction_of_day(window))
+        self['temperature_tendency'] = (('time',), np.array([np.nan]))
+
+        self._buffer = None
+        self._sum = None
+        self._size = 0
+
+    def reset(self):
+        self._buffer = None
+        self.set('temperature_tendency', np.nan)
+
+    def update(self, rce):
+        if rce.deltaT is None:
+            return
+
+        if self.window is None:
+            self.set('temperature_tendency', np.max(np.abs(rce.deltaT)))
+            return
+
+        if self._buffer is None:
+            n = max(int(round(self.window / rce.timestep)), 1)
+            self._buffer = np.zeros((n, *np.shape(rce.deltaT)))
+            self._sum = np.zeros(np.shape(rce.deltaT))
+            self._size = 0
+
+        # Update the running sum instead of summing over the full window.
+        n = self._buffer.shape[0]
+        i = self._size % n
+        self._sum += rce.deltaT - self._buffer[i]
+        self._buffer[i] = rce.deltaT
+        self._size += 1
+
+        if self._size >= n:
+            self.set('temperature_tendency', np.max(np.abs(self._sum / n)))
+
+    def is_converged(self):
+        return bool(self['temperature_tendency'][-1] < self.delta)
+
+
+class TOAImbalance(Convergence):
+    """Check the net radiative flux at the top of the atmosphere.
+
+    The net flux is compared to the heat sink of the surface (if any) so that
+    simulations with prescribed ocean heat transport can be checked, too.
+    """
+    def __init__(self, threshold=0.1):
+        """
+        Parameters:
+            threshold (float): Maximum absolute imbalance [W/m^2].
+        """
+        self.threshold = threshold
+        self['toa_imbalance'] = (('time',), np.array([np.nan]))
+
+    def update(self, rce):
+        heat_sink = getattr(rce.surface, 'heat_sink', 0)
+        self.set('toa_imbalance', rce.radiation['toa'][-1] - heat_sink)
+
+    def is_converged(self):
+        return bool(np.abs(self['toa_imbalance'][-1]) < self.threshold)
+
+
+class SurfaceEnergyBudget(Convergence):
+    """Check the surface energy budget (net radiation minus heat sink)."""
+    def __init__(self, threshold=0.1):
+        """
+        Parameters:
+            threshold (float): Maximum absolute imbalance [W/m^2].
+        """
+        self.threshold = threshold
+        self['surface_imbalance'] = (('time',), np.array([np.nan]))
+
+    def update(self, rce):
+        radiation = rce.radiation
+        net_flux = (
+            radiation['sw_flxd'][0, 0] - radiation['sw_flxu'][0, 0]
+            + radiation['lw_flxd'][0, 0] - radiation['lw_flxu'][0, 0]
+        )
+        heat_sink = getattr(rce.surface, 'heat_sink', 0)
+        self.set('surface_imbalance', net_flux - heat_sink)
+
+    def is_converged(self):
+        return bool(np.abs(self['surface_imbalance'][-1]) < self.threshold)
+
+
+class SurfaceTemperatureTrend(Convergence):
+    """Check the linear surface temperature trend over a sliding window.
+
+    The surface temperatures are stored in a ring buffer. The trend is
+    computed by a least-squares fit using precomputed regression weights,
+    which costs a single dot product per iteration.
+    """
+    def __init__(self, threshold=1e-4, window='10d'):
+        """
+        Parameters:
+            threshold (float): Maximum absolute trend [K/day].
+            window (float or str): Length of the sliding window.
+
+                * If float, length in days.
+                * If str, a timedelta string (see
+                  :func:`konrad.utils.parse_fraction_of_day`).
+        """
+        self.threshold = threshold
+        self.window = utils.parse_fraction_of_day(window)
+        self['surface_temperature_trend'] = (('time',), np.array([np.nan]))
+
+        self._buffer = None
+        self._weights = None
+        self._size = 0
+
+    def _allocate(self, timestep):
+        n = max(int(round(self.window / timestep)), 2)
+
+        # Least-squares slope of equidistant values `y`: `sum(w * y)`.
+        x = np.arange(n) * timestep
+        x -= x.mean()
+        self._weights = x / np.sum(x**2)
+        self._buffer = np.empty(n)
+        self._size = 0
+
+    def reset(self):
+        self._buffer = None
+        self.set('surface_temperature_trend', np.nan)
+
+    def update(self, rce):
+        if self._buffer is None:
+            self._allocate(rce.timestep)
+
+        n = self._buffer.size
+        self._buffer[self._size % n] = rce.surface['temperature'][-1]
+        self._size += 1
+
+        if self._size >= n:
+            # Rotate the weights instead of the buffer to account for the
+            # position of the oldest value.
+            weights = np.roll(self._weights, self._size % n)
+            self.set('surface_temperature_trend', weights @ self._buffer)
+
+    def is_converged(self):
+        return bool(
+            np.abs(self['surface_temperature_trend'][-1]) < self.threshold)
+
+
+class GregoryRegression(Convergence):
+    r"""Estimate the equilibrium warming by a streaming Gregory regression.
+
+    The TOA imbalance :math:`N` is regressed against the change of the
+    surface temperature :math:`\Delta T_s` since the first update
+    (Gregory et al., 2004):
+
+    .. math::
+        N = F + \lambda \Delta T_s
+
+    The least-squares sums are updated every iteration, so the fit costs
+    a constant amount of operations independent of the run length. The
+    effective forcing :math:`F`, the feedback parameter :math:`\lambda`
+    and the equilibrium warming :math:`-F / \lambda` are stored as model
+    variables. For an abrupt quadrupling of CO2, the equilibrium climate
+    sensitivity is half of the equilibrium warming.
+
+    The criterion is fulfilled if the estimated equilibrium warming varies by
+    less than ``threshold`` within the last ``window``.
+
+    See also:
+        :func:`konrad.plots.gregory_plot`
+    """
+    def __init__(self, threshold=0.01, window='100d', spinup='0d'):
+        """
+        Parameters:
+            threshold (float): Maximum variation of the equilibrium warming
+                within ``window`` [K].
+            window (float or str): Length of the window.
+            spinup (float or str): Time after the first update that is not
+                included in the fit, e.g. to skip rapid adjustments.
+
+                * If float, length in days.
+                * If str, a timedelta string (see
+                  :func:`konrad.utils.parse_fraction_of_day`).
+        """
+        self.threshold = threshold
+        self.window = utils.parse_fraction_of_day(window)
+        self.spinup = utils.parse_fraction_of_day(spinup)
+
+        self['gregory_forcing'] = (('time',), np.array([np.nan]))
+        self['gregory_feedback'] = (('time',), np.array([np.nan]))
+        self['equilibrium_warming'] = (('time',), np.array([np.nan]))
+
+        self.reset()
+
+    def reset(self):
+        self._reference = None
+        self._start = None
+        # Number of samples and sums of x, y, x^2, x*y.
+        self._sums = np.zeros(5)
+        self._estimates = None
+        self._size = 0
+
+        for name in self.data_vars:
+            self.set(name, np.nan)
+
+    def update(self, rce):
+        days = rce.get_hours_passed() / 24
+        if self._reference is None:
+            self._reference = float(rce.surface['temperature'][-1])
+            self._start = days
+            self._estimates = np.full(
+                max(int(round(self.window / rce.timestep)), 2), np.nan)
+
+        if days - self._start < self.spinup:
+            return
+
+        x = rce.surface['temperature'][-1] - self._reference
+        y = rce.radiation['toa'][-1] - getattr(rce.surface, 'heat_sink', 0)
+        self._sums += (1, x, y, x * x, x * y)
+
+        n, sx, sy, sxx, sxy = self._sums
+        with np.errstate(divide='ignore', invalid='ignore'):
+            feedback = (n * sxy - sx * sy) / (n * sxx - sx**2)
+            forcing = (sy - feedback * sx) / n
+            warming = -forcing / feedback
+
+        self.set('gregory_forcing', forcing)
+        self.set('gregory_feedback', feedback)
+        self.set('equilibrium_warming', warming)
+
+        self._estimates[self._size % self._estimates.size] = warming
+        self._size += 1
+
+    def is_converged(self):
+        if self._estimates is None or self._size < self._estimates.size:
+            return False
+
+        return bool(np.ptp(self._estimates) < self.threshold)
+
+
+class Combined(Convergence):
+    """Combination of several convergence criteria.
+
+    The simulation is considered converged if all criteria are fulfilled.
+    The diagnostics of all criteria are shared with the combined criterion.
+    """
+    def __init__(self, *criteria):
+        """
+        Parameters:
+            *criteria (konrad.convergence.Convergence):
+                Convergence criteria.
+        """
+        self._criteria = criteria
+
+        for criterion in criteria:
+            self._data_vars.update(criterion.data_vars)
+
+    @property
+    def attrs(self):
+        # Overrides ``Component.attrs`` by returning the attributes of all
+        # criteria prefixed with their class name.
+        attrs = {}
+        for criterion in self._criteria:
+            attrs.update(
+                utils.prefix_dict_keys(criterion.attrs, str(criterion)))
+
+        return attrs
+
+    def reset(self):
+        for criterion in self._criteria:
+            criterion.reset()
+
+    def update(self, rce):
+        for criterion in self._criteria:
+            criterion.update(rce)
+
+    def is_converged(self):
+        return all(criterion.is_converged() for criterion in self._criteria)
@@ -6,8 +6,9 @@ import logging
 import numpy as np
 
 from konrad import utils
+from konrad import config
 from konrad import netcdf
-from konrad.radiation import RRTMG
+from konrad.radiation import backends
 from konrad.ozone import (Ozone, OzonePressure)
 from konrad.humidity import FixedRH
 from konrad.surface import (Surface, SlabOcean, FixedTemperature)
@@ -15,6 +16,8 @@ from konrad.cloud import (Cloud, ClearSky)
 from konrad.convection import (Convection, HardAdjustment, RelaxedAdjustment)
 from konrad.lapserate import (LapseRate, MoistLapseRate)
 from konrad.upwelling import (Upwelling, NoUpwelling)
+from konrad.convergence import (Convergence, TemperatureTendency)
+from konrad.state import ModelState
 
 logger = logging.getLogger(__name__)
 
@@ -39,7 +42,8 @@ class RCE:
                  outfile=None, experiment='RCE', writeevery='1d', delta=1e-4,
                  radiation=None, ozone=None, humidity=None, surface=None,
                  cloud=None, convection=None, lapserate=None, upwelling=None,
-                 diurnal_cycle=False, co2_adjustment_timescale=np.nan):
+                 diurnal_cycle=False, co2_adjustment_timescale=np.nan,
+                 convergence=None, recorder=None, output_spec=None):
         """Set-up a radiative-convective model.
 
         Parameters:
@@ -57,11 +61,13 @@ class RCE:
                 * If float, maximum duration in days.
                 * If str, a timedelta string (see :func:`konrad.utils.parse_fraction_of_day`).
 
-            outfile (str): netCDF4 file to store output.
+            outfile (str): netCDF4 file to store output. Filenames ending
+                with ``.zarr`` are written as Zarr directory store.
 
             experiment (str): Experiment description (stored in netCDF output).
 
-            writeevery (int, float or str): Set output frequency.
+            writeevery (int, float or str): Set output frequency (for both
+                the netCDF file and the ``recorder``).
 
                 * int: Every nth iteration
                 * float: Every nth day in model time
@@ -69,10 +75,13 @@ class RCE:
 
             delta (float): Stop criterion. If the heating rate is below this
                 threshold for all levels, skip further iterations. Values
-                are given in K/day.
+                are given in K/day. Only used if no ``convergence``
+                criterion is given.
 
             radiation (konrad.radiation): Radiation model.
-                Defaults to :class:`konrad.radiation.RRTMG`.
+                Defaults to the default radiation backend, see
+                :func:`konrad.radiation.backends.default_backend`
+                (:class:`konrad.radiation.RRTMG` unless configured).
 
             ozone (konrad.ozone): Ozone model.
                 Defaults to :class:`konrad.ozone.OzonePressure`.
@@ -96,17 +105,33 @@ class RCE:
                 Defaults to :class:`konrad.upwelling.NoUpwelling`.
 
             diurnal_cycle (bool): Toggle diurnal cycle of solar angle.
+                See ``sw_timestep`` and ``diurnal_quadrature`` of
+                :class:`konrad.radiation.RRTMG` to reduce the costs of
+                the shortwave calculations.
 
             co2_adjustment_timescale (int/float): Adjust CO2 concentrations
                 towards an equilibrium state following Romps 2020.
                 To be used with :class:`konrad.surface.FixedTemperature`.
                 Recommended value is 7 (1 week).
                 Defaults to no CO2 adjustment, with `np.nan`.
+                See :func:`konrad.experiments.find_equilibrium_co2` for a
+                faster root-finding alternative.
+
+            convergence (konrad.convergence): Convergence criterion.
+                Defaults to :class:`konrad.convergence.TemperatureTendency`
+                using the given ``delta``.
+
+            recorder (konrad.recorder.TimeSeriesRecorder): Record selected
+                variables in memory at the output frequency.
+
+            output_spec (konrad.netcdf.OutputSpecification): Select the
+                variables written to ``outfile``. By default, all variables
+                are written.
         """
         # Sub-models.
         self.atmosphere = atmosphere
         if radiation is None:
-            self.radiation = RRTMG()
+            self.radiation = backends.create_backend()
         else:
             self.radiation = radiation
 
@@ -130,6 +155,9 @@ class RCE:
         self.upwelling = utils.return_if_type(upwelling, 'upwelling',
                                               Upwelling, NoUpwelling())
 
+        # Store all prognostic variables in one contiguous buffer.
+        self.state = ModelState(self.atmosphere, self.surface)
+
         self.diurnal_cycle = diurnal_cycle
         self.max_duration = utils.parse_fraction_of_day(max_duration)
         self.timestep = utils.parse_fraction_of_day(timestep)
@@ -142,8 +170,14 @@ class RCE:
         self.deltaT = None
         self.converged = False
 
+        self.convergence = utils.return_if_type(
+            convergence, 'convergence', Convergence,
+            TemperatureTendency(delta=delta))
+
         self.outfile = outfile
         self.nchandler = None
+        self.output_spec = output_spec
+        self.recorder = recorder
         self.experiment = experiment
 
         self.co2_adjustment_timescale = co2_adjustment_timescale
@@ -165,6 +199,80 @@ class RCE:
 
         return retstr
 
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # The model state is re-created after unpickling as the shared
+        # memory of all prognostic variables can not be pickled.
+        del state['state']
+        # The output handler is bound to the file of the original run.
+        state['nchandler'] = None
+
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.state = ModelState(self.atmosphere, self.surface)
+
+    @classmethod
+    def from_netcdf(cls, filename, timestep=-1, **kwargs):
+        """Create an RCE simulation from its own output.
+
+        All components are re-created from the class names and attributes
+        stored in the output (see :func:`konrad.netcdf.read_attributes`).
+        The atmosphere, the surface and the cloud are initialized with the
+        state of the given time step.
+
+        Examples:
+            Branch a perturbation experiment from an equilibrium state:
+
+            >>> rce = konrad.RCE.from_netcdf(
+            ...     'control.nc', experiment='4xCO2', outfile='4xCO2.nc')
+            >>> rce.atmosphere['CO2'] *= 4
+            >>> rce.run()
+
+        Parameters:
+            filename (str): Path to netCDF file or Zarr store.
+            timestep (int): Timestep to read (default is last timestep).
+            **kwargs: Keyword arguments passed to :class:`RCE`. They
+                override the stored settings and components, e.g. to use a
+                radiation model that is not part of konrad.
+
+        Returns:
+            RCE: RCE simulation.
+        """
+        settings = netcdf.read_attributes(filename)
+
+        rce_kwargs = {
+            name: settings[name]
+            for name in netcdf.rce_settings if name in settings
+        }
+        rce_kwargs['experiment'] = settings.get('title', 'RCE')
+
+        modules = {
+            'atmosphere': 'konrad.atmosphere',
+            **config.component_modules,
+        }
+        for name, module in modules.items():
+            if name in kwargs:
+                continue
+
+            try:
+                attrs = netcdf.read_attributes(filename, name)
+            except (KeyError, IndexError):
+                # Component not included in the output.
+                continue
+
+            rce_kwargs[name] = config.create_component(
+                config.from_attributes(attrs, module),
+                module,
+                netcdf=filename,
+                timestep=timestep,
+            )
+
+        rce_kwargs.update(kwargs)
+
+        return cls(**rce_kwargs)
+
     def get_hours_passed(self):
         """Return the number of hours passed since model start.
 
@@ -176,11 +284,13 @@ class RCE:
     def is_converged(self):
         """Check if the atmosphere is in radiative-convective equilibrium.
 
+        The check is delegated to the convergence criterion
+        (see :mod:`konrad.convergence`).
+
         Returns:
             bool: ``True`` if converged, else ``False``.
         """
-        # TODO: Implement proper convergence criterion (e.g. include TOA).
-        return np.all(np.abs(self.deltaT) < self.delta)
+        return self.convergence.is_converged()
 
     def check_if_write(self):
         """Check if current timestep should be appended to output netCDF.
@@ -193,6 +303,14 @@ class RCE:
         if self.outfile is None:
             return False
 
+        return self.is_output_step()
+
+    def is_output_step(self):
+        """Check if the current timestep matches the output frequency.
+
+        Returns:
+            bool: True, if the current timestep is an output step.
+        """
         if isinstance(self.writeevery, int):
             return self.niter % self.writeevery == 0
         elif isinstance(self.writeevery, float):
@@ -304,14 +422,20 @@ class RCE:
 
             # Calculate temperature change for convergence check.
             self.deltaT = (self.atmosphere['T'] - T) / self.timestep
+            self.convergence.update(self)
 
             # Check, if the current iteration is scheduled to be written.
-            if self.check_if_write():
-                if self.nchandler is None:
-                    self.nchandler = netcdf.NetcdfHandler(
-                        filename=self.outfile, rce=self)
+            if self.is_output_step():
+                if self.outfile is not None:
+                    if self.nchandler is None:
+                        self.nchandler = netcdf.create_output_handler(
+                            filename=self.outfile, rce=self,
+                            output_spec=self.output_spec)
+
+                    self.nchandler.write()
 
-                self.nchandler.write()
+                if self.recorder is not None:
+                    self.recorder.record(self)
 
             # Check if the model run has converged to an equilibrium state.
             if self.is_converged():
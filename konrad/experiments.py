@@ -0,0 +1,286 @@
+# -*- coding: utf-8 -*-
+"""Perturbation experiments branched from a common model state.
+
+Forcing experiments (e.g. quadrupling CO2 or warming the surface) usually
+start from the same control equilibrium. Instead of spinning up the control
+state for every experiment, the converged :class:`konrad.RCE` is copied
+once and all perturbed branches are started from this snapshot.
+
+The function :func:`find_equilibrium_co2` searches the CO2 concentration
+that balances the energy budget for a given surface temperature by
+root-finding instead of a slow relaxation during a single run.
+
+**Example**
+
+    >>> import konrad
+    >>> control = konrad.RCE(atmosphere=..., max_duration='1000d')
+    >>> control.run()
+    >>> branches = konrad.experiments.branch(
+    ...     control,
+    ...     perturbations={
+    ...         '4xCO2': konrad.experiments.Scale('CO2', 4),
+    ...         'SST+4K': konrad.experiments.Shift(
+    ...             'temperature', 4, component='surface'),
+    ...         'albedo': konrad.experiments.SetAttribute(
+    ...             'albedo', 0.25, component='surface'),
+    ...     },
+    ...     outfile='branches/{name}.nc',
+    ...     processes=3,
+    ... )
+    >>> branches['4xCO2'].surface['temperature']
+"""
+import logging
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from konrad import utils
+
+
+__all__ = [
+    'Scale',
+    'Shift',
+    'SetAttribute',
+    'branch',
+    'find_equilibrium_co2',
+]
+
+logger = logging.getLogger(__name__)
+
+
+class Scale:
+    """Multiply a model variable by a constant factor."""
+    def __init__(self, variable, factor, component='atmosphere'):
+        """
+        Parameters:
+            variable (str): Variable name, e.g. ``'CO2'``.
+            factor (float): Scaling factor.
+            component (str): Name of the model component.
+        """
+        self.variable = variable
+        self.factor = factor
+        self.component = component
+
+    def __call__(self, rce):
+        with getattr(rce, self.component).modify(self.variable) as data:
+            data *= self.factor
+
+
+class Shift:
+    """Add a constant offset to a model variable."""
+    def __init__(self, variable, offset, component='atmosphere'):
+        """
+        Parameters:
+            variable (str): Variable name, e.g. ``'T'``.
+            offset (float): Offset added to all values.
+            component (str): Name of the model component.
+        """
+        self.variable = variable
+        self.offset = offset
+        self.component = component
+
+    def __call__(self, rce):
+        with getattr(rce, self.component).modify(self.variable) as data:
+            data += self.offset
+
+
+class SetAttribute:
+    """Set an attribute of a model component."""
+    def __init__(self, name, value, component='surface'):
+        """
+        Parameters:
+            name (str): Attribute name, e.g. ``'albedo'``.
+            value: New value.
+            component (str): Name of the model component.
+        """
+        self.name = name
+        self.value = value
+        self.component = component
+
+    def __call__(self, rce):
+        setattr(getattr(rce, self.component), self.name, self.value)
+
+
+# Snapshot of the control simulation in worker processes.
+_snapshot = None
+
+
+def _set_snapshot(snapshot):
+    global _snapshot
+    _snapshot = snapshot
+
+
+def _run_branch(name, perturbation, outfile=None, max_duration=None,
+                snapshot=None):
+    """Restore an RCE from a snapshot, perturb it and run it."""
+    rce = pickle.loads(_snapshot if snapshot is None else snapshot)
+
+    rce.experiment = name
+    rce.outfile = outfile
+    rce.niter = 0
+    rce.deltaT = None
+    rce.convergence.reset()
+    if rce.recorder is not None:
+        rce.recorder.clear()
+
+    if max_duration is not None:
+        rce.max_duration = utils.parse_fraction_of_day(max_duration)
+        rce.max_iterations = np.ceil(rce.max_duration / rce.timestep)
+
+    perturbation(rce)
+
+    logger.info(f'Run branch "{name}".')
+    rce.run()
+
+    return rce
+
+
+def branch(rce, perturbations, outfile=None, max_duration=None,
+           processes=None):
+    """Run perturbed branches starting from the current state of an RCE.
+
+    The full RCE is pickled once. Every branch is restored from this
+    snapshot, so the given RCE itself is not modified.
+
+    Parameters:
+        rce (konrad.RCE): (Converged) control simulation.
+        perturbations (dict): Mapping of branch names and callables that
+            perturb an RCE in place (e.g. :class:`Scale`). The callables have
+            to be picklable if ``processes`` is used.
+        outfile (str): Output file for every branch. The placeholder
+            ``{name}`` is replaced by the name of the branch.
+            By default, no output is written.
+        max_duration (float or str): Maximum duration of every branch
+            (see :class:`konrad.RCE`). Defaults to the setting of ``rce``.
+        processes (int): Number of branches run in parallel.
+            By default, all branches are run sequentially.
+
+    Returns:
+        dict: Mapping of branch names and the final :class:`konrad.RCE`.
+    """
+    snapshot = pickle.dumps(rce)
+
+    names = list(perturbations)
+    outfiles = [
+        None if outfile is None else outfile.format(name=name)
+        for name in names
+    ]
+    args = (
+        names,
+        [perturbations[name] for name in names],
+        outfiles,
+        [max_duration] * len(names),
+    )
+
+    if processes is None or processes < 2:
+        results = [
+            _run_branch(*a, snapshot=snapshot) for a in zip(*args)
+        ]
+    else:
+        # The snapshot is only sent once to every worker process.
+        with ProcessPoolExecutor(processes, initializer=_set_snapshot,
+                                 initargs=(snapshot,)) as executor:
+            results = list(executor.map(_run_branch, *args))
+
+    return dict(zip(names, results))
+
+
+def find_equilibrium_co2(rce, bracket=(0.25, 4.), duration=None, xtol=1e-3,
+                         method='brentq', maxiter=50):
+    """Find the CO2 concentration that balances the energy budget.
+
+    This is a root-finding alternative to the relaxation of the CO2
+    concentration in :meth:`konrad.RCE.run` (see
+    ``co2_adjustment_timescale``), e.g. for runs with a
+    :class:`konrad.surface.FixedTemperature` surface. The root of the TOA
+    imbalance (minus the surface heat sink) is searched as a function of
+    the logarithm of the CO2 scaling factor, in which the radiative forcing
+    is almost linear.
+
+    For every evaluation, the RCE is either only evaluated by the radiation
+    model (``duration=None``), or integrated for a short sub-run so that
+    the atmosphere (e.g. the stratosphere) can adjust. Sub-runs start from
+    the model state of the closest previous evaluation.
+
+    Parameters:
+        rce (konrad.RCE): RCE simulation. After the search, the model is in
+            the state of the equilibrium CO2 concentration. Its settings and
+            iteration count are restored; the convergence diagnostics are
+            reset if sub-runs are used.
+        bracket (tuple[float]): Interval of CO2 scaling factors in which the
+            root is searched (``brentq``) or start values (``secant``).
+        duration (float or str): Duration of the sub-run for every
+            evaluation (see :class:`konrad.RCE`).
+        xtol (float): Absolute tolerance of the logarithm of the scaling
+            factor.
+        method (str): Root-finding method, ``'brentq'`` or ``'secant'``.
+        maxiter (int): Maximum number of iterations.
+
+    Returns:
+        float: CO2 scaling factor relative to the initial concentration.
+    """
+    from scipy import optimize
+
+    co2 = rce.atmosphere['CO2'].copy()
+    settings = (rce.outfile, rce.recorder, rce.max_iterations,
+                rce.co2_adjustment_timescale, rce.niter)
+    rce.outfile = rce.recorder = None
+    rce.co2_adjustment_timescale = np.nan
+    if duration is not None:
+        rce.max_iterations = np.ceil(
+            utils.parse_fraction_of_day(duration) / rce.timestep)
+
+    # Imbalance and model state of every evaluated (log) scaling factor.
+    cache = {}
+
+    def imbalance(x):
+        if x in cache:
+            return cache[x][0]
+
+        if cache:
+            nearest = min(cache, key=lambda c: abs(c - x))
+            rce.state.restore(cache[nearest][1])
+
+        with rce.atmosphere.modify('CO2') as data:
+            data[:] = co2 * np.exp(x)
+
+        if duration is not None:
+            rce.niter = 0
+            rce.convergence.reset()
+            rce.run()
+
+        rce.radiation.update_heatingrates(
+            atmosphere=rce.atmosphere, surface=rce.surface, cloud=rce.cloud)
+        value = (rce.radiation['toa'][-1]
+                 - getattr(rce.surface, 'heat_sink', 0))
+
+        cache[x] = (value, rce.state.copy())
+        logger.debug(f'CO2 factor {np.exp(x):.4f}: imbalance {value:.4f}.')
+
+        return value
+
+    a, b = np.log(bracket)
+    try:
+        if method == 'brentq':
+            x = optimize.brentq(imbalance, a, b, xtol=xtol, maxiter=maxiter)
+        elif method == 'secant':
+            x = optimize.newton(imbalance, a, x1=b, tol=xtol, maxiter=maxiter)
+        else:
+            raise ValueError(f'Unknown root-finding method "{method}".')
+
+        # Leave the model in the state of the solution.
+        imbalance(x)
+        rce.state.restore(cache[x][1])
+    finally:
+        (rce.outfile, rce.recorder, rce.max_iterations,
+         rce.co2_adjustment_timescale, rce.niter) = settings
+        if duration is not None:
+            # The history of the sub-runs does not belong to the simulation.
+            rce.convergence.reset()
+
+    logger.info(
+        f'Found equilibrium CO2 factor {np.exp(x):.4f} '
+        f'after {len(cache)} evaluations.')
+
+    return float(np.exp(x))
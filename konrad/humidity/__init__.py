@@ -1,9 +1,12 @@
 """This module contains classes for handling humidity."""
 import logging
 
+import numpy as np
+
 from konrad.component import Component
 from konrad.utils import prefix_dict_keys
-from konrad.physics import (relative_humidity2vmr, vmr2relative_humidity)
+from konrad.physics import (saturation_pressure, relative_humidity2vmr,
+                            vmr2relative_humidity)
 from .stratosphere import *
 from .relative_humidity import *
 
@@ -12,8 +15,13 @@ logger = logging.getLogger(__name__)
 
 
 class FixedRH(Component):
-    """Preserve the relative humidity profile under temperature changes."""
-    def __init__(self, rh_func=None, stratosphere_coupling=None):
+    """Preserve the relative humidity profile under temperature changes.
+
+    The water vapor VMR is computed in place and the stratosphere coupling is
+    applied within the same update of the atmosphere. Relative humidity
+    models cache their profiles until their inputs or attributes change.
+    """
+    def __init__(self, rh_func=None, stratosphere_coupling=None, e_eq=None):
         """Create a humidity handler.
 
         Parameters:
@@ -21,7 +29,13 @@ class FixedRH(Component):
                 relative humidity distribution.
             stratosphere_coupling (callable): Callable that describes how the
                 humidity should be treated in the stratosphere.
+            e_eq (callable): Function to calculate the equilibrium pressure
+                of water, e.g. a
+                :class:`~konrad.physics.SaturationPressureTable`.
+                Defaults to :func:`~konrad.physics.saturation_pressure`.
         """
+        self._e_eq = saturation_pressure if e_eq is None else e_eq
+
         if stratosphere_coupling is None:
             self._stratosphere_coupling = ColdPointCoupling()
         else:
@@ -32,8 +46,6 @@ class FixedRH(Component):
         else:
             self._rh_func = rh_func
 
-        self._rh_profile = None
-
     @property
     def attrs(self):
         # Overrides ``Component.attrs`` by returning a composite of the
@@ -69,22 +81,44 @@ class FixedRH(Component):
     def stratosphere_coupling(self):
         return type(self._stratosphere_coupling).__name__
 
-    def adjust_humidity(self, atmosphere, **kwargs):
-        """Determine the humidity profile based on atmospheric state.
+    def get_relative_humidity(self, atmosphere, **kwargs):
+        """Return the relative humidity profile.
 
         Parameters:
-            TODO: Write docstring.
+            atmosphere (konrad.atmosphere.Atmosphere): Atmosphere component.
+            **kwargs: Additional arguments passed to the RH model.
 
         Returns:
-            ndarray: Water vapor profile [VMR].
+            ndarray: Relative humidity profile.
         """
-        atmosphere['H2O'][-1, :] = relative_humidity2vmr(
-            relative_humidity=self._rh_func(atmosphere, **kwargs),
-            pressure=atmosphere['plev'],
-            temperature=atmosphere['T'][-1]
+        return self._rh_func(atmosphere, **kwargs)
 
-        )
-        self._stratosphere_coupling.adjust_stratospheric_vmr(atmosphere)
+    def adjust_humidity(self, atmosphere, **kwargs):
+        """Determine the humidity profile based on atmospheric state.
+
+        Note:
+            This method modifies the values in the atmosphere model!
+
+        Parameters:
+            atmosphere (konrad.atmosphere.Atmosphere): Atmosphere component.
+            **kwargs: Additional arguments passed to the RH model,
+                e.g. ``convection`` or ``surface``.
+        """
+        rh = self.get_relative_humidity(atmosphere, **kwargs)
+        coupling = self._stratosphere_coupling
+
+        with atmosphere.modify('H2O') as vmr:
+            h2o = vmr[-1, :]
+
+            # VMR = RH * e_s(T) / p (see `relative_humidity2vmr`)
+            np.multiply(rh, self._e_eq(atmosphere['T'][-1, :]), out=h2o)
+            h2o /= atmosphere['plev']
+
+            if hasattr(coupling, 'adjust_vmr'):
+                coupling.adjust_vmr(atmosphere, h2o)
+
+        if not hasattr(coupling, 'adjust_vmr'):
+            coupling.adjust_stratospheric_vmr(atmosphere)
 
 
 class FixedVMR(Component):
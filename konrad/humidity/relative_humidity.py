@@ -8,6 +8,20 @@ from konrad.component import Component
 from konrad.physics import vmr2relative_humidity
 
 
+def _copy_attrs(attrs):
+    return {
+        key: value.copy() if isinstance(value, np.ndarray) else value
+        for key, value in attrs.items()
+    }
+
+
+def _attrs_equal(a, b):
+    """Compare two attribute dictionaries that may contain arrays."""
+    return a.keys() == b.keys() and all(
+        a[key] is b[key] or np.array_equal(a[key], b[key]) for key in a
+    )
+
+
 class RelativeHumidityModel(Component, metaclass=abc.ABCMeta):
     def __call__(self, atmosphere, **kwargs):
         """Return the vertical distribution of relative humidity.
@@ -22,6 +36,40 @@ class RelativeHumidityModel(Component, metaclass=abc.ABCMeta):
         """
         ...
 
+    def _memoized(self, arrays, inputs, func):
+        """Return the result of ``func()`` and cache it.
+
+        The cached result is re-used as long as the given arrays are the
+        same objects (e.g. the pressure grid), the ``inputs`` compare equal
+        (e.g. the convective top) and the model attributes do not change.
+
+        Note:
+            The returned array is shared between calls and must not be
+            modified in place.
+
+        Parameters:
+            arrays (tuple[ndarray]): Arrays that are compared by identity.
+            inputs (tuple): Inputs that are compared by value.
+            func (callable): Function without arguments computing the
+                relative humidity profile.
+
+        Returns:
+            ndarray: Relative humidity profile.
+        """
+        memo = getattr(self, '_memo', None)
+        attrs = self.attrs
+
+        if (memo is not None
+                and all(a is b for a, b in zip(memo[1], arrays))
+                and memo[2] == inputs
+                and _attrs_equal(memo[3], attrs)):
+            return memo[0]
+
+        rh = func()
+        self._memo = (rh, arrays, inputs, _copy_attrs(attrs))
+
+        return rh
+
 
 class CacheFromAtmosphere(RelativeHumidityModel):
     """Calculate and cache relative humidity from initial atmosphere."""
@@ -47,14 +95,12 @@ class HeightConstant(RelativeHumidityModel):
                 pressure level (surface)
         """
         self.rh_surface = rh_surface
-        self._rh_cache = None
 
     def __call__(self, atmosphere, **kwargs):
-        if self._rh_cache is None:
-            p = atmosphere['plev']
-            self._rh_cache = self.rh_surface * np.ones_like(p)
+        p = atmosphere['plev']
 
-        return self._rh_cache
+        return self._memoized(
+            (p,), (), lambda: self.rh_surface * np.ones_like(p))
 
 
 class VerticallyUniform(RelativeHumidityModel):
@@ -77,6 +123,9 @@ class VerticallyUniform(RelativeHumidityModel):
         self.convective_top = convection.get('convective_top_plev')[0]
         self.cold_point = atmosphere.get_cold_point_plev()
 
+        return self._memoized((p,), (), lambda: self._get_profile(p))
+
+    def _get_profile(self, p):
         rh = (
             (self.rh_tropopause - self.rh_surface)
             / (self.cold_point - self.convective_top)
@@ -100,9 +149,13 @@ class ConstantFreezingLevel(RelativeHumidityModel):
 
     def __call__(self, atmosphere, **kwargs):
         plev = atmosphere['plev']
-        rh_profile = self.rh_surface * np.ones_like(plev)
-
         fl = atmosphere.get_triple_point_index()
+
+        return self._memoized(
+            (plev,), (fl,), lambda: self._get_profile(plev, fl))
+
+    def _get_profile(self, plev, fl):
+        rh_profile = self.rh_surface * np.ones_like(plev)
         rh_profile[fl:] = (
             self.rh_surface * (plev[fl:] / plev[fl])**1.3
         )
@@ -128,21 +181,23 @@ class FixedUTH(RelativeHumidityModel):
         self.uth_plev = uth_plev
         self.uth_offset = uth_offset
 
-        self._rh_base_profile = None
-
     def get_relative_humidity_profile(self, atmosphere):
         p = atmosphere['plev']
 
+        return self._memoized(
+            (p,), (), lambda: self._get_profile(atmosphere))
+
+    def _get_profile(self, atmosphere):
+        p = atmosphere['plev']
+
         # Use Manabe (1967) relative humidity model as base/background.
-        if self._rh_base_profile is None:
-            manabe_model = Manabe67(rh_surface=self.rh_surface)
-            self._rh_base_profile = manabe_model(atmosphere)
+        rh_base_profile = Manabe67(rh_surface=self.rh_surface)(atmosphere)
 
         # Gaussian upper-tropospheric UTH peak in ln(p) coordinates
         x = p / (self.uth_plev + self.uth_offset)
         uth = self.uth * np.exp(-np.log(x)**2 * np.pi)
 
-        return np.maximum(self._rh_base_profile, uth)
+        return np.maximum(rh_base_profile, uth)
 
     def __call__(self, atmosphere, **kwargs):
         return self.get_relative_humidity_profile(atmosphere)
@@ -170,8 +225,12 @@ class CshapeConstant(RelativeHumidityModel):
 
     def __call__(self, atmosphere, convection, **kwargs):
         self.uth_plev = convection.get('convective_top_plev')[0]
+        p = atmosphere['plev']
 
-        x = np.log10(atmosphere['plev'])
+        return self._memoized((p,), (), lambda: self._get_profile(p))
+
+    def _get_profile(self, p):
+        x = np.log10(p)
         xmin = np.log10(self.uth_plev)
         xmax = x[0]
 
@@ -192,8 +251,12 @@ class CshapeDecrease(RelativeHumidityModel):
 
     def __call__(self, atmosphere, convection, **kwargs):
         self.uth_plev = convection.get('convective_top_plev')[0]
+        p = atmosphere['plev']
+
+        return self._memoized((p,), (), lambda: self._get_profile(p))
 
-        x = np.log10(atmosphere['plev'])
+    def _get_profile(self, p):
+        x = np.log10(p)
         xmin = np.log10(self.uth_plev)
         xmax = x[0]
 
@@ -221,7 +284,8 @@ class Manabe67(RelativeHumidityModel):
     def __call__(self, atmosphere, **kwargs):
         p = atmosphere['plev']
 
-        return self.rh_surface * (p / p[0] - 0.02) / (1 - 0.02)
+        return self._memoized(
+            (p,), (), lambda: self.rh_surface * (p / p[0] - 0.02) / (1 - 0.02))
 
 
 class Cess76(RelativeHumidityModel):
@@ -249,15 +313,30 @@ class Cess76(RelativeHumidityModel):
         p = atmosphere['plev']
         self.T_surface = surface['temperature'][-1]
 
+        return self._memoized((p,), (), lambda: self._get_profile(p))
+
+    def _get_profile(self, p):
         return self.rh_surface * ((p / p[0] - 0.02) / (1 - 0.02))**self.omega
 
 
 class Romps14(RelativeHumidityModel):
-    """Relative humidity following an invariant RH-T relation."""
+    """Relative humidity following an invariant RH-T relation.
+
+    The profile is only re-calculated if the atmospheric temperature has
+    changed since the last call.
+    """
     def __init__(self):
         self._rh_func = None
 
     def __call__(self, atmosphere, **kwargs):
+        T = atmosphere['T']
+
+        return self._memoized(
+            (atmosphere['plev'], T), (atmosphere.get_version('T'),),
+            lambda: self._get_profile(T[-1, :]),
+        )
+
+    def _get_profile(self, T):
         if self._rh_func is None:
             self._rh_func = interp1d(
                 # Values read from Fig. 6 in Romps (2014).
@@ -267,4 +346,4 @@ class Romps14(RelativeHumidityModel):
                 fill_value='extrapolate',
             )
 
-        return self._rh_func(atmosphere['T'][-1, :])
+        return self._rh_func(T)
@@ -7,7 +7,13 @@ from konrad.component import Component
 
 
 class StratosphereCoupler(Component, metaclass=abc.ABCMeta):
-    """Define the coupling of tropospheric and stratospheric water vapor."""
+    """Define the coupling of tropospheric and stratospheric water vapor.
+
+    Couplers may additionally implement ``adjust_vmr(atmosphere, vmr)``,
+    which adjusts a given water vapor profile in place. This allows
+    :class:`~konrad.humidity.FixedRH` to apply the coupling within its own
+    update of the atmosphere.
+    """
     @abc.abstractmethod
     def adjust_stratospheric_vmr(self, atmosphere):
         """Adjust stratospheric water vapor VMR values.
@@ -24,19 +30,28 @@ class StratosphereCoupler(Component, metaclass=abc.ABCMeta):
 
 class ColdPointCoupling(StratosphereCoupler):
     """Keep stratospheric VMR constant from the cold point on."""
-    def adjust_stratospheric_vmr(self, atmosphere):
+    def adjust_vmr(self, atmosphere, vmr):
+        """Adjust a water vapor profile [VMR] in place."""
         cp_index = atmosphere.get_cold_point_index()
-        atmosphere['H2O'][-1, cp_index:] = atmosphere['H2O'][-1, cp_index]
+        vmr[cp_index:] = vmr[cp_index]
+
+    def adjust_stratospheric_vmr(self, atmosphere):
+        with atmosphere.modify('H2O') as vmr:
+            self.adjust_vmr(atmosphere, vmr[-1, :])
 
 
 class NonIncreasing(StratosphereCoupler):
     """Prevent the VMR from increasing with height anywhere in the column."""
-    def adjust_stratospheric_vmr(self, atmosphere):
-        h2o = atmosphere['H2O'][-1, :]
-        h2o_grad = np.diff(h2o)
+    def adjust_vmr(self, atmosphere, vmr):
+        """Adjust a water vapor profile [VMR] in place."""
+        h2o_grad = np.diff(vmr)
         if not np.all(h2o_grad < 0):
             index = np.argmax(h2o_grad > 0)
-            atmosphere['H2O'][-1, index+1:] = atmosphere['H2O'][-1, index]
+            vmr[index+1:] = vmr[index]
+
+    def adjust_stratospheric_vmr(self, atmosphere):
+        with atmosphere.modify('H2O') as vmr:
+            self.adjust_vmr(atmosphere, vmr[-1, :])
 
 
 class FixedStratosphericVMR(StratosphereCoupler):
@@ -48,9 +63,14 @@ class FixedStratosphericVMR(StratosphereCoupler):
         """
         self.stratospheric_vmr = stratospheric_vmr
 
-    def adjust_stratospheric_vmr(self, atmosphere):
+    def adjust_vmr(self, atmosphere, vmr):
+        """Adjust a water vapor profile [VMR] in place."""
         cp_index = atmosphere.get_cold_point_index()
-        atmosphere['H2O'][-1, cp_index:] = self.stratospheric_vmr
+        vmr[cp_index:] = self.stratospheric_vmr
+
+    def adjust_stratospheric_vmr(self, atmosphere):
+        with atmosphere.modify('H2O') as vmr:
+            self.adjust_vmr(atmosphere, vmr[-1, :])
 
 
 class MinimumStratosphericVMR(StratosphereCoupler):
@@ -62,15 +82,20 @@ class MinimumStratosphericVMR(StratosphereCoupler):
         """
         self.minimum_vmr = minimum_vmr
 
-    def adjust_stratospheric_vmr(self, atmosphere):
-        vmr = atmosphere['H2O'][-1, :]
+    def adjust_vmr(self, atmosphere, vmr):
+        """Adjust a water vapor profile [VMR] in place."""
+        below_minimum = vmr < self.minimum_vmr
 
         # If the VMR falls below the stratospheric background...
-        if np.any(vmr < self.minimum_vmr):
+        if np.any(below_minimum):
             # ... set all values equal to the background from there.
-            vmr[np.argmax(vmr < self.minimum_vmr):] = self.minimum_vmr
+            vmr[np.argmax(below_minimum):] = self.minimum_vmr
         else:
             # Otherwise find the smallest VMR and use the background value
             # from there on, this at least minimizes the discontinuity at
             # the transition point.
             vmr[np.argmin(vmr):] = self.minimum_vmr
+
+    def adjust_stratospheric_vmr(self, atmosphere):
+        with atmosphere.modify('H2O') as vmr:
+            self.adjust_vmr(atmosphere, vmr[-1, :])
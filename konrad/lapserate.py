@@ -19,6 +19,7 @@ profile and the surface temperature to follow the :code:`critical_lapserate`.
 """
 import abc
 import numbers
+import weakref
 
 import numpy as np
 from scipy.interpolate import interp1d
@@ -45,19 +46,56 @@ class LapseRate(Component, metaclass=abc.ABCMeta):
 
 
 class MoistLapseRate(LapseRate):
-    """Moist adiabatic temperature lapse rate."""
-    def __init__(self, fixed=False):
+    """Moist adiabatic temperature lapse rate.
+
+    The lapse rate is only re-calculated if the temperature of the
+    atmosphere has changed since the last call (see
+    :meth:`konrad.component.Component.get_version`), or if it is called
+    with a different atmosphere. In-place changes of the temperature that
+    bypass :meth:`~konrad.component.Component.modify` are not detected.
+    """
+    def __init__(self, fixed=False, e_eq=None):
         """
         Parameters:
             fixed (bool): If `True` the moist adiabatic lapse rate is only
                 calculated for the first time step and kept constant
-                afterwards.
+                afterwards. If `False`, it is re-calculated whenever the
+                temperature changes.
+            e_eq (callable): Function to calculate the equilibrium pressure
+                of water, e.g. a
+                :class:`~konrad.physics.SaturationPressureTable`.
+                Defaults to :func:`~konrad.physics.saturation_pressure`.
         """
         self.fixed = fixed
+        self._e_eq = saturation_pressure if e_eq is None else e_eq
         self._lapse_cache = None
+        # Weak reference to the atmosphere of the cached lapse rate. Unlike
+        # `id()`, it can not match a new atmosphere at the same address.
+        self._atmosphere_ref = None
+        self._temperature_version = None
+
+    def __getstate__(self):
+        state = super().__getstate__()
+        # Weak references can not be pickled.
+        state['_atmosphere_ref'] = None
+
+        return state
+
+    def _is_cached(self, atmosphere):
+        if self._lapse_cache is None:
+            return False
+
+        if self.fixed:
+            return True
+
+        return (
+            self._atmosphere_ref is not None
+            and self._atmosphere_ref() is atmosphere
+            and self._temperature_version == atmosphere.get_version('T')
+        )
 
     def __call__(self, atmosphere):
-        if self._lapse_cache is not None:
+        if self._is_cached(atmosphere):
             return self._lapse_cache
 
         T = atmosphere['T'][0, :]
@@ -73,7 +111,7 @@ class MoistLapseRate(LapseRate):
 
         gamma_d = g / Cp  # dry lapse rate
 
-        w_saturated = vmr2mixing_ratio(saturation_pressure(T) / p)
+        w_saturated = vmr2mixing_ratio(self._e_eq(T) / p)
 
         gamma_m = (gamma_d * ((1 + (L * w_saturated) / (Rd * T)) /
                               (1 + (L**2 * w_saturated) / (Cp * Rv * T**2))
@@ -82,8 +120,9 @@ class MoistLapseRate(LapseRate):
         lapse = interp1d(np.log(p), gamma_m, fill_value='extrapolate')(
             np.log(phlev[:-1]))
 
-        if self.fixed:
-            self._lapse_cache = lapse
+        self._lapse_cache = lapse
+        self._atmosphere_ref = weakref.ref(atmosphere)
+        self._temperature_version = atmosphere.get_version('T')
 
         return lapse
 
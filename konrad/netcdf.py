@@ -1,17 +1,46 @@
+import abc
+import importlib.util
 import logging
 from datetime import datetime
+from fnmatch import fnmatchcase
 
 import netCDF4
 import numpy as np
+import xarray as xr
+
+try:
+    import zarr
+except ImportError:
+    zarr = None
 
 from konrad import (constants, __version__)
 from konrad.component import Component
 
 
 __all__ = [
+    'OutputSpecification',
+    'OutputHandler',
     'NetcdfHandler',
+    'ZarrHandler',
+    'create_output_handler',
+    'read_timestep',
+    'read_attributes',
+    'open_output',
+    'is_zarr',
+    'open_zarr_group',
+    'list_groups',
 ]
 
+#: Settings of the :class:`konrad.RCE` that are stored as global attributes.
+rce_settings = (
+    'timestep',
+    'max_duration',
+    'writeevery',
+    'delta',
+    'diurnal_cycle',
+    'co2_adjustment_timescale',
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -19,6 +48,52 @@ def _move_item_to_index(list, item, index):
     list.insert(index, list.pop(list.index(item)))
 
 
+def is_zarr(filename):
+    """Check if a filename refers to a Zarr store.
+
+    Parameters:
+        filename (str): Path to netCDF file or Zarr store.
+
+    Returns:
+        bool: ``True`` if the filename ends with ``.zarr``.
+    """
+    return str(filename).rstrip('/').endswith('.zarr')
+
+
+def open_zarr_group(filename):
+    """Open the root group of a Zarr store for reading.
+
+    Parameters:
+        filename (str): Path to Zarr store.
+
+    Returns:
+        zarr.Group: Root group.
+
+    Raises:
+        ImportError: If the `zarr` package is not installed.
+    """
+    if zarr is None:
+        raise ImportError('Reading Zarr output requires `zarr`.')
+
+    return zarr.open_group(filename, mode='r')
+
+
+def list_groups(filename):
+    """Return the names of all groups in the root group of an output.
+
+    Parameters:
+        filename (str): Path to netCDF file or Zarr store.
+
+    Returns:
+        list[str]: Group names.
+    """
+    if is_zarr(filename):
+        return list(open_zarr_group(filename).group_keys())
+
+    with netCDF4.Dataset(filename) as root:
+        return list(root.groups)
+
+
 def convert_unsupported_types(variable):
     """Convert variables into a netCDF-supported data type."""
     if variable is None:
@@ -36,18 +111,137 @@ def convert_unsupported_types(variable):
     return variable
 
 
-class NetcdfHandler:
-    """A netCDF file handler.
+class OutputSpecification:
+    """Select which variables are written to the netCDF output and how.
+
+    Variables are addressed by ``'<component>/<variable>'``. Patterns
+    without a slash refer to whole components. Shell-style wildcards are
+    supported, e.g. ``'radiation/*_clr'``.
 
     Usage:
-        >>> rce = konrad.RCE(...)
-        >>> nc = NetcdfHandler('output.nc', rce)  # create output file
-        >>> nc.write(rce)  # write (append) current RCE state to file
+        >>> spec = OutputSpecification(
+        ...     include=['atmosphere', 'surface', 'radiation/toa'],
+        ...     exclude=['atmosphere/*_vmr'],
+        ...     frequency={'atmosphere/*': 10},
+        ...     level_stride=2,
+        ...     float32=True,
+        ... )
+        >>> rce = konrad.RCE(..., outfile='output.nc', output_spec=spec)
+    """
+    #: Vertical dimensions that are subsampled by ``level_stride``.
+    level_dims = ('plev', 'phlev')
+
+    def __init__(self, include=None, exclude=None, frequency=None,
+                 level_stride=1, float32=False):
+        """
+        Parameters:
+            include (list[str]): Components or variables to write.
+                By default, everything is written.
+            exclude (list[str]): Components or variables to skip.
+                Exclusion takes precedence over inclusion.
+            frequency (dict): Write matching variables only every n-th output
+                step, e.g. ``{'atmosphere/T': 10}``. Skipped time steps are
+                filled with missing values.
+            level_stride (int): Only write every n-th vertical level.
+            float32 (bool): Store floating point data variables in single
+                precision.
+        """
+        self.include = include
+        self.exclude = exclude or []
+        self.frequency = frequency or {}
+        self.level_stride = level_stride
+        self.float32 = float32
+
+        self._cache = {}
+
+    @staticmethod
+    def _matches(patterns, component, variable=None):
+        for pattern in patterns:
+            if '/' not in pattern:
+                if fnmatchcase(component, pattern):
+                    return True
+            elif variable is not None:
+                if fnmatchcase(f'{component}/{variable}', pattern):
+                    return True
+            elif fnmatchcase(component, pattern.split('/')[0]):
+                # A pattern for a variable requires the component itself.
+                return True
+
+        return False
+
+    def is_component_included(self, component):
+        """Check if (at least parts of) a component are written."""
+        if self._matches(
+                [p for p in self.exclude if '/' not in p], component):
+            return False
+
+        return self.include is None or self._matches(self.include, component)
+
+    def is_included(self, component, variable):
+        """Check if a variable of a component is written."""
+        key = (component, variable)
+        if key not in self._cache:
+            self._cache[key] = (
+                not self._matches(self.exclude, component, variable)
+                and (self.include is None
+                     or self._matches(self.include, component, variable))
+            )
+
+        return self._cache[key]
+
+    def is_due(self, component, variable, index):
+        """Check if a variable is written at a given output step."""
+        for pattern, every in self.frequency.items():
+            if fnmatchcase(f'{component}/{variable}', pattern):
+                return index % every == 0
+
+        return True
+
+    def get_slice(self, dims):
+        """Return the index for subsampling given dimensions."""
+        return tuple(
+            slice(None, None, self.level_stride) if dim in self.level_dims
+            else slice(None)
+            for dim in dims
+        )
+
+    def convert(self, data, dims=()):
+        """Subsample and convert data according to the specification."""
+        if data is None:
+            return data
+
+        data = np.asarray(data)
+        if self.level_stride > 1 and data.ndim == len(dims):
+            data = data[self.get_slice(dims)]
+
+        if self.float32 and data.dtype == np.float64:
+            data = data.astype(np.float32)
 
+        return data
+
+
+class OutputHandler(metaclass=abc.ABCMeta):
+    """Base class for output backends.
+
+    An output backend stores every model component of an RCE simulation in
+    its own group. Time-dependent variables are appended along the
+    unlimited dimension ``time``. Inheriting classes implement the actual
+    storage of groups and variables, while the selection of components and
+    the bookkeeping of output steps is shared.
     """
-    def __init__(self, filename, rce):
+    def __init__(self, filename, rce, output_spec=None):
+        """
+        Parameters:
+            filename (str): Path to the output file.
+            rce (konrad.RCE): RCE simulation.
+            output_spec (OutputSpecification): Variables to write.
+                By default, all variables are written.
+        """
         self.filename = filename
         self.rce = rce
+        if output_spec is None:
+            output_spec = OutputSpecification()
+        self.output_spec = output_spec
 
         self.udim = 'time'
         self.udim_size = 0
@@ -56,14 +250,126 @@ class NetcdfHandler:
 
         self.create_file()
 
+    def get_global_attributes(self):
+        """Return the attributes stored in the root group.
+
+        Besides some general information, the settings of the RCE
+        simulation (see ``rce_settings``) are stored.
+        """
+        attrs = {
+            'title': self.rce.experiment,
+            'created': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            'source': f'konrad {__version__}',
+            'references': 'https://github.com/atmtools/konrad',
+        }
+
+        for name in rce_settings:
+            if hasattr(self.rce, name):
+                attrs[name] = convert_unsupported_types(
+                    getattr(self.rce, name))
+
+        return attrs
+
+    def iter_coords(self, component):
+        """Yield all coordinates of a component (subsampled if requested)."""
+        for name, coord in component.coords.items():
+            # Coordinates are not converted to single precision.
+            if name in self.output_spec.level_dims:
+                coord = np.asarray(coord)[::self.output_spec.level_stride]
+            yield name, coord
+
+    def iter_data_vars(self, component, groupname, append=False):
+        """Yield all data variables of a component that should be written.
+
+        Parameters:
+            component (konrad.component.Component): Model component.
+            groupname (str): Name of the output group.
+            append (bool): Only yield time-dependent variables that are due
+                at the current output step.
+        """
+        spec = self.output_spec
+        for varname, (dims, data) in component.data_vars.items():
+            if not spec.is_included(groupname, varname):
+                continue
+
+            if append and (self.udim not in dims or not spec.is_due(
+                    groupname, varname, self.udim_size)):
+                continue
+
+            yield varname, dims, spec.convert(data, dims)
+
+    @abc.abstractmethod
+    def create_file(self):
+        """Create the output file and store global attributes."""
+
+    @abc.abstractmethod
+    def create_group(self, component, groupname):
+        """Create a group storing all attributes and variables of a component.
+        """
+
+    @abc.abstractmethod
+    def append_group(self, component, groupname):
+        """Append time-dependent variables of a component at ``udim_size``."""
+
+    @abc.abstractmethod
+    def initialize_unlimited_dimension(self):
+        """Set the first value of the unlimited dimension."""
+
+    @abc.abstractmethod
+    def expand_unlimitied_dimension(self):
+        """Increase the unlimited dimension by one and update ``udim_size``.
+        """
+
+    def get_components(self):
+        """Return a list of non-empty non-private model components."""
+        if len(self._component_cache) == 0:
+            for attr in dir(self.rce):
+                if ((not attr.startswith('_')
+                     and isinstance(getattr(self.rce, attr), Component)
+                     and self.output_spec.is_component_included(attr))):
+                    self._component_cache.append(attr)
+
+        # Ensure that the atmosphere component is stored first as it holds
+        # the common coordinates `plev` and `phlev`.
+        self._component_cache.sort()
+        if 'atmosphere' in self._component_cache:
+            _move_item_to_index(self._component_cache, 'atmosphere', 0)
+
+        logger.debug(f'Components for output file: "{self._component_cache}".')
+
+        return self._component_cache
+
+    def initialize_file(self):
+        for component in self.get_components():
+            self.create_group(getattr(self.rce, component), component)
+
+        self.initialize_unlimited_dimension()
+
+    def append_to_file(self):
+        self.expand_unlimitied_dimension()
+        for component in self.get_components():
+            self.append_group(getattr(self.rce, component), component)
+
+    def write(self):
+        """Write current state of the RCE model to the output file."""
+        if len(self.groups) == 0:
+            self.initialize_file()
+        else:
+            self.append_to_file()
+
+
+class NetcdfHandler(OutputHandler):
+    """A netCDF file handler.
+
+    Usage:
+        >>> rce = konrad.RCE(...)
+        >>> nc = NetcdfHandler('output.nc', rce)  # create output file
+        >>> nc.write(rce)  # write (append) current RCE state to file
+
+    """
     def create_file(self):
         with netCDF4.Dataset(self.filename, mode='w') as root:
-            root.setncatts({
-                'title': self.rce.experiment,
-                'created': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                'source': f'konrad {__version__}',
-                'references': 'https://github.com/atmtools/konrad',
-            })
+            root.setncatts(self.get_global_attributes())
 
         logger.debug(f'Created "{self.filename}".')
 
@@ -75,11 +381,14 @@ class NetcdfHandler:
 
     def create_variable(self, group, name, value, dims=()):
         value = convert_unsupported_types(value)
+        dtype = np.asarray(value).dtype
 
         variable = group.createVariable(
             varname=name,
-            datatype=np.asarray(value).dtype,
+            datatype=dtype,
             dimensions=dims,
+            # Mark time steps that are not written as missing values.
+            fill_value=np.nan if dtype.kind == 'f' else None,
         )
         variable[:] = value
 
@@ -103,12 +412,13 @@ class NetcdfHandler:
             for attr, value in component.attrs.items():
                 self.create_variable(group, attr, value)
 
-            for name, coord in component.coords.items():
+            for name, coord in self.iter_coords(component):
                 self.create_dimension(root, name, coord)
                 if name not in root.variables:
                     self.create_variable(root, name, coord, (name,))
 
-            for varname, (dims, data) in component.data_vars.items():
+            for varname, dims, data in self.iter_data_vars(
+                    component, groupname):
                 if varname not in group.variables:
                     self.create_variable(group, varname, data, dims)
 
@@ -120,53 +430,375 @@ class NetcdfHandler:
         with netCDF4.Dataset(self.filename, 'a') as root:
             group = root.groups[groupname]
 
-            for varname, (dims, data) in component.data_vars.items():
-                if self.udim not in dims:
-                    continue
-
+            for varname, dims, data in self.iter_data_vars(
+                    component, groupname, append=True):
                 s = [self.udim_size if dim == self.udim else slice(None)
                      for dim in dims]
 
                 group.variables[varname][tuple(s)] = data
 
+    def initialize_unlimited_dimension(self):
+        with netCDF4.Dataset(self.filename, 'a') as root:
+            root.variables[self.udim][:] = 0
+
     def expand_unlimitied_dimension(self):
         with netCDF4.Dataset(self.filename, 'a') as root:
             self.udim_size = root.dimensions[self.udim].size
 
             root[self.udim][self.udim_size] = self.rce.get_hours_passed()
 
-    def get_components(self):
-        """Return a list of non-empty non-private model components."""
-        if len(self._component_cache) == 0:
-            for attr in dir(self.rce):
-                if ((not attr.startswith('_')
-                     and isinstance(getattr(self.rce, attr), Component))):
-                    self._component_cache.append(attr)
 
-        # Ensure that the atmosphere component is stored first as it holds
-        # the common coordinates `plev` and `phlev`.
-        self._component_cache.sort()
-        _move_item_to_index(self._component_cache, 'atmosphere', 0)
+class ZarrHandler(OutputHandler):
+    """A Zarr directory store handler.
 
-        logger.debug(f'Components for netCDF file: "{self._component_cache}".')
+    The output uses the same group and variable layout as the
+    :class:`NetcdfHandler`. Dimension names are stored following the xarray
+    convention, so that every group can be read using
+    ``xarray.open_zarr(filename, group=...)``. Time-dependent variables are
+    chunked along the time dimension and can be appended to without
+    rewriting existing chunks.
 
-        return self._component_cache
+    Usage:
+        >>> rce = konrad.RCE(...)
+        >>> zarr_handler = ZarrHandler('output.zarr', rce)
+        >>> zarr_handler.write()
+    """
+    def __init__(self, filename, rce, output_spec=None, time_chunks=128):
+        """
+        Parameters:
+            filename (str): Path to the Zarr directory store.
+            rce (konrad.RCE): RCE simulation.
+            output_spec (OutputSpecification): Variables to write.
+                By default, all variables are written.
+            time_chunks (int): Number of time steps per chunk.
+        """
+        if zarr is None:
+            raise ImportError(
+                'The Zarr output requires the `zarr` package.')
+
+        self.time_chunks = time_chunks
+        self._root = None
+
+        super().__init__(filename, rce, output_spec=output_spec)
 
-    def initialize_file(self):
-        for component in self.get_components():
-            self.create_group(getattr(self.rce, component), component)
+    def create_file(self):
+        try:
+            # Use the Zarr v2 format (and its convention for dimension names)
+            # also with more recent versions of `zarr`.
+            self._root = zarr.open_group(
+                self.filename, mode='w', zarr_format=2)
+        except TypeError:
+            self._root = zarr.open_group(self.filename, mode='w')
+        self._root.attrs.update(self.get_global_attributes())
 
-        with netCDF4.Dataset(self.filename, 'a') as root:
-            root.variables[self.udim][:] = 0
+        logger.debug(f'Created "{self.filename}".')
 
-    def append_to_file(self):
-        self.expand_unlimitied_dimension()
-        for component in self.get_components():
-            self.append_group(getattr(self.rce, component), component)
+    def create_variable(self, group, name, value, dims=()):
+        value = np.asarray(convert_unsupported_types(value))
+        if len(dims) == 0:
+            # Attributes are stored as scalars.
+            value = value.reshape(())
+        elif value.ndim != len(dims):
+            # Broadcast missing values to the full shape of the variable.
+            shape = tuple(1 if dim == self.udim else self._root[dim].shape[0]
+                          for dim in dims)
+            value = np.broadcast_to(value, shape)
+
+        chunks = tuple(
+            self.time_chunks if dim == self.udim else max(size, 1)
+            for dim, size in zip(dims, value.shape)
+        )
+        fill_value = np.nan if value.dtype.kind == 'f' else None
+
+        variable = group.create_dataset(
+            name,
+            shape=value.shape,
+            chunks=chunks,
+            dtype=value.dtype,
+            fill_value=fill_value,
+        )
+        variable[...] = value
 
-    def write(self):
-        """Write current state of the RCE model to the netCDF file."""
-        if len(self.groups) == 0:
-            self.initialize_file()
-        else:
-            self.append_to_file()
+        variable.attrs['_ARRAY_DIMENSIONS'] = list(dims)
+        variable.attrs.update(constants.variable_description.get(name, {}))
+
+        logger.debug(f'Created variable "{name}".')
+
+    def create_group(self, component, groupname):
+        group = self._root.create_group(groupname)
+        group.attrs['class'] = type(component).__name__
+
+        for attr, value in component.attrs.items():
+            self.create_variable(group, attr, value)
+
+        for name, coord in self.iter_coords(component):
+            if name not in self._root.array_keys():
+                self.create_variable(self._root, name, coord, (name,))
+
+        for varname, dims, data in self.iter_data_vars(component, groupname):
+            if varname not in group.array_keys():
+                self.create_variable(group, varname, data, dims)
+
+        logger.debug(f'Created group "{groupname}".')
+
+        self.groups.append(groupname)
+
+    def append_group(self, component, groupname):
+        group = self._root[groupname]
+
+        for varname, dims, data in self.iter_data_vars(
+                component, groupname, append=True):
+            variable = group[varname]
+            axis = dims.index(self.udim)
+
+            # Variables with a lower output frequency are filled with
+            # missing values up to the current time step.
+            if variable.shape[axis] <= self.udim_size:
+                shape = list(variable.shape)
+                shape[axis] = self.udim_size + 1
+                variable.resize(tuple(shape))
+
+            s = [slice(self.udim_size, self.udim_size + 1)
+                 if dim == self.udim else slice(None) for dim in dims]
+            variable[tuple(s)] = data
+
+    def initialize_unlimited_dimension(self):
+        self._root[self.udim].resize(1)
+        self._root[self.udim][:] = 0
+
+    def expand_unlimitied_dimension(self):
+        time = self._root[self.udim]
+        self.udim_size = time.shape[0]
+
+        time.append([self.rce.get_hours_passed()])
+
+
+def create_output_handler(filename, rce, output_spec=None):
+    """Create an output handler depending on the file extension.
+
+    Filenames ending with ``.zarr`` are written using the
+    :class:`ZarrHandler`, all other files using the :class:`NetcdfHandler`.
+
+    Parameters:
+        filename (str): Path to the output file.
+        rce (konrad.RCE): RCE simulation.
+        output_spec (OutputSpecification): Variables to write.
+
+    Returns:
+        OutputHandler: Output handler.
+    """
+    if is_zarr(filename):
+        handler_class = ZarrHandler
+    else:
+        handler_class = NetcdfHandler
+
+    return handler_class(filename, rce, output_spec=output_spec)
+
+
+def _is_missing(data):
+    """Check if an output record only contains missing values."""
+    return data.dtype.kind == 'f' and data.size > 0 and np.all(np.isnan(data))
+
+
+def _read_slice(variable, dims, timestep):
+    """Read a single time step of a netCDF or Zarr variable."""
+    if len(dims) == 0:
+        return np.asarray(variable[...])
+
+    def read(timestep):
+        index = tuple(
+            timestep if dim == 'time' else slice(None) for dim in dims)
+        return np.asarray(variable[index])
+
+    data = read(timestep)
+
+    if isinstance(timestep, int) and timestep == -1 and 'time' in dims:
+        # Variables with a reduced output frequency are missing in skipped
+        # output steps (see `OutputSpecification`). Use the last written
+        # output step instead.
+        ntime = variable.shape[dims.index('time')]
+        for t in range(ntime - 2, -1, -1):
+            if not _is_missing(data):
+                break
+            data = read(t)
+
+    return data
+
+
+def read_timestep(filename, group=None, variables=None, timestep=-1):
+    """Read variables of a single time step from konrad output.
+
+    Only the requested time step is read from disk. Both netCDF files and
+    Zarr stores (see :class:`ZarrHandler`) are supported.
+
+    Parameters:
+        filename (str): Path to netCDF file or Zarr store.
+        group (str): Group to read from. If the group does not exist, the
+            root group is used instead.
+        variables (list[str]): Variables to read. Variables that do not
+            exist are skipped. By default, all variables are read.
+        timestep (int or slice): Timestep to read (default is last
+            timestep). If a slice is given, the time dimension is kept.
+            For the default, every variable is read at the last timestep
+            it was written, i.e. variables with a reduced output frequency
+            (see :class:`OutputSpecification`) are never missing.
+
+    Returns:
+        dict: Dictionary of variable names and values.
+    """
+    if is_zarr(filename):
+        root = open_zarr_group(filename)
+        dataset = root[group] if group in root.group_keys() else root
+        names = list(dataset.array_keys())
+        if variables is not None:
+            names = [name for name in variables if name in names]
+
+        return {
+            name: _read_slice(
+                dataset[name],
+                dataset[name].attrs.get('_ARRAY_DIMENSIONS', ()),
+                timestep,
+            )
+            for name in names
+        }
+
+    with netCDF4.Dataset(filename) as root:
+        # Missing values are stored as NaN, masking is not needed.
+        root.set_auto_mask(False)
+        dataset = root[group] if group in root.groups else root
+        names = list(dataset.variables)
+        if variables is not None:
+            names = [name for name in variables if name in names]
+
+        return {
+            name: _read_slice(
+                dataset[name], dataset[name].dimensions, timestep)
+            for name in names
+        }
+
+
+def _iter_netcdf_variables(group, prefix=''):
+    """Iterate over the variables of a netCDF group and its subgroups."""
+    for name, variable in group.variables.items():
+        yield prefix + name, variable
+
+    for name, subgroup in group.groups.items():
+        yield from _iter_netcdf_variables(subgroup, f'{prefix}{name}/')
+
+
+def _iter_zarr_arrays(group, prefix=''):
+    """Iterate over the arrays of a Zarr group and its subgroups."""
+    for name, array in group.arrays():
+        yield prefix + name, array
+
+    for name, subgroup in group.groups():
+        yield from _iter_zarr_arrays(subgroup, f'{prefix}{name}/')
+
+
+def _to_python(value):
+    """Convert scalars and single-element (string) arrays to Python types."""
+    value = np.asarray(value)
+    if value.size != 1:
+        return None
+
+    return value.item()
+
+
+def read_attributes(filename, group=None):
+    """Read the attributes of the RCE or one of its components.
+
+    The attributes of components are written by
+    :meth:`OutputHandler.create_group` as scalar variables and subgroups
+    (e.g. ``rh_func`` of :class:`konrad.humidity.FixedRH`).
+
+    Parameters:
+        filename (str): Path to netCDF file or Zarr store.
+        group (str): Group to read from. By default, the global attributes
+            of the root group are returned.
+
+    Returns:
+        dict: Attributes including the ``class`` name of the component.
+        Attributes of subgroups are prefixed with the group name, e.g.
+        ``'rh_func/class'``.
+    """
+    attrs = {}
+
+    if is_zarr(filename):
+        root = open_zarr_group(filename)
+        if group is None:
+            return dict(root.attrs)
+
+        dataset = root[group]
+        attrs['class'] = dataset.attrs.get('class')
+        for name, array in _iter_zarr_arrays(dataset):
+            if array.ndim == 0:
+                attrs[name] = _to_python(array[...])
+    else:
+        with netCDF4.Dataset(filename) as root:
+            root.set_auto_mask(False)
+            if group is None:
+                return {a: _to_python(root.getncattr(a))
+                        for a in root.ncattrs()}
+
+            dataset = root[group]
+            attrs['class'] = dataset.getncattr('class')
+            for name, variable in _iter_netcdf_variables(dataset):
+                if variable.ndim == 0:
+                    attrs[name] = _to_python(variable[...])
+
+    return attrs
+
+
+def open_output(filename, datatree=False, chunks=None):
+    """Lazily open all groups of konrad output.
+
+    Variables are only read from disk when they are accessed. If ``dask`` is
+    installed, they are returned as dask arrays using the chunks on disk.
+    Otherwise, xarray's lazy loading returns NumPy arrays.
+
+    Parameters:
+        filename (str): Path to netCDF file or Zarr store.
+        datatree (bool): Return an ``xarray.DataTree`` with one node per
+            group instead of a merged dataset. Requires xarray>=2024.10.
+        chunks (dict): Chunk sizes of the dask arrays passed to xarray.
+            Defaults to the chunks on disk (``chunks={}``) if ``dask`` is
+            installed.
+
+    Returns:
+        xarray.Dataset or xarray.DataTree: Model output. In the merged
+        dataset, variables are named ``'<group>/<variable>'``, e.g.
+        ``'surface/temperature'``.
+
+    Example:
+        >>> ds = konrad.open_output('output.nc')
+        >>> ds['atmosphere/T'].sel(plev=500e2, method='nearest').plot()
+    """
+    if chunks is None and importlib.util.find_spec('dask') is not None:
+        chunks = {}
+
+    groups = list_groups(filename)
+    if is_zarr(filename):
+        kwargs = {'engine': 'zarr', 'consolidated': False}
+    else:
+        kwargs = {}
+
+    if datatree:
+        if not hasattr(xr, 'open_datatree'):
+            raise ImportError(
+                'Opening konrad output as DataTree requires xarray>=2024.10 '
+                f'(found {xr.__version__}).')
+        return xr.open_datatree(filename, chunks=chunks, **kwargs)
+
+    root = xr.open_dataset(filename, chunks=chunks, **kwargs)
+    datasets = [root]
+    for group in groups:
+        dataset = xr.open_dataset(
+            filename, group=group, chunks=chunks, **kwargs)
+
+        # Share the coordinates stored in the root group.
+        dataset = dataset.assign_coords(
+            {dim: root[dim] for dim in dataset.dims if dim in root.coords})
+        datasets.append(dataset.rename(
+            {var: f'{group}/{var}' for var in dataset.data_vars}))
+
+    return xr.merge(datasets, combine_attrs='override')
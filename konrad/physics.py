@@ -3,10 +3,19 @@ from numbers import Number
 
 import numpy as np
 import typhon.physics as typ
+from scipy.interpolate import CubicSpline
 
 from konrad import constants
 
 
+__all__ = [
+    'saturation_pressure',
+    'SaturationPressureTable',
+    'relative_humidity2vmr',
+    'vmr2relative_humidity',
+]
+
+
 # TODO: Replace with typhon version after next release (>0.7.0)
 def saturation_pressure(temperature):
     r"""Return equilibrium pressure of water with respect to the mixed-phase.
@@ -35,6 +44,13 @@ def saturation_pressure(temperature):
     Parameters:
         temperature (float or ndarray): Temperature [K].
 
+    Note:
+        The equilibrium pressures over water and ice are evaluated in a
+        single pass sharing the logarithm and inverse of the temperature.
+        Both cases are blended using a clipped weight instead of boolean
+        masks. See :class:`SaturationPressureTable` for an even faster
+        approximation based on a lookup table.
+
     See also:
         :func:`~typhon.physics.e_eq_ice_mk`
             Equilibrium pressure of water over ice.
@@ -46,27 +62,97 @@ def saturation_pressure(temperature):
     """
     # Keep track of input type to match the return type.
     is_float_input = isinstance(temperature, Number)
+
+    # Scalars are converted into 1-d arrays to allow in-place operations.
+    T = np.atleast_1d(np.asarray(temperature, dtype=float))
+    if np.any(T <= 0):
+        raise ValueError('Temperatures must be larger than 0 Kelvin.')
+
+    log_T = np.log(T)
+    inv_T = 1 / T
+
+    # Equilibrium pressure over ice (Murphy and Koop, 2005, Eq. 7).
+    e_eq_ice = 9.550426 - 5723.265 * inv_T + 3.53068 * log_T - 0.00728332 * T
+    np.exp(e_eq_ice, out=e_eq_ice)
+
+    # Equilibrium pressure over liquid water (Murphy and Koop, 2005, Eq. 10).
+    # The in-place operations avoid the allocation of temporary arrays.
+    e_eq_water = np.tanh(0.0415 * (T - 218.8))
+    e_eq_water *= 53.878 - 1331.22 * inv_T - 9.44523 * log_T + 0.014025 * T
+    e_eq_water += 54.842763 - 6763.22 * inv_T - 4.21 * log_T + 0.000367 * T
+    np.exp(e_eq_water, out=e_eq_water)
+
+    # The weight is 0 below `T_t - 23 K` (ice) and 1 above `T_t` (water).
+    weight = np.clip((T - constants.triple_point_water + 23) / 23, 0, 1)
+    weight **= 2
+
+    # e_eq = e_ice + (e_liq - e_ice) * weight
+    e_eq_water -= e_eq_ice
+    e_eq_water *= weight
+    e_eq_water += e_eq_ice
+
     if is_float_input:
-        # Convert float input to ndarray to allow indexing.
-        temperature = np.asarray([temperature])
+        return float(e_eq_water[0])
+
+    return e_eq_water.reshape(np.shape(temperature))
+
+
+class SaturationPressureTable:
+    """Lookup table for the equilibrium pressure of water.
+
+    The logarithm of :func:`saturation_pressure` is tabulated on a regular
+    temperature grid and interpolated either linearly or using cubic splines.
+    The table can be used as drop-in replacement wherever a function
+    ``e_eq = f(T)`` is expected.
+
+    For the default grid (100 K to 400 K in 0.01 K steps) the maximum
+    relative error compared to :func:`saturation_pressure` is below
+    ``2e-7`` for linear interpolation and below ``5e-9`` for cubic
+    interpolation. Temperatures outside of the table range are computed
+    exactly.
+
+    Example:
+        >>> e_eq = SaturationPressureTable()
+        >>> e_eq(np.array([250., 300.]))
+        array([  76.02389004, 3536.76441305])
+    """
+    def __init__(self, tmin=100., tmax=400., resolution=0.01, kind='linear'):
+        """
+        Parameters:
+            tmin (float): Lowest temperature in the table [K].
+            tmax (float): Highest temperature in the table [K].
+            resolution (float): Temperature resolution [K].
+            kind (str): Interpolation method, either "linear" or "cubic".
+        """
+        if kind not in ('linear', 'cubic'):
+            raise ValueError('Interpolation has to be "linear" or "cubic".')
+
+        self.kind = kind
+        self.temperature = np.arange(tmin, tmax + resolution / 2, resolution)
+        self.log_pressure = np.log(saturation_pressure(self.temperature))
+
+        if kind == 'cubic':
+            self._spline = CubicSpline(self.temperature, self.log_pressure)
 
-    e_eq_water = typ.e_eq_water_mk(temperature)
-    e_eq_ice = typ.e_eq_ice_mk(temperature)
+    def __call__(self, temperature):
+        """Return the equilibrium pressure [Pa] for given temperature [K]."""
+        T = np.asarray(temperature, dtype=float)
 
-    is_water = temperature > constants.triple_point_water
+        if T.min() < self.temperature[0] or T.max() > self.temperature[-1]:
+            return saturation_pressure(temperature)
 
-    is_ice = temperature < (constants.triple_point_water - 23.)
+        if self.kind == 'linear':
+            log_e = np.interp(T, self.temperature, self.log_pressure)
+        else:
+            log_e = self._spline(T)
 
-    e_eq = (e_eq_ice + (e_eq_water - e_eq_ice)
-            * ((temperature - constants.triple_point_water + 23) / 23)**2
-            )
-    e_eq[is_ice] = e_eq_ice[is_ice]
-    e_eq[is_water] = e_eq_water[is_water]
+        e_eq = np.exp(log_e)
 
-    return float(e_eq) if is_float_input else e_eq
+        return float(e_eq) if isinstance(temperature, Number) else e_eq
 
 
-def relative_humidity2vmr(relative_humidity, pressure, temperature):
+def relative_humidity2vmr(relative_humidity, pressure, temperature,
+                          e_eq=None):
     r"""Convert relative humidity into water vapor VMR.
 
     .. math::
@@ -76,6 +162,9 @@ def relative_humidity2vmr(relative_humidity, pressure, temperature):
         relative_humidity (float or ndarray): Relative humidity.
         pressure (float or ndarray): Pressue [Pa].
         temperature(float or ndarray): Temperature [K].
+        e_eq (callable): Function to calculate the equilibrium pressure,
+            e.g. a :class:`SaturationPressureTable`.
+            Defaults to :func:`saturation_pressure`.
 
     Returns:
         float or ndarray: Water vapor volume mixing ratio [dimensionless].
@@ -84,11 +173,11 @@ def relative_humidity2vmr(relative_humidity, pressure, temperature):
         RH=relative_humidity,
         p=pressure,
         T=temperature,
-        e_eq=saturation_pressure,
+        e_eq=saturation_pressure if e_eq is None else e_eq,
     )
 
 
-def vmr2relative_humidity(vmr, pressure, temperature):
+def vmr2relative_humidity(vmr, pressure, temperature, e_eq=None):
     r"""Convert water vapor VMR into relative humidity.
 
     .. math::
@@ -98,6 +187,9 @@ def vmr2relative_humidity(vmr, pressure, temperature):
         vmr (float or ndarray): Water vapor volume mixing ratio.
         pressure (float or ndarray): Pressure [Pa].
         temperature (float or ndarray): Temperature [K].
+        e_eq (callable): Function to calculate the equilibrium pressure,
+            e.g. a :class:`SaturationPressureTable`.
+            Defaults to :func:`saturation_pressure`.
 
     Returns:
         float or ndarray: Relative humidity [dimensionless].
@@ -106,5 +198,5 @@ def vmr2relative_humidity(vmr, pressure, temperature):
         vmr=vmr,
         p=pressure,
         T=temperature,
-        e_eq=saturation_pressure,
+        e_eq=saturation_pressure if e_eq is None else e_eq,
     )
@@ -1,10 +1,9 @@
 # -*- coding: utf-8 -*-
 """Plotting related functions.
+
+Matplotlib is only imported when a plot is created.
 """
-from matplotlib.ticker import FuncFormatter
-import matplotlib.pyplot as plt
 import numpy as np
-import typhon.plots
 
 
 __all__ = [
@@ -14,11 +13,6 @@ __all__ = [
 ]
 
 
-@FuncFormatter
-def _percent_formatter(x, pos):
-    return '{:.0f}\N{SIX-PER-EM SPACE}%'.format(x * 100)
-
-
 def plot_overview_p_log(data, lw_htngrt, sw_htngrt, axes, **kwargs):
     """Plot overview of atmopsheric temperature and humidity profiles.
 
@@ -30,6 +24,8 @@ def plot_overview_p_log(data, lw_htngrt, sw_htngrt, axes, **kwargs):
         **kwargs: Additional keyword arguments passed to all calls
             of `atmospheric_profile`.
     """
+    import typhon.plots
+
     if len(axes) != 3:
         raise Exception('Need to pass three AxesSubplot.')
     ax1, ax2, ax3 = np.ravel(axes)
@@ -67,6 +63,8 @@ def plot_overview_z(data, lw_htngrt, sw_htngrt, axes, **kwargs):
         **kwargs: Additional keyword arguments passed to all calls
             of `atmospheric_profile`.
     """
+    import typhon.plots
+
     if len(axes) != 3:
         raise Exception('Need to pass three AxesSubplot.')
     ax1, ax2, ax3 = np.ravel(axes)
@@ -112,6 +110,8 @@ def gregory_plot(temperature, forcing, draw_fit=True, ax=None, **kwargs):
     """
     # If no axis is passed, use current axis (will create one, if needed).
     if ax is None:
+        import matplotlib.pyplot as plt
+
         ax = plt.gca()
 
     # Default keyword arguments to control the plot appearance later.
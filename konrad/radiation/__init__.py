@@ -19,10 +19,19 @@ cloudy and clear-sky, longwave and shortwave radiative fluxes and heating rates.
     >>> rad = konrad.radiation.RRTMG(...)
     >>> rad.calc_radiation(atmosphere=..., surface=..., cloud=...)
     >>> longwave_heating_rate = rad['lw_htngrt'][-1]
+
+**Radiation backends**
+
+Radiation schemes are available by name through a registry (see
+:mod:`konrad.radiation.backends`), which can be extended by other packages.
+    >>> rad = konrad.radiation.backends.create_backend('grey')
 """
 from .radiation import Radiation
 from .rrtmg import RRTMG
+from .grey import GreyRadiation
 from .common import *
+from . import backends
+from . import kernels
 
 
 __all__ = [s for s in dir() if not s.startswith('_')]
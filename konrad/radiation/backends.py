@@ -0,0 +1,160 @@
+"""Registry of radiation backends.
+
+Radiation schemes are registered under a short name. Besides the backends
+shipped with konrad, other packages can provide backends through the entry
+point group ``konrad.radiation``, e.g. in their ``setup.py``:
+
+.. code-block:: python
+
+    entry_points={
+        'konrad.radiation': [
+            'myscheme = mypackage.radiation:MyRadiation',
+        ],
+    }
+
+The default backend of :class:`konrad.RCE` is RRTMG. It can be changed with
+the environment variable ``KONRAD_RADIATION``, e.g. to run tests without
+CliMT:
+
+.. code-block:: bash
+
+    $ KONRAD_RADIATION=grey pytest
+
+**Example**
+
+    >>> import konrad
+    >>> konrad.radiation.backends.list_backends()
+    ['grey', 'rrtmg']
+    >>> radiation = konrad.radiation.backends.create_backend('grey')
+"""
+import importlib
+import logging
+import os
+
+__all__ = [
+    'register_backend',
+    'list_backends',
+    'get_backend',
+    'create_backend',
+    'default_backend',
+]
+
+logger = logging.getLogger(__name__)
+
+#: Name of the entry point group of radiation backends.
+entry_point_group = 'konrad.radiation'
+
+# Backends are stored as import path to avoid importing heavy dependencies.
+_backends = {
+    'grey': 'konrad.radiation.grey:GreyRadiation',
+    'rrtmg': 'konrad.radiation.rrtmg:RRTMG',
+}
+
+_entry_points_loaded = False
+
+
+def _iter_entry_points():
+    try:
+        from importlib.metadata import entry_points
+    except ImportError:  # Python < 3.8
+        import pkg_resources
+        return pkg_resources.iter_entry_points(entry_point_group)
+
+    eps = entry_points()
+    if hasattr(eps, 'select'):
+        return eps.select(group=entry_point_group)
+    return eps.get(entry_point_group, [])
+
+
+def _load_entry_points():
+    global _entry_points_loaded
+    if _entry_points_loaded:
+        return
+
+    for entry_point in _iter_entry_points():
+        # Explicitly registered backends take precedence.
+        if entry_point.name not in _backends:
+            _backends[entry_point.name] = entry_point
+    _entry_points_loaded = True
+
+
+def register_backend(name, cls):
+    """Register a radiation backend.
+
+    Parameters:
+        name (str): Name of the backend.
+        cls (type or str): Subclass of :class:`konrad.radiation.Radiation`
+            or its import path (``'module:Class'``).
+    """
+    _backends[name.lower()] = cls
+
+
+def list_backends():
+    """Return the names of all available radiation backends.
+
+    Returns:
+        list[str]: Sorted backend names.
+    """
+    _load_entry_points()
+
+    return sorted(_backends)
+
+
+def default_backend():
+    """Return the name of the default radiation backend.
+
+    Returns:
+        str: Value of the environment variable ``KONRAD_RADIATION``
+        (default is ``'rrtmg'``).
+    """
+    return os.environ.get('KONRAD_RADIATION', 'rrtmg')
+
+
+def get_backend(name=None):
+    """Return the class of a radiation backend.
+
+    Parameters:
+        name (str): Name of the backend. Defaults to
+            :func:`default_backend`.
+
+    Returns:
+        type: Subclass of :class:`konrad.radiation.Radiation`.
+    """
+    if name is None:
+        name = default_backend()
+
+    _load_entry_points()
+
+    try:
+        backend = _backends[name.lower()]
+    except KeyError:
+        raise ValueError(
+            f'Unknown radiation backend "{name}". '
+            f'Available backends: {", ".join(list_backends())}.')
+
+    if isinstance(backend, str):
+        module, cls = backend.split(':')
+        backend = getattr(importlib.import_module(module), cls)
+    elif not isinstance(backend, type):
+        backend = backend.load()  # entry point
+
+    _backends[name.lower()] = backend
+
+    return backend
+
+
+def create_backend(name=None, **kwargs):
+    """Create a radiation model.
+
+    Parameters:
+        name (str): Name of the backend. Defaults to
+            :func:`default_backend`.
+        **kwargs: Keyword arguments passed to the backend.
+
+    Returns:
+        konrad.radiation.Radiation: Radiation model.
+    """
+    cls = get_backend(name)
+    logger.debug(f'Use radiation backend "{cls.__name__}".')
+
+    return cls(**kwargs)
@@ -0,0 +1,84 @@
+"""Define an analytic (semi-)grey radiation scheme. """
+import numpy as np
+
+from konrad import constants
+from .common import fluxes2heating
+from .radiation import Radiation
+
+__all__ = [
+    'GreyRadiation',
+]
+
+
+class GreyRadiation(Radiation):
+    """Semi-grey two-stream radiation scheme.
+
+    The longwave is treated as a single grey band with an optical thickness
+    that decreases with the square of pressure (pressure broadening of water
+    vapour lines). The atmosphere is transparent in the shortwave.
+
+    The scheme is deterministic and requires no compiled dependencies. Its
+    costs are negligible compared to RRTMG, which makes it suitable for tests
+    and for benchmarks of the other model components.
+    """
+    def __init__(self, *args, solar_constant=510, optical_thickness=2.,
+                 **kwargs):
+        """
+        Parameters:
+            zenith_angle (float): Zenith angle of the sun [degrees].
+            bias (dict-like): Bias corrections (see :class:`Radiation`).
+            solar_constant (float): Solar constant [W m^-2].
+            optical_thickness (float): Longwave optical thickness of the
+                full atmosphere.
+        """
+        super().__init__(*args, **kwargs)
+        self.solar_constant = solar_constant
+        self.optical_thickness = optical_thickness
+
+    def calc_radiation(self, atmosphere, surface, cloud):
+        phlev = atmosphere['phlev']
+        sigma = constants.stefan_boltzmann
+
+        # Optical thickness above every half-level and layer transmissivity.
+        tau = self.optical_thickness * (phlev / phlev[0])**2
+        transmissivity = np.exp(tau[1:] - tau[:-1])
+        source = sigma * atmosphere['T'][0]**4 * (1 - transmissivity)
+
+        lw_flxd = np.zeros(phlev.size)
+        for i in range(phlev.size - 2, -1, -1):
+            lw_flxd[i] = lw_flxd[i + 1] * transmissivity[i] + source[i]
+
+        emissivity = surface.longwave_emissivity
+        lw_flxu = np.empty(phlev.size)
+        lw_flxu[0] = (emissivity * sigma * surface['temperature'][-1]**4
+                      + (1 - emissivity) * lw_flxd[0])
+        for i in range(phlev.size - 1):
+            lw_flxu[i + 1] = lw_flxu[i] * transmissivity[i] + source[i]
+
+        sw_flxd = np.full(phlev.size, self.solar_constant * max(
+            np.cos(np.deg2rad(self.current_solar_angle)), 0))
+        sw_flxu = float(surface.albedo) * sw_flxd
+
+        fluxes = {
+            'lw_flxu': lw_flxu,
+            'lw_flxd': lw_flxd,
+            'sw_flxu': sw_flxu,
+            'sw_flxd': sw_flxd,
+        }
+        for name, flux in fluxes.items():
+            self[name] = flux[np.newaxis]
+            self[name + '_clr'] = flux[np.newaxis].copy()
+
+        for band in ('lw', 'sw'):
+            heating = fluxes2heating(
+                net_fluxes=fluxes[f'{band}_flxu'] - fluxes[f'{band}_flxd'],
+                pressure=phlev,
+            )
+            self[f'{band}_htngrt'] = heating[np.newaxis]
+            self[f'{band}_htngrt_clr'] = heating[np.newaxis].copy()
+
+        self.coords = {
+            'time': np.array([0]),
+            'phlev': phlev,
+            'plev': atmosphere['plev'],
+        }
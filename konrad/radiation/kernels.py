@@ -0,0 +1,271 @@
+"""Radiative kernels and forcing calculations based on a radiation model.
+
+A radiative kernel describes the change of the radiative flux at the top of
+the atmosphere (TOA) and at the surface due to a perturbation of the
+atmospheric state at a single model level.
+
+**Example**
+
+Calculate temperature and water vapor kernels for a given atmosphere:
+    >>> import konrad
+    >>> rad = konrad.radiation.RRTMG()
+    >>> kernels = konrad.radiation.kernels.RadiativeKernels(rad)
+    >>> ds = kernels.calc_kernels(atmosphere=..., surface=..., cloud=...)
+    >>> ds['toa_T']  # TOA flux response to temperature changes
+
+Calculate the instantaneous radiative forcing of doubling CO2:
+    >>> kernels.calc_forcing(atmosphere=..., surface=..., cloud=...,
+    ...                      variable='CO2', factor=2)
+"""
+import logging
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import xarray as xr
+
+
+__all__ = [
+    'RadiativeKernels',
+]
+
+logger = logging.getLogger(__name__)
+
+
+def _net_fluxes(radiation):
+    """Return the net downward flux at the TOA and the surface [W/m^2]."""
+    toa = radiation['toa'][-1]
+    surface = (
+        radiation['sw_flxd'][-1, 0] - radiation['sw_flxu'][-1, 0]
+        + radiation['lw_flxd'][-1, 0] - radiation['lw_flxu'][-1, 0]
+    )
+
+    return toa, surface
+
+
+def _evaluate_perturbations(radiation, atmosphere, surface, cloud, tasks):
+    """Evaluate the radiation for a list of single-level perturbations.
+
+    Parameters:
+        radiation (konrad.radiation.Radiation): Radiation model.
+        atmosphere (konrad.atmosphere.Atmosphere): Atmosphere model.
+        surface (konrad.surface.Surface): Surface model.
+        cloud (konrad.cloud.Cloud): Cloud model.
+        tasks (list[tuple]): Tuples ``(component, variable, index, value)``
+            describing which value is set before calling the radiation.
+
+    Returns:
+        ndarray: Net fluxes at TOA and surface, shape ``(len(tasks), 2)``.
+    """
+    components = {'atmosphere': atmosphere, 'surface': surface}
+
+    fluxes = np.empty((len(tasks), 2))
+    for i, (component, variable, index, value) in enumerate(tasks):
+        with components[component].modify(variable) as data:
+            original = data[index]
+            data[index] = value
+
+        radiation.update_heatingrates(atmosphere, surface, cloud)
+        fluxes[i] = _net_fluxes(radiation)
+
+        with components[component].modify(variable) as data:
+            data[index] = original
+
+    return fluxes
+
+
+class RadiativeKernels:
+    """Calculate radiative kernels using finite differences.
+
+    Atmospheric temperature (``'T'``) and surface temperature (``'Ts'``) are
+    perturbed by adding the given perturbation [K]. All other variables
+    (e.g. ``'H2O'`` or ``'CO2'``) are perturbed relatively, i.e. they are
+    multiplied by ``1 + perturbation``. The corresponding kernels are given
+    per unit change of the natural logarithm of the volume mixing ratio.
+    """
+    def __init__(self, radiation, perturbations=None, centered=False,
+                 processes=None, cache=True):
+        """
+        Parameters:
+            radiation (konrad.radiation.Radiation): Radiation model.
+            perturbations (dict): Perturbation size for every variable.
+                Defaults to ``{'T': 1, 'H2O': 0.1, 'Ts': 1}``.
+            centered (bool): Use centered (symmetric) finite differences.
+                This doubles the number of radiation calls but removes the
+                first-order truncation error.
+            processes (int): Number of processes used to evaluate the
+                perturbations in parallel. The radiation model has to be
+                picklable. By default, all calls are done sequentially.
+            cache (bool): Cache the kernels of the latest state. The cache
+                is invalidated if the atmospheric state, the surface
+                temperature or the cloud change.
+        """
+        self.radiation = radiation
+        if perturbations is None:
+            perturbations = {'T': 1., 'H2O': 0.1, 'Ts': 1.}
+        self.perturbations = perturbations
+        self.centered = centered
+        self.processes = processes
+        self.cache = cache
+
+        self._cache = None
+
+    @staticmethod
+    def _perturb(variable, values, perturbation, sign=1):
+        """Return perturbed values and the size of the perturbation.
+
+        Negative relative perturbations are chosen to be symmetric in
+        log-space, i.e. the values are divided by ``1 + perturbation``.
+        """
+        if variable in ('T', 'Ts'):
+            step = sign * perturbation
+            return values + step, step
+        else:
+            factor = (1 + perturbation)**sign
+            return values * factor, np.log(factor)
+
+    def _get_tasks(self, atmosphere, surface):
+        """Build all perturbed values in bulk.
+
+        Returns:
+            list[tuple], dict: Perturbation tasks and the perturbation size
+            in the denominator of the finite difference for every variable.
+        """
+        signs = (1, -1) if self.centered else (1,)
+
+        tasks, steps = [], {}
+        for variable, perturbation in self.perturbations.items():
+            if variable == 'Ts':
+                component, name = 'surface', 'temperature'
+                values = surface[name][-1:]
+                indices = [(-1,)]
+            else:
+                component, name = 'atmosphere', variable
+                values = atmosphere[name][-1]
+                indices = [(-1, i) for i in range(values.size)]
+
+            steps[variable] = 0
+            for sign in signs:
+                perturbed, step = self._perturb(
+                    variable, values, perturbation, sign)
+
+                steps[variable] += abs(step)
+                tasks += [(component, name, index, value)
+                          for index, value in zip(indices, perturbed)]
+
+        return tasks, steps
+
+    def _get_cache_key(self, atmosphere, surface, cloud):
+        return (
+            atmosphere.snapshot().tobytes(),
+            float(surface['temperature'][-1]),
+            id(cloud),
+            tuple(cloud.get_version(var) for var in cloud.data_vars),
+            tuple(sorted(self.perturbations.items())),
+            self.centered,
+        )
+
+    def _evaluate(self, atmosphere, surface, cloud, tasks):
+        if self.processes is None or self.processes < 2:
+            return _evaluate_perturbations(
+                self.radiation, atmosphere, surface, cloud, tasks)
+
+        chunks = np.array_split(np.arange(len(tasks)), self.processes)
+        with ProcessPoolExecutor(self.processes) as executor:
+            futures = [
+                executor.submit(
+                    _evaluate_perturbations,
+                    self.radiation, atmosphere, surface, cloud,
+                    [tasks[i] for i in chunk],
+                )
+                for chunk in chunks
+            ]
+            return np.concatenate([f.result() for f in futures])
+
+    def calc_kernels(self, atmosphere, surface, cloud):
+        """Calculate radiative kernels for all perturbed variables.
+
+        Parameters:
+            atmosphere (konrad.atmosphere.Atmosphere): Atmosphere model.
+            surface (konrad.surface.Surface): Surface model.
+            cloud (konrad.cloud.Cloud): Cloud model.
+
+        Returns:
+            xarray.Dataset: Kernels of the net downward flux at the TOA
+            (``toa_<variable>``) and at the surface (``surface_<variable>``)
+            [W/m^2 per K or per unit ln(VMR)].
+        """
+        if self.cache:
+            key = self._get_cache_key(atmosphere, surface, cloud)
+            if self._cache is not None and self._cache[0] == key:
+                return self._cache[1]
+
+        tasks, steps = self._get_tasks(atmosphere, surface)
+        logger.info(f'Calculate radiative kernels ({len(tasks)} calls).')
+
+        fluxes = self._evaluate(atmosphere, surface, cloud, tasks)
+
+        # Evaluate the unperturbed state last. This leaves the radiation
+        # component consistent with the current model state.
+        self.radiation.update_heatingrates(atmosphere, surface, cloud)
+        reference = np.array(_net_fluxes(self.radiation))
+
+        dataset = xr.Dataset(coords={'plev': atmosphere['plev']})
+        start = 0
+        for variable in self.perturbations:
+            if variable == 'Ts':
+                size, dims = 1, ()
+            else:
+                size, dims = atmosphere['plev'].size, ('plev',)
+
+            if self.centered:
+                upper = fluxes[start:start + size]
+                lower = fluxes[start + size:start + 2 * size]
+                start += 2 * size
+            else:
+                upper = fluxes[start:start + size]
+                lower = reference
+                start += size
+
+            kernel = (upper - lower) / steps[variable]
+            for i, level in enumerate(('toa', 'surface')):
+                values = kernel[:, i] if dims else kernel[0, i]
+                dataset[f'{level}_{variable}'] = (dims, values)
+
+        dataset.attrs['centered'] = int(self.centered)
+
+        if self.cache:
+            # Only keep the latest state, kernels are often recalculated
+            # during a simulation.
+            self._cache = (key, dataset)
+
+        return dataset
+
+    def calc_forcing(self, atmosphere, surface, cloud, variable='CO2',
+                     factor=2):
+        """Calculate the instantaneous radiative forcing.
+
+        The given variable is scaled by ``factor`` at all levels.
+
+        Parameters:
+            atmosphere (konrad.atmosphere.Atmosphere): Atmosphere model.
+            surface (konrad.surface.Surface): Surface model.
+            cloud (konrad.cloud.Cloud): Cloud model.
+            variable (str): Atmospheric variable to perturb.
+            factor (float): Scaling factor.
+
+        Returns:
+            float, float: Forcing at the TOA and at the surface [W/m^2].
+        """
+        snapshot = atmosphere.snapshot()
+
+        atmosphere[variable] *= factor
+        self.radiation.update_heatingrates(atmosphere, surface, cloud)
+        perturbed = np.array(_net_fluxes(self.radiation))
+
+        atmosphere.restore(snapshot)
+        self.radiation.update_heatingrates(atmosphere, surface, cloud)
+        reference = np.array(_net_fluxes(self.radiation))
+
+        toa, sfc = perturbed - reference
+
+        return toa, sfc
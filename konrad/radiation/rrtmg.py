@@ -1,25 +1,62 @@
 """Define an interface for the RRTMG radiation scheme (through CliMT). """
-from copy import deepcopy
+from contextlib import contextmanager
 import numpy as np
 import datetime
 from sympl import DataArray
 from typhon.physics import vmr2specific_humidity
-import climt
 import logging
 
 from .radiation import Radiation
+from konrad import utils
 from konrad.cloud import ClearSky
 
 __all__ = [
     'RRTMG',
 ]
 
+# Mapping of konrad variable names and CliMT output names.
+_longwave_names = {
+    'lw_htngrt': 'air_temperature_tendency_from_longwave',
+    'lw_htngrt_clr':
+        'air_temperature_tendency_from_longwave_assuming_clear_sky',
+    'lw_flxu': 'upwelling_longwave_flux_in_air',
+    'lw_flxd': 'downwelling_longwave_flux_in_air',
+    'lw_flxu_clr': 'upwelling_longwave_flux_in_air_assuming_clear_sky',
+    'lw_flxd_clr': 'downwelling_longwave_flux_in_air_assuming_clear_sky',
+}
+
+_shortwave_names = {
+    'sw_htngrt': 'air_temperature_tendency_from_shortwave',
+    'sw_htngrt_clr':
+        'air_temperature_tendency_from_shortwave_assuming_clear_sky',
+    'sw_flxu': 'upwelling_shortwave_flux_in_air',
+    'sw_flxd': 'downwelling_shortwave_flux_in_air',
+    'sw_flxu_clr': 'upwelling_shortwave_flux_in_air_assuming_clear_sky',
+    'sw_flxd_clr': 'downwelling_shortwave_flux_in_air_assuming_clear_sky',
+}
+
+# Minimum cosine of the solar zenith angle of cached shortwave fluxes.
+# Fluxes close to sunrise or sunset are not rescaled to avoid large factors.
+_min_cached_mu = 0.1
+
+
+def _add_weighted(total, results, weight):
+    """Add weighted results to a dictionary of totals (or create it)."""
+    if total is None:
+        return {key: weight * value for key, value in results.items()}
+
+    for key, value in results.items():
+        total[key] += weight * value
+
+    return total
+
 
 class RRTMG(Radiation):
     """RRTMG radiation scheme using the CliMT python wrapper."""
 
     def __init__(self, *args, solar_constant=510, mcica=False,
-                 **kwargs):
+                 sw_timestep=None, diurnal_quadrature=None, mcica_samples=1,
+                 mcica_seed=None, **kwargs):
         """
         Parameters:
             zenith_angle (float): angle of the Sun [degrees].
@@ -42,6 +79,29 @@ class RRTMG(Radiation):
                     use the mcica version of RRTMG (needed for partly cloudy
                     skies)
 
+            sw_timestep (float or str): Interval between shortwave
+                calculations in runs with a diurnal cycle (see
+                :meth:`adjust_solar_angle`), e.g. ``'1h'``. In between, the
+                last shortwave fluxes are scaled with the cosine of the
+                current solar zenith angle. By default, the shortwave is
+                calculated in every call. Independent of this setting, the
+                shortwave calculation is skipped at night.
+
+            diurnal_quadrature (int): Number of Gauss-Legendre points in
+                hour angle used to calculate the diurnal-mean shortwave
+                fluxes. The ``zenith_angle`` then represents latitude
+                (no seasons). This resolves the zenith-angle dependence of
+                the shortwave in runs without diurnal cycle at a fraction of
+                the costs of a diurnal cycle. By default, a single
+                (effective) zenith angle is used.
+
+            mcica_samples (int): Number of MCICA realizations that are
+                averaged in every radiation call (only used with ``mcica``).
+                Averaging reduces the noise in the cloudy heating rates.
+
+            mcica_seed (int): Seed of the random numbers used by MCICA.
+                If given, the sequence of cloud realizations (and therefore
+                the simulation) is reproducible.
         """
         super().__init__(*args, **kwargs)
         self._state_lw = None
@@ -50,7 +110,7 @@ class RRTMG(Radiation):
         self._rad_lw = None
         self._rad_sw = None
 
-        self._is_mcica = mcica
+        self.mcica = mcica
 
         # These are set in the first call and depend on properties set in the
         # cloud class or instance.
@@ -59,11 +119,37 @@ class RRTMG(Radiation):
 
         self.solar_constant = solar_constant
 
+        self.sw_timestep = (None if sw_timestep is None
+                            else utils.parse_fraction_of_day(sw_timestep))
+        self.diurnal_quadrature = diurnal_quadrature
+
+        # Time of the current radiation call and shortwave fluxes (per unit
+        # cosine of the solar zenith angle) of the last shortwave call.
+        self._time = None
+        self._sw_cache = None
+
+        self.mcica_samples = mcica_samples
+        self.mcica_seed = mcica_seed
+        self._random = (None if mcica_seed is None
+                        else np.random.RandomState(mcica_seed))
+
+    def __getstate__(self):
+        state = super().__getstate__()
+        # The CliMT components wrap compiled Fortran code and can not be
+        # pickled. They are re-initialized in the next radiation call.
+        for name in ('_rad_lw', '_rad_sw', '_state_lw', '_state_sw'):
+            state[name] = None
+
+        return state
+
     def init_radiative_state(self, atmosphere, surface):
+        # CliMT is only imported when the radiation is calculated as
+        # importing the compiled Fortran extensions is slow.
+        import climt
 
         climt.set_constants_from_dict({"stellar_irradiance": {
                 "value": self.solar_constant, "units": 'W m^-2'}})
-        if self._is_mcica:
+        if self.mcica:
             overlap = 'maximum_random'
         else:
             overlap = 'random'
@@ -72,14 +158,14 @@ class RRTMG(Radiation):
             cloud_ice_properties=self._cloud_ice_properties,
             cloud_liquid_water_properties='radius_dependent_absorption',
             cloud_overlap_method=overlap,
-            mcica=self._is_mcica)
+            mcica=bool(self.mcica))
         self._rad_sw = climt.RRTMGShortwave(
             ignore_day_of_year=True,
             cloud_optical_properties=self._cloud_optical_properties,
             cloud_ice_properties=self._cloud_ice_properties,
             cloud_liquid_water_properties='radius_dependent_absorption',
             cloud_overlap_method=overlap,
-            mcica=self._is_mcica)
+            mcica=bool(self.mcica))
         state_lw = {}
         state_sw = {}
 
@@ -178,7 +264,18 @@ class RRTMG(Radiation):
         )
 
         for varname in props + sw_props if sw else props + lw_props:
-            state0[varname] = cloud[varname]
+            if (not self.mcica
+                    and varname == 'cloud_area_fraction_in_atmosphere_layer'):
+                # The nomcica version of RRTMG treats all cloudy layers as
+                # overcast (see `calc_cloudy_nomcica_radiation`). The overcast
+                # cloud fraction is kept in the CliMT state and updated in
+                # place, the cloud component itself is not modified.
+                if varname not in state0:
+                    state0[varname] = cloud[varname].copy()
+                np.not_equal(cloud[varname].values, 0,
+                             out=state0[varname].values)
+            else:
+                state0[varname] = cloud[varname]
 
     def update_radiative_state(self, atmosphere, surface, state0, sw=True):
         """ Update CliMT formatted atmospheric state using parameters from our
@@ -238,17 +335,21 @@ class RRTMG(Radiation):
 
         return state0
 
-    def radiative_fluxes(self, atmosphere, surface, cloud):
+    def radiative_fluxes(self, atmosphere, surface, cloud, longwave=True,
+                         shortwave=True):
         """Returns shortwave and longwave fluxes and heating rates.
 
         Parameters:
             atmosphere (konrad.atmosphere.Atmosphere): atmosphere model
             surface (konrad.surface): surface model
             cloud (konrad.cloud): cloud model
+            longwave (bool): Calculate longwave fluxes.
+            shortwave (bool): Calculate shortwave fluxes.
 
         Returns:
-            tuple: containing two dictionaries, one of air temperature
-            values and the other of fluxes and heating rates
+            tuple: containing the longwave and shortwave output of CliMT,
+            each a tuple of air temperature values and a dictionary of fluxes
+            and heating rates (``None`` if not calculated)
         """
         if self._state_lw is None or self._state_sw is None:  # first time only
             self._cloud_optical_properties = cloud._rrtmg_cloud_optical_properties
@@ -258,24 +359,51 @@ class RRTMG(Radiation):
             self.update_cloudy_radiative_state(cloud, self._state_lw, sw=False)
             self.update_cloudy_radiative_state(cloud, self._state_sw, sw=True)
 
-        # if there are clouds update the cloud properties for the radiation
-        if not isinstance(cloud, ClearSky):
-            self.update_cloudy_radiative_state(cloud, self._state_lw, sw=False)
-            self.update_cloudy_radiative_state(cloud, self._state_sw, sw=True)
+        lw_fluxes = sw_fluxes = None
+
+        if longwave:
+            # if there are clouds update the cloud properties for the radiation
+            if not isinstance(cloud, ClearSky):
+                self.update_cloudy_radiative_state(
+                    cloud, self._state_lw, sw=False)
+            self.update_radiative_state(atmosphere, surface, self._state_lw,
+                                        sw=False)
+            lw_fluxes = self._rad_lw(self._state_lw)
+
+        if shortwave:
+            if not isinstance(cloud, ClearSky):
+                self.update_cloudy_radiative_state(
+                    cloud, self._state_sw, sw=True)
+            self.update_radiative_state(atmosphere, surface, self._state_sw,
+                                        sw=True)
+            sw_fluxes = self._rad_sw(self._state_sw)
 
-        self.update_radiative_state(atmosphere, surface, self._state_lw,
-                                    sw=False)
-        self.update_radiative_state(atmosphere, surface, self._state_sw,
-                                    sw=True)
+        return lw_fluxes, sw_fluxes
 
-        lw_fluxes = self._rad_lw(self._state_lw)
-        sw_fluxes = self._rad_sw(self._state_sw)
+    def calc_cloudy_nomcica_radiation(self, atmosphere, surface, cloud,
+                                      longwave=True, shortwave=True):
+        """Returns fluxes and heating rates for partial cloud cover using
+        the nomcica version of RRTMG.
 
-        return lw_fluxes, sw_fluxes
+        All cloudy layers are treated as overcast, so that all wavelengths
+        see the cloud. The all-sky results are the overcast results and the
+        clear-sky results (which are calculated in the same RRTMG call)
+        weighted by the maximum cloud fraction.
 
-    def calc_cloudy_nomcica_radiation(self, atmosphere, surface, cloud):
+        Parameters:
+            atmosphere (konrad.atmosphere.Atmosphere): atmosphere model
+            surface (konrad.surface): surface model
+            cloud (konrad.cloud): cloud model
+            longwave (bool): Calculate longwave fluxes.
+            shortwave (bool): Calculate shortwave fluxes.
 
-        cloud_fraction = deepcopy(cloud['cloud_area_fraction_in_atmosphere_layer'][:])
+        Returns:
+            tuple: containing two dictionaries of longwave and shortwave
+            fluxes and heating rates with konrad variable names
+            (``None`` if not calculated)
+        """
+        cloud_fraction = (
+            cloud['cloud_area_fraction_in_atmosphere_layer'].values)
 
         if self._state_sw is None:  # first time only
             cf_cloudy = cloud_fraction[cloud_fraction != 0]
@@ -288,28 +416,159 @@ class RRTMG(Radiation):
 
         cf_max = np.max(cloud_fraction)
 
-        # Calculate overcast and clear sky radiative fluxes.
-        # Make all the cloudy layers overcast, so that the nomcica version of
-        # RRTMG can be used in the shortwave - all wavelengths see cloud.
-        # Use the same approach for the longwave for consistency.
-        cloud['cloud_area_fraction_in_atmosphere_layer'][cloud_fraction != 0] = 1
         lw_overcast, sw_overcast = self.radiative_fluxes(
-            atmosphere, surface, cloud
+            atmosphere, surface, cloud, longwave=longwave, shortwave=shortwave
         )
-        lw_fluxes, sw_fluxes = lw_overcast[1], sw_overcast[1]
 
-        # Combine overcast and clear sky fluxes and heating rates to get the
-        # all sky fluxes and heating rates.
-        for fluxes in lw_fluxes, sw_fluxes:
-            for key in fluxes.keys():
-                if 'clear_sky' not in key:
-                    clear_part = fluxes[key + '_assuming_clear_sky'][:]
-                    fluxes[key][:] *= cf_max  # weighted by cloud area fraction
-                    fluxes[key][:] += (1 - cf_max) * clear_part
+        return (
+            self._to_konrad(lw_overcast, _longwave_names, cf_max),
+            self._to_konrad(sw_overcast, _shortwave_names, cf_max),
+        )
 
-        cloud['cloud_area_fraction_in_atmosphere_layer'][:] *= cloud_fraction
+    def _to_konrad(self, output, names, cloud_fraction=None):
+        """Convert CliMT output into arrays with konrad variable names.
 
-        return lw_fluxes, sw_fluxes
+        All-sky and clear-sky results are gathered into the rows of a
+        single array. If a ``cloud_fraction`` is given, the all-sky row is
+        combined with the clear-sky row in a single operation.
+        The returned arrays are views of a newly allocated array, i.e.
+        references to results of previous calls remain valid.
+        """
+        if output is None:
+            return None
+
+        fluxes = output[1]
+        allsky = [key for key in names if not key.endswith('_clr')]
+        clearsky = [key + '_clr' for key in allsky]
+        sizes = [fluxes[names[key]].data.size for key in allsky]
+
+        buffer = np.empty((2, sum(sizes)))
+
+        for row, keys in zip(buffer, (allsky, clearsky)):
+            np.concatenate([fluxes[names[key]].data for key in keys], out=row)
+
+        if cloud_fraction is not None:
+            # all-sky = cf * overcast + (1 - cf) * clear-sky
+            buffer[0] -= buffer[1]
+            buffer[0] *= cloud_fraction
+            buffer[0] += buffer[1]
+
+        sections = np.cumsum(sizes)[:-1]
+        return {
+            key: part[np.newaxis]
+            for row, keys in zip(buffer, (allsky, clearsky))
+            for key, part in zip(keys, np.split(row, sections))
+        }
+
+    @contextmanager
+    def _random_state(self):
+        """Use the own random generator for the MCICA permutation seeds.
+
+        CliMT draws the seed of every MCICA call from the global NumPy
+        random generator, which is temporarily replaced.
+        """
+        if self._random is None:
+            yield
+            return
+
+        state = np.random.get_state()
+        np.random.set_state(self._random.get_state())
+        try:
+            yield
+        finally:
+            self._random.set_state(np.random.get_state())
+            np.random.set_state(state)
+
+    def _calc_fluxes(self, atmosphere, surface, cloud, longwave=True,
+                     shortwave=True):
+        """Return longwave and shortwave results with konrad names."""
+        if not self.mcica and not isinstance(cloud, ClearSky):
+            return self.calc_cloudy_nomcica_radiation(
+                atmosphere, surface, cloud, longwave, shortwave)
+
+        if not self.mcica or isinstance(cloud, ClearSky):
+            samples = 1
+        else:
+            samples = self.mcica_samples
+
+        lw = sw = None
+        with self._random_state():
+            for _ in range(samples):
+                lw_fluxes, sw_fluxes = self.radiative_fluxes(
+                    atmosphere, surface, cloud, longwave, shortwave)
+                lw_sample = self._to_konrad(lw_fluxes, _longwave_names)
+                sw_sample = self._to_konrad(sw_fluxes, _shortwave_names)
+
+                if samples == 1:
+                    return lw_sample, sw_sample
+
+                if longwave:
+                    lw = _add_weighted(lw, lw_sample, 1 / samples)
+                if shortwave:
+                    sw = _add_weighted(sw, sw_sample, 1 / samples)
+
+        return lw, sw
+
+    def _calc_diurnal_mean_shortwave(self, atmosphere, surface, cloud):
+        """Return the diurnal-mean shortwave using Gaussian quadrature."""
+        # The diurnal cycle is symmetric around noon, and the sun is above
+        # the horizon for hour angles smaller than 90 degrees (no seasons):
+        #   mean(F) = 1 / pi * int_0^(pi/2) F(h) dh
+        nodes, weights = np.polynomial.legendre.leggauss(
+            self.diurnal_quadrature)
+        hour_angles = np.pi / 4 * (nodes + 1)
+        weights = weights / 4
+
+        solar_angle = self.current_solar_angle
+        sw = None
+        try:
+            for hour_angle, weight in zip(hour_angles, weights):
+                self.current_solar_angle = np.rad2deg(np.arccos(
+                    np.cos(np.deg2rad(self.zenith_angle)) * np.cos(hour_angle)
+                ))
+                _, fluxes = self._calc_fluxes(
+                    atmosphere, surface, cloud, longwave=False)
+                sw = _add_weighted(sw, fluxes, weight)
+        finally:
+            self.current_solar_angle = solar_angle
+
+        return sw
+
+    def _calc_scheduled_shortwave(self, atmosphere, surface, cloud):
+        """Return shortwave results following the shortwave schedule."""
+        mu = np.cos(np.deg2rad(self.current_solar_angle))
+
+        if mu <= 0:
+            # Night: There is no need to call the shortwave scheme.
+            nlev = atmosphere['plev'].size
+            return {
+                key: np.zeros((1, nlev if 'htngrt' in key else nlev + 1))
+                for key in _shortwave_names
+            }
+
+        cache = self._sw_cache
+        if (self.sw_timestep is None or self._time is None or cache is None
+                or self._time < cache['time']
+                or self._time - cache['time'] >= self.sw_timestep - 1e-6):
+            _, sw = self._calc_fluxes(
+                atmosphere, surface, cloud, longwave=False)
+            if mu >= _min_cached_mu:
+                self._sw_cache = {
+                    'time': self._time,
+                    'mu': mu,
+                    'fluxes': {key: value.copy() for key, value in sw.items()},
+                }
+            return sw
+
+        scale = mu / max(cache['mu'], _min_cached_mu)
+        return {key: scale * value for key, value in cache['fluxes'].items()}
+
+    def adjust_solar_angle(self, time):
+        super().adjust_solar_angle(time)
+        if self._time is not None and time < self._time:
+            # New run (e.g. a branched experiment): Discard cached fluxes.
+            self._sw_cache = None
+        self._time = time
 
     def calc_radiation(self, atmosphere, surface, cloud):
         """Updates the shortwave, longwave and net heatingrates.
@@ -321,39 +580,15 @@ class RRTMG(Radiation):
             surface (konrad.surface): Surface model.
             cloud (konrad.cloud): cloud model
         """
-        if not self._is_mcica and not isinstance(cloud, ClearSky):
-            lw_fluxes, sw_fluxes = self.calc_cloudy_nomcica_radiation(
-                atmosphere, surface, cloud)
+        lw, _ = self._calc_fluxes(atmosphere, surface, cloud, shortwave=False)
+
+        if self.diurnal_quadrature:
+            sw = self._calc_diurnal_mean_shortwave(atmosphere, surface, cloud)
         else:
-            lw_dT_fluxes, sw_dT_fluxes = self.radiative_fluxes(
-                atmosphere, surface, cloud)
-            lw_fluxes = lw_dT_fluxes[1]
-            sw_fluxes = sw_dT_fluxes[1]
-
-        self['lw_htngrt'] = np.expand_dims(
-                lw_fluxes['air_temperature_tendency_from_longwave'].data, 0)
-        self['lw_htngrt_clr'] = np.expand_dims(
-                lw_fluxes['air_temperature_tendency_from_longwave_assuming_clear_sky'].data, 0)
-        self['lw_flxu'] = np.expand_dims(
-                lw_fluxes['upwelling_longwave_flux_in_air'].data, 0)
-        self['lw_flxd'] = np.expand_dims(
-                lw_fluxes['downwelling_longwave_flux_in_air'].data, 0)
-        self['lw_flxu_clr'] = np.expand_dims(
-                lw_fluxes['upwelling_longwave_flux_in_air_assuming_clear_sky'].data, 0)
-        self['lw_flxd_clr'] = np.expand_dims(
-                lw_fluxes['downwelling_longwave_flux_in_air_assuming_clear_sky'].data, 0)
-        self['sw_htngrt'] = np.expand_dims(
-                sw_fluxes['air_temperature_tendency_from_shortwave'].data, 0)
-        self['sw_htngrt_clr'] = np.expand_dims(
-                sw_fluxes['air_temperature_tendency_from_shortwave_assuming_clear_sky'].data, 0)
-        self['sw_flxu'] = np.expand_dims(
-                sw_fluxes['upwelling_shortwave_flux_in_air'].data, 0)
-        self['sw_flxd'] = np.expand_dims(
-                sw_fluxes['downwelling_shortwave_flux_in_air'].data, 0)
-        self['sw_flxu_clr'] = np.expand_dims(
-                sw_fluxes['upwelling_shortwave_flux_in_air_assuming_clear_sky'].data, 0)
-        self['sw_flxd_clr'] = np.expand_dims(
-                sw_fluxes['downwelling_shortwave_flux_in_air_assuming_clear_sky'].data, 0)
+            sw = self._calc_scheduled_shortwave(atmosphere, surface, cloud)
+
+        for key, value in {**lw, **sw}.items():
+            self[key] = value
 
         self.coords={
             'time': np.array([0]),
@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+"""In-memory recording of selected model variables.
+
+The :class:`TimeSeriesRecorder` stores the time series of a few variables
+without writing any output files. This is useful for interactive analysis
+and parameter sweeps, where the full netCDF output is not needed.
+
+**Example**
+
+    >>> import konrad
+    >>> recorder = konrad.recorder.TimeSeriesRecorder(
+    ...     variables=['surface/temperature', 'radiation/toa'])
+    >>> rce = konrad.RCE(atmosphere=..., recorder=recorder, writeevery='1d')
+    >>> rce.run()
+    >>> ds = recorder.to_dataset()
+    >>> ds['surface/temperature'].plot()
+"""
+import logging
+
+import numpy as np
+import xarray as xr
+
+from konrad import constants
+
+
+__all__ = [
+    'TimeSeriesRecorder',
+]
+
+logger = logging.getLogger(__name__)
+
+
+class TimeSeriesRecorder:
+    """Record the time series of selected model variables in memory.
+
+    Variables are selected by ``'<component>/<variable>'``, where
+    ``component`` is the name of the model component in the
+    :class:`~konrad.RCE` (e.g. ``'atmosphere'``, ``'surface'``,
+    ``'radiation'``). Profiles (e.g. ``'atmosphere/T'``) are recorded as a
+    whole.
+
+    The values are stored in preallocated arrays, whose size is doubled
+    whenever they are full. Therefore, recording a time step only costs a
+    single copy per variable.
+    """
+    def __init__(self, variables=('surface/temperature', 'radiation/toa'),
+                 capacity=256):
+        """
+        Parameters:
+            variables (list[str]): Variables to record.
+            capacity (int): Number of time steps that are preallocated.
+        """
+        self.variables = list(variables)
+        self.capacity = capacity
+
+        self._time = np.empty(capacity)
+        self._data = {}
+        self._dims = {}
+        self._coords = {}
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def _get_variable(self, rce, name):
+        """Return the current values of a variable and its dimensions."""
+        component_name, variable = name.split('/', 1)
+        component = getattr(rce, component_name)
+
+        try:
+            dims, values = component.data_vars[variable]
+        except KeyError:
+            raise KeyError(
+                f'Variable "{variable}" not found in "{component_name}".')
+
+        if dims is None:
+            dims = constants.variable_description.get(
+                variable, {}).get('dims', ())
+
+        values = np.asarray(values)
+        if 'time' in dims:
+            # Only keep the current time step.
+            values = np.take(values, -1, axis=dims.index('time'))
+            dims = tuple(d for d in dims if d != 'time')
+
+        return values, dims, component.coords
+
+    def _allocate(self, name, values, dims, coords):
+        self._data[name] = np.empty((self.capacity, *values.shape),
+                                    dtype=values.dtype)
+        self._dims[name] = dims
+
+        for dim in dims:
+            if dim in coords and dim not in self._coords:
+                self._coords[dim] = np.array(coords[dim])
+
+    def _grow(self):
+        """Double the size of all preallocated arrays."""
+        self.capacity *= 2
+        logger.debug(f'Grow recorder to {self.capacity} time steps.')
+
+        self._time = np.resize(self._time, self.capacity)
+        for name, data in self._data.items():
+            new = np.empty((self.capacity, *data.shape[1:]), dtype=data.dtype)
+            new[:self._size] = data[:self._size]
+            self._data[name] = new
+
+    def record(self, rce):
+        """Append the current values of all selected variables.
+
+        Parameters:
+            rce (konrad.RCE): RCE simulation.
+        """
+        if self._size == self.capacity:
+            self._grow()
+
+        for name in self.variables:
+            values, dims, coords = self._get_variable(rce, name)
+
+            if name not in self._data:
+                self._allocate(name, values, dims, coords)
+
+            self._data[name][self._size] = values
+
+        self._time[self._size] = rce.get_hours_passed()
+        self._size += 1
+
+    def clear(self):
+        """Remove all recorded time steps."""
+        self._size = 0
+
+    def to_dataset(self):
+        """Return all recorded time steps.
+
+        Returns:
+            xarray.Dataset: Dataset with a ``time`` dimension [hours] and one
+            variable per recorded ``'<component>/<variable>'``.
+        """
+        n = self._size
+        dataset = xr.Dataset(
+            data_vars={
+                name: (('time', *self._dims[name]), data[:n].copy())
+                for name, data in self._data.items()
+            },
+            coords={
+                'time': ('time', self._time[:n].copy(), {'units': 'hours'}),
+                **{dim: (dim, values) for dim, values in self._coords.items()},
+            },
+        )
+
+        return dataset
@@ -0,0 +1,100 @@
+"""Contiguous storage of the prognostic model state.
+
+All prognostic variables of an RCE simulation are stored in one contiguous
+array. The model components keep working on named views of this array,
+while copying, checkpointing and comparing the full model state becomes a
+single array operation.
+
+**Example**
+
+    >>> import konrad
+    >>> rce = konrad.RCE(atmosphere=...)
+    >>> snapshot = rce.state.copy()  # copy all prognostic variables at once
+    >>> rce.run()
+    >>> rce.state.restore(snapshot)  # reset the model to its initial state
+"""
+import numpy as np
+
+
+__all__ = [
+    'ModelState',
+]
+
+
+class ModelState:
+    """All prognostic variables of an RCE stored in one contiguous buffer.
+
+    The buffer holds all ``Atmosphere.atmosphere_variables`` followed by the
+    surface temperature. Both components are re-bound to views on the buffer
+    (see :meth:`konrad.component.Component.bind_variable`), so that they can
+    be used as before.
+    """
+    def __init__(self, atmosphere, surface):
+        """Create the model state and bind the components to it.
+
+        Parameters:
+            atmosphere (konrad.atmosphere.Atmosphere): Atmosphere model.
+            surface (konrad.surface.Surface): Surface model.
+        """
+        nvars = len(atmosphere.atmosphere_variables)
+        nlev = atmosphere['plev'].size
+        size = nvars * nlev
+
+        self.buffer = np.empty(size + 1)
+
+        # Store the atmospheric variables as one block to allow the
+        # atmosphere to keep operating on its own contiguous buffer.
+        atmosphere.bind_buffer(self.buffer[:size].reshape(nvars, 1, nlev))
+        surface.bind_variable('temperature', self.buffer[size:])
+
+        self.layout = {
+            f'atmosphere/{var}': slice(i * nlev, (i + 1) * nlev)
+            for i, var in enumerate(atmosphere.atmosphere_variables)
+        }
+        self.layout['surface/temperature'] = slice(size, size + 1)
+
+        self._components = {'atmosphere': atmosphere, 'surface': surface}
+
+    def __repr__(self):
+        return (f'<{self.__class__.__name__}({len(self.layout)} variables, '
+                f'size: {self.buffer.size}) object at {id(self)}>')
+
+    def __len__(self):
+        return self.buffer.size
+
+    def __getitem__(self, name):
+        """Return a flat view on a variable, e.g. ``state['atmosphere/T']``."""
+        return self.buffer[self.layout[name]]
+
+    @property
+    def variables(self):
+        """List of all variables in the order they are stored."""
+        return list(self.layout)
+
+    def copy(self):
+        """Return a copy of the full model state.
+
+        Returns:
+            ndarray: Copy of the state buffer.
+        """
+        return self.buffer.copy()
+
+    def restore(self, values):
+        """Overwrite the full model state.
+
+        The geopotential height of the atmosphere is updated to match the
+        restored temperature profile.
+
+        Parameters:
+            values (ndarray): Array of the same size as the state buffer,
+                e.g. the return value of :meth:`copy`.
+        """
+        self.buffer[:] = values
+        self.touch()
+        self._components['atmosphere'].update_height()
+
+    def touch(self):
+        """Mark all variables of the model state as changed."""
+        for name in self.layout:
+            component, variable = name.split('/')
+            self._components[component].touch(variable)
@@ -18,12 +18,12 @@ and use it in an RCE simulation.
 import abc
 import logging
 
-import netCDF4
 import numpy as np
 from scipy.interpolate import interp1d
 
 from . import constants
 from konrad.component import Component
+from konrad.netcdf import read_timestep
 
 
 __all__ = [
@@ -98,25 +98,30 @@ class Surface(Component, metaclass=abc.ABCMeta):
         """Create a surface model from a netCDF file.
 
         Parameters:
-            ncfile (str): Path to netCDF file.
+            ncfile (str): Path to netCDF file or Zarr store.
             timestep (int): Timestep to read (default is last timestep).
         """
-        with netCDF4.Dataset(ncfile) as root:
-            if 'surface' in root.groups:
-                dataset = root['surface']
-            else:
-                dataset = root
-
-            t = dataset['temperature'][timestep].data
-            z = float(dataset['height'][:])
+        data = read_timestep(
+            ncfile, 'surface', ['temperature', 'height'], timestep)
+        t = data['temperature']
+        kwargs.setdefault('height', float(data['height']))
 
         # TODO: Should other variables (e.g. albedo) also be read?
-        return cls(temperature=t, height=z, **kwargs)
+        return cls(temperature=t, **kwargs)
 
 
 class SlabOcean(Surface):
-    """Surface model with adjustable temperature."""
-    def __init__(self, *args, depth=50., heat_sink=0, **kwargs):
+    """Surface model with adjustable temperature.
+
+    By default, the surface temperature is integrated using an explicit
+    forward Euler step. Deep slabs can be spun up faster by using a
+    semi-implicit update and/or a reduced depth during the spin-up:
+
+        >>> surface = konrad.surface.SlabOcean(
+        ...     depth=50., semi_implicit=True, spinup_depth=1.)
+    """
+    def __init__(self, *args, depth=50., heat_sink=0, semi_implicit=False,
+                 spinup_depth=None, spinup_threshold=1., **kwargs):
         """
         Parameters:
             heat_sink(float): Flux of energy out of the surface [W m^-2]
@@ -124,6 +129,14 @@ class SlabOcean(Surface):
             albedo (float): Surface albedo, default 0.2
             temperature (float): Surface temperature [K], default 288
             height (float): Surface height [m], default 0
+            semi_implicit (bool): Use a semi-implicit temperature update
+                based on a linearized flux derivative (see :meth:`adjust`).
+            spinup_depth (float): Reduced ocean depth [m] that is used until
+                the surface energy imbalance falls below the
+                ``spinup_threshold`` for the first time.
+                By default, the full depth is used throughout.
+            spinup_threshold (float): Surface energy imbalance [W m^-2]
+                below which the spin-up is considered to be finished.
         """
         super().__init__(*args, **kwargs)
 
@@ -134,11 +147,68 @@ class SlabOcean(Surface):
         self.heat_capacity = self.rho * self.c_p * depth
         self.heat_sink = heat_sink
 
+        self.semi_implicit = semi_implicit
+        self.spinup_depth = spinup_depth
+        self.spinup_threshold = spinup_threshold
+
+        self._spinup = spinup_depth is not None
+        self._previous_flux = None
+
+    @property
+    def effective_heat_capacity(self):
+        """Heat capacity used in the current time step [J m^-2 K^-1]."""
+        if self._spinup:
+            return self.rho * self.c_p * self.spinup_depth
+
+        return self.heat_capacity
+
+    def get_flux_derivative(self, absorbed_flux):
+        r"""Estimate the derivative of the net surface flux.
+
+        The derivative consists of the change of the surface emission
+        :math:`4 \epsilon \sigma T_s^3` and the change of the absorbed
+        radiation (shortwave net and longwave down), which is estimated
+        using the values of the previous time step.
+
+        Parameters:
+            absorbed_flux (float): Absorbed radiative flux [W / m**2].
+
+        Returns:
+            float: Negative derivative of the net surface flux with respect
+            to the surface temperature :math:`-dF/dT_s` [W m^-2 K^-1].
+        """
+        Ts = self['temperature'][-1]
+
+        derivative = (4 * self.longwave_emissivity
+                      * constants.stefan_boltzmann * Ts**3)
+
+        # Only use the estimate from the previous time step if the surface
+        # temperature has changed noticeably. Otherwise, changes in the
+        # absorbed flux are dominated by the atmosphere.
+        if self._previous_flux is not None:
+            Ts_previous, absorbed_previous = self._previous_flux
+            if abs(Ts - Ts_previous) > 1e-3:
+                derivative -= (
+                    (absorbed_flux - absorbed_previous) / (Ts - Ts_previous)
+                )
+
+        # A negative value would amplify the temperature tendency.
+        # Fall back to the explicit scheme in this case.
+        return max(float(derivative), 0.)
+
     def adjust(self, sw_down, sw_up, lw_down, lw_up, timestep):
-        """Increase the surface temperature using given radiative fluxes. Take
+        r"""Increase the surface temperature using given radiative fluxes. Take
         into account a heat sink at the surface, as if heat is transported out
         of the tropics we are modelling.
 
+        In the semi-implicit mode the temperature change is given by
+
+        .. math::
+            \Delta T_s = \frac{\Delta t \cdot (F - F_\mathrm{sink})}
+                {C - \Delta t \cdot dF/dT_s}
+
+        where :math:`dF/dT_s` is estimated by :meth:`get_flux_derivative`.
+
         Parameters:
             sw_down (float): Shortwave downward flux [W / m**2].
             sw_up (float): Shortwave upward flux [W / m**2].
@@ -148,12 +218,23 @@ class SlabOcean(Surface):
         """
         timestep *= 24 * 60 * 60  # Convert timestep to seconds.
 
-        net_flux = (sw_down - sw_up) + (lw_down - lw_up)
+        absorbed_flux = (sw_down - sw_up) + lw_down
+        net_flux = absorbed_flux - lw_up
+        imbalance = net_flux - self.heat_sink
 
         logger.debug(f'Net flux: {net_flux:.2f} W /m^2')
 
-        self['temperature'] += (timestep * (net_flux - self.heat_sink) /
-                                self.heat_capacity)
+        if self._spinup and abs(imbalance) < self.spinup_threshold:
+            logger.info('Surface spin-up finished. Use full ocean depth.')
+            self._spinup = False
+
+        heat_capacity = self.effective_heat_capacity
+        if self.semi_implicit:
+            heat_capacity += timestep * self.get_flux_derivative(absorbed_flux)
+            self._previous_flux = (
+                float(self['temperature'][-1]), float(absorbed_flux))
+
+        self['temperature'] += timestep * imbalance / heat_capacity
 
         logger.debug("Surface temperature: {self['temperature'][0]:.4f} K")
 
@@ -0,0 +1,259 @@
+# -*- coding: utf-8 -*-
+"""Aggregate the output of many konrad simulations.
+
+Parameter sweeps result in a large number of output files. This module
+indexes all outputs in a directory and extracts their (final) states into
+one dataset with a ``run`` dimension. Model settings that differ between
+the runs are stored as coordinates along ``run``, so that the aggregated
+dataset can be queried without re-opening the individual files.
+
+**Example**
+
+    >>> import konrad
+    >>> ds = konrad.sweep.aggregate(
+    ...     'sweep/',
+    ...     variables=['surface/temperature', 'radiation/toa'],
+    ...     average=10,
+    ...     processes=8,
+    ...     outfile='sweep.nc',
+    ... )
+    >>> ds.set_index(run='atmosphere/CO2_scale')  # e.g. a custom attribute
+"""
+import glob
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import netCDF4
+import numpy as np
+import xarray as xr
+
+from konrad.netcdf import (is_zarr, list_groups, open_zarr_group,
+                           read_attributes, read_timestep)
+from konrad.utils import prefix_dict_keys
+
+
+__all__ = [
+    'find_outputs',
+    'read_metadata',
+    'extract',
+    'index_outputs',
+    'aggregate',
+]
+
+logger = logging.getLogger(__name__)
+
+
+def find_outputs(directory, patterns=('*.nc', '*.zarr')):
+    """Return a sorted list of all konrad outputs in a directory.
+
+    Parameters:
+        directory (str): Directory to search in.
+        patterns (tuple[str]): Filename patterns.
+
+    Returns:
+        list[str]: Paths to output files.
+    """
+    paths = []
+    for pattern in patterns:
+        paths += glob.glob(os.path.join(directory, pattern))
+
+    return sorted(paths)
+
+
+def read_metadata(filename):
+    """Read global attributes and component settings of an output file.
+
+    The component settings are the attributes written by
+    :meth:`konrad.netcdf.OutputHandler.create_group`, i.e. the ``class`` of
+    every component and all scalar variables.
+
+    Parameters:
+        filename (str): Path to netCDF file or Zarr store.
+
+    Returns:
+        dict: Metadata with keys ``'<group>/<attribute>'``, e.g.
+        ``'surface/class'`` or ``'surface/heat_sink'``.
+    """
+    metadata = read_attributes(filename)
+
+    for group in list_groups(filename):
+        metadata.update(
+            prefix_dict_keys(read_attributes(filename, group), group))
+
+    metadata['path'] = str(filename)
+
+    return metadata
+
+
+def extract(filename, variables, average=None):
+    """Extract the final (or time-averaged) state of selected variables.
+
+    Parameters:
+        filename (str): Path to netCDF file or Zarr store.
+        variables (list[str]): Variables given as ``'<group>/<variable>'``.
+        average (int): Average over the last ``average`` output steps.
+            By default, the last output step is returned. Variables with a
+            reduced output frequency are read at their last written step.
+
+    Returns:
+        dict: Values of all variables.
+
+    Raises:
+        KeyError: If a variable is not found.
+    """
+    timestep = -1 if average is None else slice(-average, None)
+
+    groups = {}
+    for name in variables:
+        group, variable = name.split('/', 1)
+        groups.setdefault(group, []).append(variable)
+
+    values = {}
+    for group, group_variables in groups.items():
+        data = read_timestep(filename, group, group_variables, timestep)
+        for variable, value in data.items():
+            if average is not None and value.ndim > 0:
+                # Time is the leading dimension of all konrad variables.
+                value = np.nanmean(value, axis=0)
+            values[f'{group}/{variable}'] = value
+
+    missing = set(variables) - set(values)
+    if missing:
+        raise KeyError(
+            f'Variables {sorted(missing)} not found in "{filename}".')
+
+    return values
+
+
+def _index_and_extract(filename, variables, average):
+    return read_metadata(filename), extract(filename, variables, average)
+
+
+def _map(func, iterables, processes=None):
+    if processes is None or processes < 2:
+        return list(map(func, *iterables))
+
+    with ProcessPoolExecutor(processes) as executor:
+        return list(executor.map(func, *iterables))
+
+
+def index_outputs(paths, processes=None):
+    """Read the metadata of many outputs.
+
+    Parameters:
+        paths (str or list[str]): Directory or list of output files.
+        processes (int): Number of processes used to read the files.
+
+    Returns:
+        list[dict]: Metadata of every output (see :func:`read_metadata`).
+    """
+    if isinstance(paths, str):
+        paths = find_outputs(paths)
+
+    return _map(read_metadata, [paths], processes=processes)
+
+
+def _parameter_coords(metadata, parameters=None):
+    """Return coordinates for all parameters that differ between runs."""
+    if parameters is None:
+        # Use the keys of all runs as settings may be missing in some runs.
+        keys = [
+            key for key in dict.fromkeys(k for m in metadata for k in m)
+            if key not in ('created', 'path')
+        ]
+        parameters = [
+            key for key in keys
+            if len({str(m.get(key)) for m in metadata}) > 1
+        ]
+
+    coords = {}
+    for key in parameters:
+        values = [m.get(key) for m in metadata]
+        if any(isinstance(v, str) or v is None for v in values):
+            values = [str(v) for v in values]
+        coords[key] = ('run', np.array(values))
+
+    return coords
+
+
+def aggregate(paths, variables, average=None, parameters=None,
+              processes=None, outfile=None):
+    """Aggregate the final states of many outputs into a single dataset.
+
+    Parameters:
+        paths (str or list[str]): Directory or list of output files.
+        variables (list[str]): Variables given as ``'<group>/<variable>'``.
+        average (int): Average over the last ``average`` output steps.
+            By default, the last output step is used.
+        parameters (list[str]): Metadata keys (see :func:`read_metadata`)
+            that are stored as coordinates along ``run``. By default, all
+            settings that differ between the runs are used.
+        processes (int): Number of processes used to read the files.
+        outfile (str): Write the aggregated dataset to a netCDF file or Zarr
+            store. Slashes are replaced by dots in all names as they are
+            not allowed in netCDF variable names. The file is never read as
+            an output, even if it is located in the searched directory.
+
+    Returns:
+        xarray.Dataset: Dataset with dimension ``run``. The path of every
+        output is stored in the coordinate ``path``.
+    """
+    if isinstance(paths, str):
+        paths = find_outputs(paths)
+
+    if outfile is not None:
+        # Skip the result of a previous aggregation into the same directory.
+        paths = [p for p in paths
+                 if os.path.abspath(p) != os.path.abspath(outfile)]
+
+    if len(paths) == 0:
+        raise ValueError('No output files found.')
+
+    logger.info(f'Aggregate {len(paths)} output files.')
+    results = _map(
+        _index_and_extract,
+        [paths, [variables] * len(paths), [average] * len(paths)],
+        processes=processes,
+    )
+    metadata = [result[0] for result in results]
+    states = [result[1] for result in results]
+
+    # Use the dimension names and coordinates of the first output.
+    data_vars = {}
+    for name in variables:
+        group, variable = name.split('/', 1)
+        dims = tuple(
+            d for d in _get_dims(paths[0], group, variable) if d != 'time')
+        data_vars[name] = (
+            ('run', *dims), np.stack([state[name] for state in states]))
+
+    dims = sorted(set(d for dims, _ in data_vars.values() for d in dims[1:]))
+    coords = {
+        **read_timestep(paths[0], variables=dims),
+        'path': ('run', np.array(paths)),
+        **_parameter_coords(metadata, parameters),
+    }
+
+    dataset = xr.Dataset(data_vars, coords=coords)
+
+    if outfile is not None:
+        output = dataset.rename(
+            {name: name.replace('/', '.') for name in dataset.variables
+             if '/' in name})
+        if is_zarr(outfile):
+            output.to_zarr(outfile, mode='w')
+        else:
+            output.to_netcdf(outfile)
+
+    return dataset
+
+
+def _get_dims(filename, group, variable):
+    """Return the dimension names of a variable."""
+    if is_zarr(filename):
+        array = open_zarr_group(filename)[f'{group}/{variable}']
+        return tuple(array.attrs.get('_ARRAY_DIMENSIONS', ()))
+
+    with netCDF4.Dataset(filename) as root:
+        return root[group][variable].dimensions
@@ -1,3 +1,4 @@
+import pickle
 from os.path import (dirname, join)
 
 import numpy as np
@@ -51,6 +52,38 @@ class TestAtmosphere:
         with pytest.raises(TypeError):
             atmosphere.Atmosphere.from_netcdf('dummy.nc', surface=None)
 
+    def test_contiguous_buffer(self, atmosphere_obj):
+        """Test that all atmospheric variables share one buffer."""
+        for var in atmosphere_obj.atmosphere_variables:
+            assert atmosphere_obj[var].base is atmosphere_obj._buffer
+
+    def test_pickle(self, atmosphere_obj):
+        """Test that the shared buffer survives pickling."""
+        atmosphere_new = pickle.loads(pickle.dumps(atmosphere_obj))
+        atmosphere_new['T'] += 1
+
+        assert np.allclose(atmosphere_new['T'], atmosphere_obj['T'] + 1)
+        assert np.allclose(atmosphere_new._buffer[0], atmosphere_new['T'])
+
+    def test_copy(self, atmosphere_obj):
+        """Test that copies do not share memory with the original."""
+        atmosphere_new = atmosphere_obj.copy()
+        atmosphere_new['T'] += 1
+
+        assert np.allclose(atmosphere_new['T'], atmosphere_obj['T'] + 1)
+        assert np.allclose(atmosphere_new['z'], atmosphere_obj['z'])
+        assert atmosphere_new['T'].base is atmosphere_new._buffer
+
+    def test_snapshot_restore(self, atmosphere_obj):
+        """Test restoring the atmospheric state from a snapshot."""
+        T = atmosphere_obj['T'].copy()
+        snapshot = atmosphere_obj.snapshot()
+
+        atmosphere_obj['T'] += 1
+        atmosphere_obj.restore(snapshot)
+
+        assert np.allclose(atmosphere_obj['T'], T)
+
     def test_refine_plev(self, atmosphere_obj):
         """Test refinement of pressure grid."""
         phlev = np.array([1000e2, 500e2, 10e2])
@@ -0,0 +1,43 @@
+import json
+
+import numpy as np
+
+from konrad import cli
+from konrad.netcdf import open_output
+
+
+def _experiment(name, outfile):
+    return {
+        'experiment': name,
+        'atmosphere': {'num': 20},
+        'radiation': {'class': 'GreyRadiation', 'optical_thickness': 3.},
+        'timestep': '12h',
+        'max_duration': '2d',
+        'writeevery': '1d',
+        'outfile': outfile,
+    }
+
+
+def test_main(tmp_path):
+    outfiles = [str(tmp_path / f'{name}.nc') for name in ('a', 'b')]
+    filename = str(tmp_path / 'experiments.json')
+    with open(filename, 'w') as f:
+        json.dump([_experiment(name, outfile)
+                   for name, outfile in zip('ab', outfiles)], f)
+
+    assert cli.main([filename]) == 0
+
+    for outfile in outfiles:
+        T = open_output(outfile)['atmosphere/T']
+        assert T.sizes['time'] > 1
+        assert np.all(np.isfinite(T))
+
+
+def test_main_failure(tmp_path):
+    filename = str(tmp_path / 'experiments.json')
+    experiment = _experiment('a', str(tmp_path / 'a.nc'))
+    experiment['radiation']['class'] = 'Foo'
+    with open(filename, 'w') as f:
+        json.dump([experiment], f)
+
+    assert cli.main([filename]) == 1
@@ -0,0 +1,102 @@
+import numpy as np
+import pytest
+
+from konrad.component import Component
+
+
+@pytest.fixture
+def component():
+    c = Component()
+    c.create_variable('foo', data=np.arange(5.), dims=('index',))
+
+    return c
+
+
+class TestComponent:
+    def test_version_setitem(self, component):
+        """Test that assigning a variable increases its version."""
+        version = component.get_version('foo')
+        component['foo'] = np.zeros(5)
+
+        assert component.get_version('foo') == version + 1
+
+    def test_version_set(self, component):
+        """Test that setting values increases the version."""
+        version = component.get_version('foo')
+        component.set('foo', 42)
+
+        assert component.get_version('foo') == version + 1
+
+    def test_version_modify(self, component):
+        """Test that in-place modifications increase the version."""
+        version = component.get_version('foo')
+        with component.modify('foo') as foo:
+            foo[0] = 42
+
+        assert component['foo'][0] == 42
+        assert component.get_version('foo') == version + 1
+
+    def test_version_unknown(self, component):
+        """Test the version of a variable that has never been set."""
+        assert component.get_version('bar') == 0
+
+    def test_observer(self, component):
+        """Test the notification of observers."""
+        changes = []
+        component.add_observer(lambda c, var: changes.append(var))
+        component.set('foo', 0)
+
+        assert changes == ['foo']
+
+    def test_bind_variable(self, component):
+        """Test that bound variables are stored in the given array."""
+        buffer = np.zeros((2, 5))
+        component.bind_variable('foo', buffer[1])
+        component['foo'] = np.ones(5)
+
+        assert np.all(buffer[1] == 1)
+        assert np.all(component['foo'] == 1)
+        assert component['foo'].base is buffer
+
+    def test_bind_variable_shape(self, component):
+        """Test that assignments are broadcast into bound arrays."""
+        buffer = np.zeros((2, 1, 5))
+        view = buffer[1]
+        component.bind_variable('foo', view, dims=('time', 'index'))
+        component['foo'] = 3
+        assert np.all(buffer[1] == 3)
+
+        component['foo'] = np.arange(5)
+        assert component['foo'] is view
+        assert np.all(buffer[1, 0] == np.arange(5))
+
+        with pytest.raises(ValueError):
+            component['foo'] = np.ones(3)
+        assert component['foo'] is view
+
+    def test_attributes(self, component):
+        """Test that public attributes are indexed in `attrs`."""
+        component.bar = 42
+        component._baz = 23
+
+        # Values are stored in the instance dictionary (fast attribute
+        # lookup) and are not resolved by a `__getattr__` fallback.
+        assert component.__dict__['bar'] == 42
+        assert not hasattr(Component, '__getattr__')
+        assert component.attrs == {'bar': 42}
+
+        del component.bar
+        assert not hasattr(component, 'bar')
+        assert component.attrs == {}
+
+    def test_class_attribute(self):
+        """Test that instance attributes shadow class attributes."""
+        class Foo(Component):
+            bar = 1
+
+        foo = Foo()
+        foo.bar = 2
+
+        assert foo.bar == 2
+        assert foo.attrs['bar'] == 2
+        assert Foo.bar == 1
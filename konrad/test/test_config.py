@@ -0,0 +1,41 @@
+import json
+
+import numpy as np
+import pytest
+
+from konrad import config
+from konrad.humidity import (FixedRH, VerticallyUniform)
+
+
+def test_create_component():
+    humidity = config.create_component(
+        {
+            'class': 'FixedRH',
+            'rh_func': {'class': 'VerticallyUniform', 'rh_surface': 0.5},
+        },
+        module='konrad.humidity',
+    )
+
+    assert isinstance(humidity, FixedRH)
+    assert isinstance(humidity._rh_func, VerticallyUniform)
+    assert humidity._rh_func.rh_surface == 0.5
+
+
+def test_unknown_class():
+    with pytest.raises(ValueError):
+        config.create_component({'class': 'Foo'}, module='konrad.humidity')
+
+
+def test_create_atmosphere():
+    atmosphere = config.create_atmosphere({'num': 50, 'CO2': 560e-6})
+
+    assert atmosphere['phlev'].size == 50
+    assert np.all(atmosphere['CO2'] == 560e-6)
+
+
+def test_load(tmp_path):
+    filename = str(tmp_path / 'experiments.json')
+    with open(filename, 'w') as f:
+        json.dump([{'experiment': 'a'}, {'experiment': 'b'}], f)
+
+    assert [c['experiment'] for c in config.load(filename)] == ['a', 'b']
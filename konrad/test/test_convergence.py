@@ -0,0 +1,74 @@
+from types import SimpleNamespace
+
+import numpy as np
+
+from konrad import convergence
+
+
+def _rce(Ts, timestep=1.):
+    """Return a minimal stand-in for an RCE simulation."""
+    return SimpleNamespace(
+        timestep=timestep,
+        surface={'temperature': np.array([Ts])},
+    )
+
+
+class TestConvergence:
+    def test_surface_temperature_trend(self):
+        """Test the trend estimate of the ring buffer."""
+        criterion = convergence.SurfaceTemperatureTrend(window='5d')
+        for i in range(12):
+            criterion.update(_rce(Ts=300 + 0.5 * i))
+
+        assert np.isclose(criterion['surface_temperature_trend'][-1], 0.5)
+        assert not criterion.is_converged()
+
+    def test_not_converged_before_first_update(self):
+        """Test that criteria are not fulfilled without diagnostics."""
+        criterion = convergence.TemperatureTendency()
+
+        assert not criterion.is_converged()
+
+    def test_temperature_tendency_window(self):
+        """Test that noise in the temperature tendency is averaged out."""
+        criterion = convergence.TemperatureTendency(delta=1e-3, window='4d')
+
+        for i in range(10):
+            rce = _rce(Ts=300)
+            rce.deltaT = np.full(3, (-1)**i * 0.1)
+            criterion.update(rce)
+
+        assert np.isclose(criterion['temperature_tendency'][-1], 0)
+        assert criterion.is_converged()
+
+    def test_combined(self):
+        """Test that all criteria have to be fulfilled."""
+        trend = convergence.SurfaceTemperatureTrend(window='3d')
+        combined = convergence.Combined(
+            trend, convergence.TemperatureTendency())
+
+        for _ in range(3):
+            rce = _rce(Ts=300)
+            rce.deltaT = np.zeros(3)
+            combined.update(rce)
+
+        assert trend.is_converged()
+        assert combined.is_converged()
+        assert 'temperature_tendency' in combined.data_vars
+
+    def test_gregory_regression(self):
+        """Test the streaming fit of a linear Gregory relation."""
+        criterion = convergence.GregoryRegression(
+            threshold=1e-6, window='3d', spinup='1d')
+
+        for i in range(10):
+            dT = 0.1 * i
+            rce = _rce(Ts=300 + dT)
+            rce.get_hours_passed = lambda i=i: 24. * i
+            rce.radiation = {'toa': np.array([4 - 2 * dT])}
+            criterion.update(rce)
+
+        assert np.isclose(criterion['gregory_forcing'][-1], 4)
+        assert np.isclose(criterion['gregory_feedback'][-1], -2)
+        assert np.isclose(criterion['equilibrium_warming'][-1], 2)
+        assert criterion.is_converged()
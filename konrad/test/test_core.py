@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+import konrad
+from konrad.netcdf import (OutputSpecification, create_output_handler,
+                           open_output)
+
+
+@pytest.mark.parametrize('suffix', ['.nc', '.zarr'])
+def test_from_netcdf(tmp_path, suffix):
+    """Test that an RCE can be re-created from its output."""
+    if suffix == '.zarr':
+        pytest.importorskip('zarr')
+    filename = str(tmp_path / f'output{suffix}')
+
+    atmosphere = konrad.atmosphere.Atmosphere(
+        konrad.utils.get_quadratic_pgrid(num=50))
+    rce = konrad.RCE(
+        atmosphere,
+        radiation=konrad.radiation.GreyRadiation(optical_thickness=3.),
+        surface=konrad.surface.SlabOcean(depth=10, temperature=295.),
+        humidity=konrad.humidity.FixedRH(
+            konrad.humidity.VerticallyUniform(rh_surface=0.6)),
+        timestep='12h',
+        experiment='test',
+    )
+    rce.atmosphere['T'] += 1
+    create_output_handler(filename, rce).write()
+
+    new = konrad.RCE.from_netcdf(filename)
+
+    assert new.experiment == 'test'
+    assert new.timestep == 0.5
+    assert new.surface.depth == 10
+    assert isinstance(new.radiation, konrad.radiation.GreyRadiation)
+    assert new.radiation.optical_thickness == 3.
+    assert new.surface['temperature'] == 295.
+    assert new.humidity._rh_func.rh_surface == 0.6
+    assert new.surface.spinup_depth is None
+    assert np.allclose(new.atmosphere['T'], rce.atmosphere['T'])
+
+
+def test_from_netcdf_frequency(tmp_path):
+    """Test re-creating an RCE from output with a decimated variable."""
+    filename = str(tmp_path / 'output.nc')
+
+    rce = konrad.RCE(
+        konrad.atmosphere.Atmosphere(
+            konrad.utils.get_quadratic_pgrid(num=20)),
+        radiation=konrad.radiation.GreyRadiation(optical_thickness=3.),
+        timestep='12h',
+        writeevery='12h',
+        max_duration='4d',
+        outfile=filename,
+        output_spec=OutputSpecification(frequency={'atmosphere/T': 3}),
+    )
+    rce.run()
+
+    T = open_output(filename)['atmosphere/T'].values
+    assert np.all(np.isnan(T[-1]))
+
+    new = konrad.RCE.from_netcdf(filename)
+    last = T[~np.isnan(T).all(axis=1)][-1]
+    assert np.array_equal(new.atmosphere['T'][-1], last)
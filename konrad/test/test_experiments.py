@@ -0,0 +1,115 @@
+import numpy as np
+import pytest
+
+import konrad
+from konrad import experiments
+from konrad.radiation import Radiation
+
+
+class _ConstantRadiation(Radiation):
+    """Radiation with constant fluxes and no atmospheric heating."""
+    def calc_radiation(self, atmosphere, surface, cloud):
+        phlev = atmosphere['phlev']
+        Ts = surface['temperature'][-1]
+        fluxes = {
+            'lw_flxu': 0.6 * konrad.constants.stefan_boltzmann * Ts**4,
+            'lw_flxd': 0.,
+            'sw_flxu': 90.,
+            'sw_flxd': 340.,
+        }
+        for name, value in fluxes.items():
+            self[name] = np.full((1, phlev.size), value)
+            self[name + '_clr'] = self[name].copy()
+
+        for name in ('lw_htngrt', 'sw_htngrt'):
+            self[name] = np.zeros((1, phlev.size - 1))
+            self[name + '_clr'] = self[name].copy()
+
+        self.coords = {
+            'time': np.array([0]),
+            'phlev': phlev,
+            'plev': atmosphere['plev'],
+        }
+
+
+@pytest.fixture
+def control():
+    atmosphere = konrad.atmosphere.Atmosphere(
+        konrad.utils.get_quadratic_pgrid(num=30))
+
+    return konrad.RCE(
+        atmosphere,
+        radiation=_ConstantRadiation(),
+        surface=konrad.surface.SlabOcean(depth=1),
+        timestep='12h',
+        max_duration='2d',
+    )
+
+
+def test_branch(control):
+    branches = experiments.branch(
+        control,
+        perturbations={
+            'control': lambda rce: None,
+            'warm': experiments.Shift('temperature', 4, component='surface'),
+            '4xCO2': experiments.Scale('CO2', 4),
+        },
+        max_duration='1d',
+    )
+
+    assert branches['warm'].niter == 2
+    assert branches['warm'].experiment == 'warm'
+    assert np.allclose(
+        branches['4xCO2'].atmosphere['CO2'], 4 * control.atmosphere['CO2'])
+
+    # The control simulation itself is not modified.
+    assert control.niter == 0
+    assert (branches['warm'].surface['temperature']
+            > branches['control'].surface['temperature'])
+
+
+class _CO2Radiation(_ConstantRadiation):
+    """Outgoing longwave radiation decreases logarithmically with CO2."""
+    def calc_radiation(self, atmosphere, surface, cloud):
+        super().calc_radiation(atmosphere, surface, cloud)
+        self['lw_flxu'] -= 5.35 * np.log(atmosphere['CO2'][0, -1] / 348e-6)
+
+
+@pytest.mark.parametrize('method', ['brentq', 'secant'])
+def test_find_equilibrium_co2(method):
+    atmosphere = konrad.atmosphere.Atmosphere(
+        konrad.utils.get_quadratic_pgrid(num=30))
+    rce = konrad.RCE(
+        atmosphere,
+        radiation=_CO2Radiation(),
+        surface=konrad.surface.FixedTemperature(temperature=292.,
+                                                heat_sink=0.),
+        timestep='12h',
+    )
+
+    factor = experiments.find_equilibrium_co2(rce, method=method)
+
+    # Analytic solution for the imbalance at 292 K.
+    Ts = 292.
+    imbalance = 250. - 0.6 * konrad.constants.stefan_boltzmann * Ts**4
+    assert np.isclose(np.log(factor), -imbalance / 5.35, atol=1e-3)
+    assert np.isclose(rce.atmosphere['CO2'][0, -1], factor * 348e-6)
+
+
+def test_find_equilibrium_co2_duration():
+    atmosphere = konrad.atmosphere.Atmosphere(
+        konrad.utils.get_quadratic_pgrid(num=30))
+    rce = konrad.RCE(
+        atmosphere,
+        radiation=_CO2Radiation(),
+        surface=konrad.surface.FixedTemperature(temperature=292.,
+                                                heat_sink=0.),
+        timestep='12h',
+    )
+    rce.niter = 5
+
+    experiments.find_equilibrium_co2(rce, duration='1d')
+
+    # The sub-runs do not change the time or the convergence history.
+    assert rce.niter == 5
+    assert np.isnan(rce.convergence['temperature_tendency'])
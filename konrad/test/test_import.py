@@ -0,0 +1,31 @@
+import subprocess
+import sys
+
+import konrad
+
+
+def _run(code):
+    """Run Python code in a fresh interpreter and return its output."""
+    return subprocess.run(
+        [sys.executable, '-c', code],
+        check=True,
+        stdout=subprocess.PIPE,
+        universal_newlines=True,
+    ).stdout
+
+
+def test_lazy_import():
+    """Test that heavy dependencies are not imported with the package."""
+    output = _run(
+        'import sys, konrad; '
+        'print(*[m in sys.modules for m in '
+        '("climt", "matplotlib", "typhon", "xarray", "konrad.core")])'
+    )
+
+    assert output.split() == ['False'] * 5
+
+
+def test_attributes():
+    assert konrad.RCE is konrad.core.RCE
+    assert konrad.open_output is konrad.netcdf.open_output
+    assert 'radiation' in dir(konrad)
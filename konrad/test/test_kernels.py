@@ -0,0 +1,104 @@
+import numpy as np
+import pytest
+
+import konrad
+from konrad.radiation.kernels import RadiativeKernels
+
+
+TAU = 2.
+
+
+@pytest.fixture
+def model():
+    """Isothermal atmosphere above a surface of the same temperature."""
+    atmosphere = konrad.atmosphere.Atmosphere(
+        konrad.utils.get_quadratic_pgrid(num=30))
+    surface = konrad.surface.FixedTemperature(temperature=288.)
+    with atmosphere.modify('T') as T:
+        T[:] = 288.
+    cloud = konrad.cloud.ClearSky(atmosphere['plev'].size)
+
+    return atmosphere, surface, cloud
+
+
+def _kernels(**kwargs):
+    return RadiativeKernels(
+        konrad.radiation.GreyRadiation(optical_thickness=TAU),
+        perturbations={'T': 1., 'Ts': 1.},
+        **kwargs,
+    )
+
+
+def _planck(T):
+    return 4 * konrad.constants.stefan_boltzmann * T**3
+
+
+def test_surface_temperature_kernel(model):
+    kernels = {
+        centered: _kernels(centered=centered).calc_kernels(*model)
+        for centered in (False, True)
+    }
+
+    # Surface emission is attenuated by the full optical thickness.
+    expected = -_planck(288.) * np.exp(-TAU)
+    errors = {
+        centered: abs(ds['toa_Ts'] - expected) / abs(expected)
+        for centered, ds in kernels.items()
+    }
+    assert errors[True] < 1e-4
+    assert errors[True] < errors[False] < 0.01
+    assert kernels[True].attrs['centered'] == 1
+
+    # The downward flux at the surface does not depend on the surface.
+    assert np.isclose(kernels[True]['surface_Ts'], -_planck(288.), rtol=1e-4)
+
+
+def test_temperature_kernel(model):
+    ds = _kernels(centered=True).calc_kernels(*model)
+
+    # Warming any level increases the outgoing and downward radiation.
+    assert np.all(ds['toa_T'] < 0)
+    assert np.all(ds['surface_T'] > 0)
+    assert np.isclose(
+        ds['toa_T'].sum(), -_planck(288.) * (1 - np.exp(-TAU)), rtol=1e-4)
+
+
+def test_cache(model):
+    atmosphere, surface, cloud = model
+    kernels = _kernels()
+
+    ds = kernels.calc_kernels(atmosphere, surface, cloud)
+    assert kernels.calc_kernels(atmosphere, surface, cloud) is ds
+
+    atmosphere['T'] += 1
+    assert kernels.calc_kernels(atmosphere, surface, cloud) is not ds
+
+    # Only the kernels of the latest state are kept.
+    atmosphere['T'] -= 1
+    assert kernels.calc_kernels(atmosphere, surface, cloud) is not ds
+
+
+def test_processes(model):
+    sequential = _kernels().calc_kernels(*model)
+    parallel = _kernels(processes=2).calc_kernels(*model)
+
+    for name in sequential.data_vars:
+        assert np.allclose(sequential[name], parallel[name])
+
+
+def test_calc_forcing(model):
+    atmosphere, surface, cloud = model
+    T = atmosphere['T'].copy()
+
+    toa, sfc = _kernels().calc_forcing(
+        atmosphere, surface, cloud, variable='T', factor=1.01)
+
+    assert toa < 0
+    assert sfc > 0
+    assert np.isclose(
+        toa, -_planck(288.) * 2.88 * (1 - np.exp(-TAU)), rtol=0.05)
+
+    # The atmosphere is restored and the variable not used by the grey
+    # scheme does not force.
+    assert np.array_equal(atmosphere['T'], T)
+    assert _kernels().calc_forcing(atmosphere, surface, cloud) == (0, 0)
@@ -0,0 +1,28 @@
+import pickle
+
+import numpy as np
+
+import konrad
+
+
+def test_moist_lapse_rate_cache():
+    atmosphere = konrad.atmosphere.Atmosphere(
+        konrad.utils.get_quadratic_pgrid(num=30))
+    lapse = konrad.lapserate.MoistLapseRate()
+
+    cached = lapse(atmosphere)
+    assert lapse(atmosphere) is cached
+
+    # The modified copy has the same temperature version as the cached
+    # atmosphere, but is a different object.
+    other = atmosphere.copy()
+    other['T'] -= 20
+    assert other.get_version('T') == atmosphere.get_version('T')
+    assert not np.allclose(lapse(other), cached)
+
+    with atmosphere.modify('T') as T:
+        T -= 20
+    assert np.allclose(lapse(atmosphere), lapse(other))
+
+    # The cache does not prevent pickling.
+    assert pickle.loads(pickle.dumps(lapse))(atmosphere) is not None
@@ -0,0 +1,106 @@
+import numpy as np
+import pytest
+import xarray as xr
+
+from konrad.component import Component
+from konrad.netcdf import (OutputSpecification, create_output_handler,
+                           open_output, read_timestep)
+
+
+class TestOutputSpecification:
+    spec = OutputSpecification(
+        include=['atmosphere', 'radiation/toa'],
+        exclude=['atmosphere/CFC*'],
+        frequency={'atmosphere/*': 10},
+        level_stride=2,
+        float32=True,
+    )
+
+    def test_components(self):
+        assert self.spec.is_component_included('atmosphere')
+        assert self.spec.is_component_included('radiation')
+        assert not self.spec.is_component_included('ozone')
+
+    def test_variables(self):
+        assert self.spec.is_included('atmosphere', 'T')
+        assert not self.spec.is_included('atmosphere', 'CFC11')
+        assert self.spec.is_included('radiation', 'toa')
+        assert not self.spec.is_included('radiation', 'lw_flxu')
+
+    def test_frequency(self):
+        assert self.spec.is_due('atmosphere', 'T', 20)
+        assert not self.spec.is_due('atmosphere', 'T', 21)
+        assert self.spec.is_due('radiation', 'toa', 21)
+
+    def test_convert(self):
+        data = self.spec.convert(np.zeros((1, 10)), dims=('time', 'plev'))
+
+        assert data.shape == (1, 5)
+        assert data.dtype == np.float32
+
+
+class _DummyRCE:
+    """Minimal stand-in for an RCE simulation with a single component."""
+    experiment = 'test'
+
+    def __init__(self):
+        self.niter = 0
+        self.atmosphere = Component()
+        self.atmosphere['T'] = (('time', 'plev'), np.zeros((1, 4)))
+        self.atmosphere.coords = {
+            'time': np.array([]),
+            'plev': np.array([1000e2, 500e2, 100e2, 10e2]),
+        }
+
+    def get_hours_passed(self):
+        return 24. * self.niter
+
+
+@pytest.mark.parametrize('suffix', ['.nc', '.zarr'])
+def test_output_handler(tmp_path, suffix):
+    """Test that all output backends append along the time dimension."""
+    if suffix == '.zarr':
+        pytest.importorskip('zarr')
+    filename = str(tmp_path / f'output{suffix}')
+
+    rce = _DummyRCE()
+    handler = create_output_handler(filename, rce)
+    for rce.niter in range(3):
+        rce.atmosphere.set('T', rce.niter)
+        handler.write()
+
+    T = open_output(filename)['atmosphere/T']
+
+    assert T.dims == ('time', 'plev')
+    assert np.all(T[:, 0] == [0, 1, 2])
+
+    data = read_timestep(filename, 'atmosphere', ['T', 'foo'], timestep=1)
+
+    assert list(data) == ['T']
+    assert np.all(data['T'] == 1)
+
+
+def test_open_output_datatree(tmp_path, monkeypatch):
+    """Test opening the output as DataTree and the xarray version check."""
+    filename = str(tmp_path / 'output.nc')
+    create_output_handler(filename, _DummyRCE()).write()
+
+    if hasattr(xr, 'open_datatree'):
+        tree = open_output(filename, datatree=True)
+        assert 'T' in tree['atmosphere'].data_vars
+
+    monkeypatch.delattr(xr, 'open_datatree', raising=False)
+    with pytest.raises(ImportError, match='xarray>=2024.10'):
+        open_output(filename, datatree=True)
+
+
+def test_open_output_dask(tmp_path):
+    """Test that the output is opened as dask arrays by default."""
+    pytest.importorskip('dask')
+    filename = str(tmp_path / 'output.nc')
+    create_output_handler(filename, _DummyRCE()).write()
+
+    ds = open_output(filename)
+
+    assert ds['atmosphere/T'].chunks is not None
+    assert open_output(filename, chunks={'time': 1})['atmosphere/T'].chunks
@@ -0,0 +1,35 @@
+import numpy as np
+import pytest
+
+from konrad.physics import saturation_pressure, SaturationPressureTable
+
+
+class TestSaturationPressure:
+    def test_float_input(self):
+        """Test that float input returns a float."""
+        assert isinstance(saturation_pressure(300.), float)
+
+    def test_shape(self):
+        """Test that the shape of the input array is preserved."""
+        T = np.full((2, 3), 280.)
+
+        assert saturation_pressure(T).shape == (2, 3)
+
+    def test_negative_temperature(self):
+        """Test that non-positive temperatures raise a ValueError."""
+        with pytest.raises(ValueError):
+            saturation_pressure(np.array([250., 0.]))
+
+    @pytest.mark.parametrize('kind', ['linear', 'cubic'])
+    def test_table(self, kind):
+        """Test the accuracy of the lookup table."""
+        T = np.linspace(150, 330, 1001)
+        e_eq = SaturationPressureTable(kind=kind)
+
+        assert np.allclose(e_eq(T), saturation_pressure(T), rtol=1e-6)
+
+    def test_table_out_of_range(self):
+        """Test that values outside the table are computed exactly."""
+        e_eq = SaturationPressureTable(tmin=200, tmax=300)
+
+        assert e_eq(350.) == saturation_pressure(350.)
@@ -0,0 +1,206 @@
+import numpy as np
+import pytest
+
+import konrad
+from konrad.radiation import rrtmg
+
+
+class _Output:
+    def __init__(self, data):
+        self.data = data
+
+
+class _FakeRRTMG(rrtmg.RRTMG):
+    """RRTMG with analytic fluxes instead of calls to CliMT."""
+    def __init__(self, *args, cloud_effect=0., **kwargs):
+        super().__init__(*args, **kwargs)
+        self.sw_calls = 0
+        self._cloud_effect = cloud_effect
+
+    def radiative_fluxes(self, atmosphere, surface, cloud, longwave=True,
+                         shortwave=True):
+        nlev = atmosphere['plev'].size
+
+        def output(names, value):
+            # Overcast (all-sky) results differ by a constant cloud effect.
+            return None, {
+                name: _Output(np.full(
+                    nlev if 'tendency' in name else nlev + 1,
+                    value if 'clear_sky' in name
+                    else value + self._cloud_effect))
+                for name in names.values()
+            }
+
+        lw_fluxes = sw_fluxes = None
+        if longwave:
+            lw_fluxes = output(rrtmg._longwave_names, 240.)
+        if shortwave:
+            self.sw_calls += 1
+            mu = np.cos(np.deg2rad(self.current_solar_angle))
+            sw_fluxes = output(rrtmg._shortwave_names, 1000. * mu**1.2)
+
+        return lw_fluxes, sw_fluxes
+
+
+@pytest.fixture
+def model():
+    atmosphere = konrad.atmosphere.Atmosphere(
+        konrad.utils.get_quadratic_pgrid(num=20))
+    surface = konrad.surface.FixedTemperature()
+    cloud = konrad.cloud.ClearSky(atmosphere['plev'].size)
+
+    return atmosphere, surface, cloud
+
+
+def test_diurnal_quadrature(model):
+    radiation = _FakeRRTMG(zenith_angle=0, diurnal_quadrature=8)
+    radiation.calc_radiation(*model)
+
+    # Diurnal mean of 1000 * cos(h)**1.2 over all hour angles.
+    assert np.isclose(radiation['sw_flxd'][0, -1], 300.354, atol=0.01)
+    assert radiation.sw_calls == 8
+
+
+def test_sw_timestep(model):
+    radiation = _FakeRRTMG(zenith_angle=0, sw_timestep='1h')
+
+    mean = 0
+    for time in np.arange(96) / 96:
+        radiation.adjust_solar_angle(time)
+        radiation.calc_radiation(*model)
+        mean += radiation['sw_flxd'][0, -1] / 96
+
+    # No shortwave calls at night, one per hour during the day (and an
+    # additional one with the sun close to the horizon).
+    assert radiation.sw_calls == 14
+    assert np.isclose(mean, 300.354, rtol=0.01)
+
+    # Cached fluxes are discarded if the time is reset (e.g. a new run).
+    radiation.adjust_solar_angle(0.)
+    radiation.calc_radiation(*model)
+    assert radiation.sw_calls == 15
+
+
+def test_sw_timestep_near_sunrise(model):
+    radiation = _FakeRRTMG(zenith_angle=0, sw_timestep='1h')
+
+    # Fluxes with the sun close to the horizon are not rescaled.
+    for time in np.array([-5.9, -5.8, -5.5, -5.]) / 24:
+        radiation.adjust_solar_angle(time)
+        radiation.calc_radiation(*model)
+        mu = np.cos(np.deg2rad(radiation.current_solar_angle))
+        assert np.isclose(radiation['sw_flxd'][0, -1], 1000 * mu**1.2,
+                          rtol=0.2)
+
+    assert radiation.sw_calls == 3
+
+
+def test_results_not_aliased(model):
+    radiation = _FakeRRTMG(zenith_angle=0)
+    radiation.adjust_solar_angle(0.)
+    radiation.calc_radiation(*model)
+
+    # References to previous results are not overwritten by later calls.
+    sw_flxd = radiation['sw_flxd']
+    values = sw_flxd.copy()
+    radiation.adjust_solar_angle(0.1)
+    radiation.calc_radiation(*model)
+
+    assert not np.array_equal(radiation['sw_flxd'], values)
+    assert np.array_equal(sw_flxd, values)
+
+
+def test_nomcica_partial_cloud(model):
+    atmosphere, surface, _ = model
+    nlev = atmosphere['plev'].size
+    cloud_fraction = np.zeros(nlev)
+    cloud_fraction[5:8] = 0.3
+    cloud = konrad.cloud.PhysicalCloud(
+        nlev, cloud_fraction, np.zeros(nlev), np.zeros(nlev),
+        np.full(nlev, 20.), np.full(nlev, 10.))
+
+    radiation = _FakeRRTMG(cloud_effect=10.)
+    state = {}
+    radiation.update_cloudy_radiative_state(cloud, state)
+
+    # Cloudy layers are overcast in the RRTMG input, the cloud is unchanged.
+    overcast = state['cloud_area_fraction_in_atmosphere_layer'].values
+    assert np.array_equal(overcast, cloud_fraction != 0)
+    assert np.array_equal(
+        cloud['cloud_area_fraction_in_atmosphere_layer'], cloud_fraction)
+
+    # Overcast (all-sky) and clear-sky results are weighted by cloud fraction.
+    radiation.calc_radiation(atmosphere, surface, cloud)
+
+    assert np.allclose(radiation['lw_flxu'], 243.)
+    assert np.allclose(radiation['lw_flxu_clr'], 240.)
+
+
+class _FakeMcicaRRTMG(_FakeRRTMG):
+    """Fake RRTMG with random cloud effects like MCICA in CliMT."""
+    def radiative_fluxes(self, *args, **kwargs):
+        # CliMT draws the permutation seed from the global random generator.
+        self._cloud_effect = np.random.randint(0, 2**31 - 1) / 2**31
+        return super().radiative_fluxes(*args, **kwargs)
+
+
+def test_mcica_seed_and_samples(model):
+    atmosphere, surface, _ = model
+    nlev = atmosphere['plev'].size
+    cloud = konrad.cloud.PhysicalCloud(
+        nlev, np.full(nlev, 0.5), np.zeros(nlev), np.zeros(nlev),
+        np.full(nlev, 20.), np.full(nlev, 10.))
+
+    global_state = np.random.get_state()[1].copy()
+
+    results = []
+    for _ in range(2):
+        radiation = _FakeMcicaRRTMG(mcica=True, mcica_seed=42,
+                                    mcica_samples=4)
+        radiation.calc_radiation(atmosphere, surface, cloud)
+        results.append(radiation['lw_flxu'].copy())
+
+    assert np.array_equal(*results)
+    assert radiation.sw_calls == 4
+    assert 240 < results[0][0, 0] < 241
+
+    # The global random generator is not affected.
+    assert np.array_equal(np.random.get_state()[1], global_state)
+
+
+def test_grey_radiation_isothermal(model):
+    atmosphere, surface, cloud = model
+    with atmosphere.modify('T') as T:
+        T[:] = surface['temperature'][-1]
+
+    radiation = konrad.radiation.GreyRadiation()
+    radiation.update_heatingrates(atmosphere, surface, cloud)
+
+    # An isothermal atmosphere above a surface of the same temperature
+    # emits as a black body and cools to space on all levels.
+    sigma_T4 = konrad.constants.stefan_boltzmann * surface['temperature']**4
+    assert np.allclose(radiation['lw_flxu'], sigma_T4)
+    assert radiation['lw_flxd'][0, -1] == 0
+    assert np.all(radiation['lw_htngrt'] < 0)
+    assert np.isclose(radiation['sw_flxd'][0, -1], 342, atol=0.5)
+
+
+def test_backends(monkeypatch):
+    backends = konrad.radiation.backends
+
+    assert {'grey', 'rrtmg'} <= set(backends.list_backends())
+    assert backends.get_backend('rrtmg') is konrad.radiation.RRTMG
+
+    with pytest.raises(ValueError):
+        backends.get_backend('unknown')
+
+    monkeypatch.setenv('KONRAD_RADIATION', 'grey')
+    rce = konrad.RCE(
+        konrad.atmosphere.Atmosphere(konrad.utils.get_quadratic_pgrid(num=20)),
+        timestep='12h',
+        max_duration='2d',
+    )
+    rce.run()
+
+    assert isinstance(rce.radiation, konrad.radiation.GreyRadiation)
+    assert rce.niter == 4
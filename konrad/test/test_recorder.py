@@ -0,0 +1,32 @@
+from types import SimpleNamespace
+
+import numpy as np
+
+from konrad.component import Component
+from konrad.recorder import TimeSeriesRecorder
+
+
+def test_record():
+    """Test recording of scalars and profiles beyond the initial capacity."""
+    surface = Component()
+    surface['temperature'] = (('time',), np.array([300.]))
+    atmosphere = Component()
+    atmosphere['T'] = (('time', 'plev'), np.zeros((1, 3)))
+    atmosphere.coords = {'plev': np.array([1000e2, 500e2, 100e2])}
+
+    rce = SimpleNamespace(surface=surface, atmosphere=atmosphere)
+
+    recorder = TimeSeriesRecorder(
+        variables=['surface/temperature', 'atmosphere/T'], capacity=2)
+    for i in range(5):
+        rce.get_hours_passed = lambda: 24. * i
+        surface.set('temperature', 300. + i)
+        atmosphere.set('T', i)
+        recorder.record(rce)
+
+    ds = recorder.to_dataset()
+
+    assert len(recorder) == 5
+    assert np.all(ds['surface/temperature'] == 300. + np.arange(5))
+    assert ds['atmosphere/T'].dims == ('time', 'plev')
+    assert np.all(ds['time'] == 24. * np.arange(5))
@@ -36,3 +36,63 @@ class TestRelativeHumidity:
             convection={"convective_top_plev": [100e2]},
             surface={"temperature": [300.0]},
         )
+
+    def test_memoization(self, atmosphere_obj):
+        """Test that profiles are re-used until their inputs change."""
+        rh_model = humidity.CshapeConstant()
+        rh = rh_model(atmosphere_obj, {"convective_top_plev": [100e2]})
+
+        assert rh_model(atmosphere_obj, {"convective_top_plev": [100e2]}) is rh
+        assert (rh_model(atmosphere_obj, {"convective_top_plev": [200e2]})
+                is not rh)
+
+    def test_memoization_array_attributes(self, atmosphere_obj):
+        """Test that array-valued attributes are compared by value."""
+        rh_model = humidity.Cess76()
+        surface = {"temperature": np.array([300.0])}
+        rh = rh_model(atmosphere_obj, surface)
+
+        assert rh_model(atmosphere_obj, surface) is rh
+        surface["temperature"][:] = 290.0
+        assert rh_model(atmosphere_obj, surface) is not rh
+
+    def test_memoization_temperature(self, atmosphere_obj):
+        """Test that temperature-dependent profiles are updated."""
+        rh_model = humidity.Romps14()
+        rh = rh_model(atmosphere_obj)
+
+        atmosphere_obj["T"] = atmosphere_obj["T"] - 10
+
+        assert not np.allclose(rh_model(atmosphere_obj), rh)
+
+
+class TestFixedRH:
+    def test_state_independent_cache(self, atmosphere_obj):
+        """Test that state-independent RH profiles are only computed once."""
+        rh_model = humidity.HeightConstant()
+        fixed_rh = humidity.FixedRH(rh_func=rh_model)
+
+        fixed_rh.adjust_humidity(atmosphere_obj)
+        profile = fixed_rh.get_relative_humidity(atmosphere_obj)
+
+        assert fixed_rh.get_relative_humidity(atmosphere_obj) is profile
+
+        # Changes of the RH model attributes are detected.
+        rh_model.rh_surface = 0.5
+        assert np.all(fixed_rh.get_relative_humidity(atmosphere_obj) == 0.5)
+
+    def test_adjust_humidity(self, atmosphere_obj):
+        """Test the in-place computation of the water vapor profile."""
+        fixed_rh = humidity.FixedRH(
+            rh_func=humidity.Manabe67(),
+            stratosphere_coupling=humidity.FixedStratosphericVMR(5e-6),
+        )
+        fixed_rh.adjust_humidity(atmosphere_obj)
+
+        rh = humidity.Manabe67()(atmosphere_obj)
+        vmr = humidity.relative_humidity2vmr(
+            rh, atmosphere_obj['plev'], atmosphere_obj['T'][-1])
+        cp = atmosphere_obj.get_cold_point_index()
+
+        assert np.allclose(atmosphere_obj['H2O'][-1, :cp], vmr[:cp])
+        assert np.all(atmosphere_obj['H2O'][-1, cp:] == 5e-6)
@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+
+from konrad import (atmosphere, surface, utils)
+from konrad.state import ModelState
+
+
+@pytest.fixture
+def state_obj():
+    _, phlev = utils.get_pressure_grids(surface_pressure=1000e2, num=50)
+
+    return ModelState(
+        atmosphere=atmosphere.Atmosphere(phlev=phlev),
+        surface=surface.SlabOcean(temperature=300.),
+    )
+
+
+class TestModelState:
+    def test_views(self, state_obj):
+        """Test that components operate on the shared buffer."""
+        atmosphere_obj = state_obj._components['atmosphere']
+        surface_obj = state_obj._components['surface']
+
+        atmosphere_obj['T'] += 1
+        surface_obj['temperature'] += 1
+
+        assert np.allclose(state_obj['atmosphere/T'], atmosphere_obj['T'])
+        assert state_obj['surface/temperature'][0] == 301.
+
+    def test_restore(self, state_obj):
+        """Test restoring a copy of the model state."""
+        atmosphere_obj = state_obj._components['atmosphere']
+        snapshot = state_obj.copy()
+        version = atmosphere_obj.get_version('T')
+        z = atmosphere_obj['z'].copy()
+
+        atmosphere_obj['T'] += 10
+        atmosphere_obj.update_height()
+        state_obj.restore(snapshot)
+
+        assert np.allclose(state_obj.buffer, snapshot)
+        assert atmosphere_obj.get_version('T') > version + 1
+        assert np.allclose(atmosphere_obj['z'], z)
@@ -0,0 +1,35 @@
+import numpy as np
+
+from konrad import constants
+from konrad.surface import SlabOcean
+
+
+def _adjust(surface, timestep, n):
+    """Run a slab ocean with a simple grey atmosphere."""
+    for _ in range(n):
+        sigma_T4 = constants.stefan_boltzmann * surface['temperature'][-1]**4
+        surface.adjust(
+            sw_down=400,
+            sw_up=80,
+            lw_down=0.72 * sigma_T4,
+            lw_up=sigma_T4,
+            timestep=timestep,
+        )
+
+
+class TestSlabOcean:
+    def test_semi_implicit(self):
+        """Test the semi-implicit update for large timesteps."""
+        surface = SlabOcean(temperature=280., depth=1., semi_implicit=True)
+        _adjust(surface, timestep=40., n=30)
+
+        T_eq = (320 / (0.28 * constants.stefan_boltzmann))**0.25
+        assert np.isclose(surface['temperature'][-1], T_eq, atol=0.01)
+
+    def test_spinup(self):
+        """Test that the spin-up ends close to equilibrium."""
+        surface = SlabOcean(temperature=280., spinup_depth=1.)
+        _adjust(surface, timestep=1., n=100)
+
+        assert not surface._spinup
+        assert surface.effective_heat_capacity == surface.heat_capacity
@@ -0,0 +1,91 @@
+import numpy as np
+import pytest
+
+from konrad import sweep
+from konrad.component import Component
+from konrad.netcdf import OutputSpecification, create_output_handler
+
+
+class _DummyRCE:
+    """Minimal stand-in for an RCE simulation with a single component."""
+    def __init__(self, experiment):
+        self.experiment = experiment
+        self.niter = 0
+        self.atmosphere = Component()
+        self.atmosphere['T'] = (('time', 'plev'), np.zeros((1, 4)))
+        self.atmosphere.coords = {
+            'time': np.array([]),
+            'plev': np.array([1000e2, 500e2, 100e2, 10e2]),
+        }
+
+    def get_hours_passed(self):
+        return 24. * self.niter
+
+
+def _write_runs(directory, suffix):
+    for offset in range(2):
+        rce = _DummyRCE(f'run{offset}')
+        handler = create_output_handler(
+            str(directory / f'run{offset}{suffix}'), rce)
+        for rce.niter in range(3):
+            rce.atmosphere.set('T', rce.niter + offset)
+            handler.write()
+
+
+@pytest.mark.parametrize('suffix', ['.nc', '.zarr'])
+def test_aggregate(tmp_path, suffix):
+    """Test the aggregation of several outputs into one dataset."""
+    if suffix == '.zarr':
+        pytest.importorskip('zarr')
+    _write_runs(tmp_path, suffix)
+
+    ds = sweep.aggregate(
+        str(tmp_path), variables=['atmosphere/T'], average=2,
+        outfile=str(tmp_path / 'sweep.nc'),
+    )
+
+    assert ds['atmosphere/T'].dims == ('run', 'plev')
+    assert np.all(ds['atmosphere/T'][:, 0] == [1.5, 2.5])
+    assert list(ds['title'].values) == ['run0', 'run1']
+
+
+def test_aggregate_outfile(tmp_path):
+    """Test that a previous aggregation is not treated as a run."""
+    _write_runs(tmp_path, '.nc')
+    outfile = str(tmp_path / 'sweep.nc')
+
+    for _ in range(2):
+        ds = sweep.aggregate(
+            str(tmp_path), variables=['atmosphere/T'], outfile=outfile)
+
+    assert ds.sizes['run'] == 2
+    assert outfile not in list(ds['path'].values)
+
+
+def test_extract_frequency(tmp_path):
+    """Test that decimated variables are read at their last written step."""
+    filename = str(tmp_path / 'run.nc')
+    rce = _DummyRCE('run')
+    handler = create_output_handler(
+        filename, rce,
+        output_spec=OutputSpecification(frequency={'atmosphere/T': 2}))
+    for rce.niter in range(4):
+        rce.atmosphere.set('T', rce.niter)
+        handler.write()
+
+    T = sweep.extract(filename, ['atmosphere/T'])['atmosphere/T']
+
+    assert np.all(T == 2)
+
+
+def test_aggregate_parameters(tmp_path):
+    """Test that settings missing in the first run are kept."""
+    for offset in range(2):
+        rce = _DummyRCE(f'run{offset}')
+        if offset > 0:
+            rce.atmosphere.CO2_scale = 2
+        create_output_handler(str(tmp_path / f'run{offset}.nc'), rce).write()
+
+    ds = sweep.aggregate(str(tmp_path), variables=['atmosphere/T'])
+
+    assert list(ds['atmosphere/CO2_scale'].values) == ['None', '2']
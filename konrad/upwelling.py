@@ -129,7 +129,8 @@ class StratosphericUpwelling(Upwelling):
 
         Q = cooling_rates(T, z, self._w, Cp, above_level_index)
 
-        atmosphere['T'][0, :] += Q * timestep
+        with atmosphere.modify('T') as T:
+            T[0, :] += Q * timestep
 
         self['cooling_rates'] = (('time', 'plev'), -Q.reshape(1, -1))
 
@@ -150,7 +151,8 @@ class SpecifiedCooling(Upwelling):
             atmosphere (konrad.atmosphere.Atmosphere): Atmosphere model.
             timestep (float): Timestep width [day].
         """
-        atmosphere['T'][0, :] += self._Q * timestep
+        with atmosphere.modify('T') as T:
+            T[0, :] += self._Q * timestep
 
 
 class CoupledUpwelling(StratosphericUpwelling):
@@ -196,7 +198,8 @@ class CoupledUpwelling(StratosphericUpwelling):
         Cp = atmosphere.get_heat_capacity()
         Q = cooling_rates(T, z, self._w, Cp, above_level_index)
 
-        atmosphere['T'][0, :] += Q * timestep
+        with atmosphere.modify('T') as T:
+            T[0, :] += Q * timestep
 
         self['w'] = (('time', 'plev'), self._w.reshape(1, -1))
         self['cooling_rates'] = (('time', 'plev'), -Q.reshape(1, -1))
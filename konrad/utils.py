@@ -1,5 +1,6 @@
 """Common utility functions. """
 import copy
+import inspect
 import logging
 from datetime import timedelta
 from numbers import Number
@@ -28,6 +29,7 @@ __all__ = [
     'standard_atmosphere',
     'prefix_dict_keys',
     'is_decreasing',
+    'get_init_parameters',
 ]
 
 logger = logging.getLogger(__name__)
@@ -416,3 +418,43 @@ def prefix_dict_keys(dictionary, prefix, delimiter='/'):
 def is_decreasing(a):
     """Check if a given array is monotonically decreasing."""
     return np.all(np.diff(a) < 0)
+
+
+def get_init_parameters(cls):
+    """Return the names of all keyword arguments accepted by a class.
+
+    If ``__init__`` passes arbitrary keyword arguments (``**kwargs``) to its
+    parent class, the parameters of the parent classes are included.
+
+    Parameters:
+        cls (type): Class.
+
+    Returns:
+        set[str], bool: Parameter names and whether arbitrary positional
+        arguments (``*args``) are accepted by the class itself.
+    """
+    names = set()
+    var_positional = None
+    for base in cls.__mro__:
+        if base is object:
+            break
+
+        if '__init__' not in vars(base):
+            continue
+
+        parameters = inspect.signature(base.__init__).parameters.values()
+        kinds = {p.kind for p in parameters}
+        names.update(
+            p.name for p in parameters
+            if p.kind in (p.POSITIONAL_OR_KEYWORD, p.KEYWORD_ONLY)
+        )
+
+        if var_positional is None:
+            var_positional = inspect.Parameter.VAR_POSITIONAL in kinds
+
+        if inspect.Parameter.VAR_KEYWORD not in kinds:
+            break
+
+    names.discard('self')
+
+    return names, bool(var_positional)
@@ -25,11 +25,20 @@ setup(
         # See https://pypi.python.org/pypi?%3Aaction=list_classifiers
         'Intended Audience :: Science/Research',
         'License :: OSI Approved :: MIT License',
-        'Programming Language :: Python :: 3.6',
         'Programming Language :: Python :: 3.7',
+        'Programming Language :: Python :: 3.8',
     ],
-    python_requires='>=3.6',
+    python_requires='>=3.7',
     include_package_data=True,
+    entry_points={
+        'console_scripts': [
+            'konrad = konrad.cli:main',
+        ],
+        'konrad.radiation': [
+            'grey = konrad.radiation.grey:GreyRadiation',
+            'rrtmg = konrad.radiation.rrtmg:RRTMG',
+        ],
+    },
     install_requires=[
         'matplotlib>=2.0.0',
         'netcdf4>=1.2.7',
@@ -48,5 +57,11 @@ setup(
         'tests': [
             'pytest',
         ],
+        'yaml': [
+            'pyyaml',
+        ],
+        'zarr': [
+            'zarr',
+        ],
     },
 )